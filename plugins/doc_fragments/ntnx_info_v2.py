@@ -33,6 +33,14 @@ options:
     description:
       - The attribute name to select
     type: str
+  fetch_all:
+    description:
+      - Fetch all pages of results instead of only the page given by C(page).
+      - Remaining pages are fetched concurrently, C(limit) is used as page size.
+      - C(filter), C(orderby) and C(select) are applied to every page.
+      - Number of pages fetched concurrently can be set using C(NUTANIX_LIST_CONCURRENCY) environment variable.
+    type: bool
+    default: false
   read_timeout:
     description: Read timeout in milliseconds for API calls.
     type: int
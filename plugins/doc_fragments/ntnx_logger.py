@@ -33,4 +33,22 @@ options:
         type: str
         required: false
         default: /tmp/nutanix_ansible_debug.log
+  nutanix_api_stats:
+        description:
+            - Return metrics of API calls made by this module as C(api_stats) in module result.
+            - Metrics include call count, errors, latency percentiles and bytes sent and received per endpoint,
+              along with retries and time spent sleeping while polling tasks.
+            - Entity IDs in endpoints are replaced by C({id}), so calls to different entities are counted together.
+            - This parameter can also be set via the NUTANIX_API_STATS environment variable and is preferred over the NUTANIX_API_STATS environment variable.
+        type: bool
+        required: false
+        default: false
+  nutanix_api_stats_file:
+        description:
+            - File to which metrics of API calls made by this module are appended as a JSON line,
+              with module name, timestamp and status of module run.
+            - Metrics are collected if this is set, even if C(nutanix_api_stats) is false.
+            - This parameter can also be set via the NUTANIX_API_STATS_FILE environment variable and is preferred over the NUTANIX_API_STATS_FILE environment variable.
+        type: str
+        required: false
 """
@@ -109,6 +109,7 @@ DOCUMENTATION = r"""
                 - A list of Jinja2 expressions used to filter the inventory
                 - All expressions are combined using an AND operation—each item must match every filter to be included.
                 - Used locally to filter hosts after they are fetched from the API.
+                - Simple expressions can be sent to the API instead, see C(push_down_filters).
             default: []
             elements: str
             type: list
@@ -123,8 +124,81 @@ DOCUMENTATION = r"""
             default: []
             elements: str
             type: list
+        prism_centrals:
+            description:
+                - List of Prism Centrals to fetch hosts from, each with its own credentials.
+                - Hosts of all Prism Centrals are fetched concurrently and added to one inventory.
+                - Failure of a Prism Central is reported as warning without aborting others,
+                  inventory fails only if all Prism Centrals fail.
+                - Each host gets C(prism_central) variable and is added to group
+                  C(prism_central_<name>), which has C(prism_central_fetch_time) in seconds and
+                  C(prism_central_error), if any, as group variables.
+                - If not provided, single Prism Central given using C(nutanix_host) is used.
+            type: list
+            elements: dict
+            suboptions:
+                name:
+                    description:
+                        - Name of Prism Central used for C(prism_central) variable and group.
+                        - By default, this is set to C(nutanix_host).
+                    type: str
+                nutanix_host:
+                    description:
+                        - Prism central hostname or IP address
+                    required: true
+                    type: str
+                nutanix_port:
+                    description:
+                        - Prism central port
+                        - If not provided, value of C(nutanix_port) is used.
+                    type: str
+                nutanix_username:
+                    description:
+                        - Prism central username
+                        - If not provided, value of C(nutanix_username) is used.
+                    type: str
+                nutanix_password:
+                    description:
+                        - Prism central password
+                        - If not provided, value of C(nutanix_password) is used.
+                    type: str
+                nutanix_api_key:
+                    description:
+                        - Prism central API key
+                        - If not provided, value of C(nutanix_api_key) is used.
+                    type: str
+                validate_certs:
+                    description:
+                        - Set value to C(False) to skip validation for self signed certificates
+                        - If not provided, value of C(validate_certs) is used.
+                    type: bool
+        push_down_filters:
+            description:
+                - If set to C(True), expressions in C(filters) of below forms are converted to OData
+                  and sent to List Hosts API call along with C(filter), instead of being evaluated locally.
+                - C(var == 'value'), C(var in ['value1', 'value2']), C(var.startswith('prefix'))
+                  and C(and) of these.
+                - Supported variables are C(host_name) and C(cluster_ext_id).
+                - Other expressions are evaluated locally after hosts are fetched.
+                - If C(fetch_all_hosts) is C(False), C(page) and C(limit) apply to hosts matching pushed down expressions,
+                  so enabling this can change which hosts are returned.
+                - Matching is done by the API, which can differ from Jinja2 evaluation, for example
+                  in case sensitivity and handling of special characters.
+            default: false
+            type: bool
+        duplicate_hostnames:
+            description:
+                - Policy for hosts resolving to an inventory hostname which is already added,
+                  for example same name used across Prism Centrals.
+                - C(merge) adds them as one host, variables of later host override earlier ones.
+                - C(first) keeps only the first host, as per order of C(prism_centrals).
+                - C(suffix) renames later hosts to C(<hostname>_<prism_central>).
+            choices: ['merge', 'first', 'suffix']
+            default: merge
+            type: str
     extends_documentation_fragment:
         - constructed
+        - inventory_cache
         - nutanix.ncp.ntnx_logger
 """
 
@@ -182,6 +256,31 @@ EXAMPLES = r"""
     high_memory: (memory_size_bytes / 1073741824) > 100 # > 100GB
     low_memory: (memory_size_bytes / 1073741824) <= 100 # <= 100GB
 
+# Cache hosts for a day using jsonfile cache plugin
+- plugin: nutanix.ncp.ntnx_prism_host_inventory_v2
+  nutanix_host: 10.x.x.x
+  nutanix_username: admin
+  nutanix_password: password
+  validate_certs: false
+  fetch_all_hosts: true
+  cache: true
+  cache_plugin: jsonfile
+  cache_connection: /tmp/nutanix_inventory
+  cache_timeout: 86400
+
+# Fetch hosts from multiple Prism Centrals concurrently
+- plugin: nutanix.ncp.ntnx_prism_host_inventory_v2
+  nutanix_username: admin
+  nutanix_password: password
+  validate_certs: false
+  duplicate_hostnames: suffix
+  prism_centrals:
+    - name: pc_east
+      nutanix_host: 10.x.x.x
+    - name: pc_west
+      nutanix_host: 10.y.y.y
+      nutanix_api_key: api_key
+
 # Minimal inventory file (nutanix.yml) using API key
 - plugin: nutanix.ncp.ntnx_prism_host_inventory_v2
   nutanix_host: 10.x.x.x
@@ -194,13 +293,34 @@ import os  # noqa: E402
 import tempfile  # noqa: E402
 
 from ansible.errors import AnsibleError  # noqa: E402
-from ansible.plugins.inventory import BaseInventoryPlugin, Constructable  # noqa: E402
+from ansible.plugins.inventory import (  # noqa: E402
+    BaseInventoryPlugin,
+    Cacheable,
+    Constructable,
+)
 
 from ..module_utils.v4.clusters_mgmt.api_client import (  # noqa: E402
     get_clusters_api_instance,
 )
 from ..module_utils.v4.utils import strip_internal_attributes  # noqa: E402
-from ..plugin_utils.inventory_utils import get_hostname  # noqa: E402
+from ..plugin_utils.inventory_utils import (  # noqa: E402
+    add_prism_central_group,
+    combine_odata_filters,
+    fetch_from_prism_centrals,
+    get_cacheable_data,
+    get_hostname,
+    get_inventory_cache_key,
+    get_prism_central_endpoints,
+    load_inventory_cache,
+    push_down_filters,
+    resolve_duplicate_hostname,
+)
+
+# filter variables which can be pushed down to list hosts as OData
+PUSH_DOWN_FILTER_FIELDS = {
+    "host_name": ("hostName", None),
+    "cluster_ext_id": ("cluster/uuid", None),
+}
 
 
 class Mock_Module:
@@ -242,7 +362,7 @@ class Mock_Module:
         raise AnsibleError(self.jsonify(kwargs))
 
 
-class InventoryModule(BaseInventoryPlugin, Constructable):
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
     """Nutanix Host dynamic inventory module using V4 APIs"""
 
     NAME = "nutanix.ncp.ntnx_prism_host_inventory_v2"
@@ -446,18 +566,6 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
             "NUTANIX_API_KEY"
         )
 
-        # Validate required parameters
-        if not self.nutanix_host:
-            raise AnsibleError(
-                "nutanix_host must be provided either in inventory file or as NUTANIX_HOSTNAME environment variable or NUTANIX_HOST environment variable"
-            )
-        if (
-            not self.nutanix_username or not self.nutanix_password
-        ) and not self.nutanix_api_key:
-            raise AnsibleError(
-                "Either nutanix_username and nutanix_password or nutanix_api_key is required"
-            )
-
         self.validate_certs = (
             self.get_option("validate_certs")
             or os.environ.get(
@@ -477,34 +585,77 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
         self.nutanix_log_file = self.get_option("nutanix_log_file") or os.environ.get(
             "NUTANIX_LOG_FILE"
         )
-        # Determines if composed variables or groups using nonexistent variables is an error
-        strict = self.get_option("strict")
-        host_filters = self.get_option("filters")
-        hostnames = self.get_option("hostnames")
+        self.duplicate_hostnames = self.get_option("duplicate_hostnames")
+        self.host_filters = self.get_option("filters")
+        if self.get_option("push_down_filters"):
+            odata_filter, self.host_filters = push_down_filters(
+                self.host_filters, PUSH_DOWN_FILTER_FIELDS
+            )
+            self.filter = combine_odata_filters(self.filter, odata_filter)
+        endpoints = get_prism_central_endpoints(self)
+
+        # Use cached hosts if caching is enabled, else fetch them from PC
+        use_cache = self.get_option("cache")
+        cache_keys = {}
+        cached_hosts = {}
+        for endpoint in endpoints:
+            cache_key = self._get_endpoint_cache_key(path, endpoint)
+            cache_keys[endpoint["name"]] = cache_key
+            if use_cache and cache:
+                cached_hosts[endpoint["name"]] = load_inventory_cache(
+                    self._cache, cache_key
+                )
+
+        def fetch(endpoint):
+            hosts = cached_hosts.get(endpoint["name"])
+            if hosts is not None:
+                return hosts
+            # Get Host API instance
+            host_client = get_clusters_api_instance(self._get_module(endpoint))
+            # Fetch Hosts
+            hosts = self._fetch_hosts(
+                host_client,
+                fetch_all_hosts=self.fetch_all_hosts,
+                page=self.page,
+                limit=self.limit,
+                filter=self.filter,
+            )
+            return get_cacheable_data(hosts) if use_cache else hosts
+
+        # Fetch hosts from all PCs concurrently
+        results = fetch_from_prism_centrals(endpoints, fetch, self.display)
 
-        # Create mock module for SDK
-        module = Mock_Module(
-            self.nutanix_host,
-            self.nutanix_port,
-            self.nutanix_username,
-            self.nutanix_password,
-            self.validate_certs,
+        seen_hostnames = set()
+        for endpoint, hosts, error, elapsed in results:
+            pc_group_name = add_prism_central_group(
+                self.inventory, endpoint, elapsed, error
+            )
+            if error:
+                continue
+            if use_cache and hosts is not cached_hosts.get(endpoint["name"]):
+                self._cache[cache_keys[endpoint["name"]]] = hosts
+            self._add_hosts(hosts, endpoint, pc_group_name, seen_hostnames)
+
+    def _get_module(self, endpoint):
+        """Create mock module for SDK for given PC endpoint."""
+        return Mock_Module(
+            endpoint["nutanix_host"],
+            endpoint["nutanix_port"],
+            endpoint["nutanix_username"],
+            endpoint["nutanix_password"],
+            endpoint["validate_certs"],
             self.fetch_all_hosts,
             self.nutanix_debug,
             self.nutanix_log_file,
-            self.nutanix_api_key,
+            endpoint["nutanix_api_key"],
         )
 
-        # Get Host API instance
-        host_client = get_clusters_api_instance(module)
-        # Fetch Hosts
-        hosts = self._fetch_hosts(
-            host_client,
-            fetch_all_hosts=self.fetch_all_hosts,
-            page=self.page,
-            limit=self.limit,
-            filter=self.filter,
-        )
+    def _add_hosts(self, hosts, endpoint, pc_group_name, seen_hostnames):
+        """Add hosts fetched from given PC endpoint to inventory."""
+        # Determines if composed variables or groups using nonexistent variables is an error
+        strict = self.get_option("strict")
+        host_filters = self.host_filters
+        hostnames = self.get_option("hostnames")
 
         # Process each host
         for host in hosts:
@@ -533,10 +684,21 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
             host_vars["host_ext_id"] = host_ext_id
             host_vars["cluster_name"] = cluster_name
             host_vars["cluster_ext_id"] = cluster_ext_id
+            host_vars["prism_central"] = endpoint["name"]
 
             hostname = get_hostname(
                 self._compose, host_vars, hostnames, host_name, strict=strict
             )
+            if hostname:
+                hostname = resolve_duplicate_hostname(
+                    hostname,
+                    seen_hostnames,
+                    self.duplicate_hostnames,
+                    endpoint["name"],
+                    host_ext_id,
+                )
+                if not hostname:
+                    continue
 
             # Create group based on cluster
             if cluster_ext_id:
@@ -548,6 +710,7 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
 
             if hostname:
                 self.inventory.add_host(hostname, group=group_name)
+                self.inventory.add_host(hostname, group=pc_group_name)
                 for key, value in host_vars.items():
                     self.inventory.set_variable(hostname, key, value)
 
@@ -569,3 +732,16 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
                 hostname,
                 strict=strict,
             )
+
+    def _get_endpoint_cache_key(self, path, endpoint):
+        """Build cache key from inventory path, PC endpoint and host filter options."""
+        options = {
+            "nutanix_host": endpoint["nutanix_host"],
+            "nutanix_port": endpoint["nutanix_port"],
+            "nutanix_username": endpoint["nutanix_username"],
+            "fetch_all_hosts": self.fetch_all_hosts,
+            "page": self.page,
+            "limit": self.limit,
+            "filter": self.filter,
+        }
+        return get_inventory_cache_key(self.get_cache_key(path), options)
@@ -427,8 +427,9 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
         )
         vm = vms.VM(module)
         self.data["offset"] = self.data.get("offset", 0)
-        resp = vm.list(data=self.data, fetch_all_vms=self.fetch_all_vms)
-        for entity in resp.get("entities", []):
+        # vms are added as pages arrive, so that all pages are never held in memory
+        entities = vm.iter_list(data=self.data, fetch_all_vms=self.fetch_all_vms)
+        for entity in entities:
             host_vars = self._build_host_vars(entity, strict=strict)
 
             if not self._should_add_host(host_vars, entity, host_filters, strict):
@@ -132,6 +132,7 @@ DOCUMENTATION = r"""
                 - A list of Jinja2 expressions used to filter the inventory
                 - All expressions are combined using an AND operation—each item must match every filter to be included.
                 - Used locally to filter VMs after they are fetched from the API.
+                - Simple expressions can be sent to the API instead, see C(push_down_filters).
             default: []
             elements: str
             type: list
@@ -146,8 +147,105 @@ DOCUMENTATION = r"""
             default: []
             elements: str
             type: list
+        incremental_refresh:
+            description:
+                - Used only when inventory caching is enabled using C(cache).
+                - If set to C(True), cached VMs are revalidated on every run by listing only
+                  C(extId) and C(updateTime) of VMs, and only VMs whose C(update_time) has
+                  changed since they were cached are fetched again.
+                - VMs deleted since last run are dropped and newly created VMs are fetched.
+                - Full fetch is done if cache is empty or expired as per C(cache_timeout).
+                - If set to C(False), cached VMs are used as is till cache expires.
+            default: false
+            type: bool
+        prism_centrals:
+            description:
+                - List of Prism Centrals to fetch VMs from, each with its own credentials.
+                - Vms of all Prism Centrals are fetched concurrently and added to one inventory.
+                - Failure of a Prism Central is reported as warning without aborting others,
+                  inventory fails only if all Prism Centrals fail.
+                - Each host gets C(prism_central) variable and is added to group
+                  C(prism_central_<name>), which has C(prism_central_fetch_time) in seconds and
+                  C(prism_central_error), if any, as group variables.
+                - If not provided, single Prism Central given using C(nutanix_host) is used.
+            type: list
+            elements: dict
+            suboptions:
+                name:
+                    description:
+                        - Name of Prism Central used for C(prism_central) variable and group.
+                        - By default, this is set to C(nutanix_host).
+                    type: str
+                nutanix_host:
+                    description:
+                        - Prism central hostname or IP address
+                    required: true
+                    type: str
+                nutanix_port:
+                    description:
+                        - Prism central port
+                        - If not provided, value of C(nutanix_port) is used.
+                    type: str
+                nutanix_username:
+                    description:
+                        - Prism central username
+                        - If not provided, value of C(nutanix_username) is used.
+                    type: str
+                nutanix_password:
+                    description:
+                        - Prism central password
+                        - If not provided, value of C(nutanix_password) is used.
+                    type: str
+                nutanix_api_key:
+                    description:
+                        - Prism central API key
+                        - If not provided, value of C(nutanix_api_key) is used.
+                    type: str
+                validate_certs:
+                    description:
+                        - Set value to C(False) to skip validation for self signed certificates
+                        - If not provided, value of C(validate_certs) is used.
+                    type: bool
+        duplicate_hostnames:
+            description:
+                - Policy for VMs resolving to an inventory hostname which is already added,
+                  for example same name used across Prism Centrals.
+                - C(merge) adds them as one host, variables of later host override earlier ones.
+                - C(first) keeps only the first host, as per order of C(prism_centrals).
+                - C(suffix) renames later hosts to C(<hostname>_<prism_central>).
+            choices: ['merge', 'first', 'suffix']
+            default: merge
+            type: str
+        push_down_filters:
+            description:
+                - If set to C(True), expressions in C(filters) of below forms are converted to OData
+                  and sent to List VMs API call along with C(filter), instead of being evaluated locally.
+                - C(var == 'value'), C(var in ['value1', 'value2']), C(var.startswith('prefix'))
+                  and C(and) of these.
+                - Supported variables are C(power_state), C(vm_name), C(name) and C(cluster_ext_id).
+                - Other expressions are evaluated locally after vms are fetched.
+                - If C(fetch_all_vms) is C(False), C(page) and C(limit) apply to vms matching pushed down expressions,
+                  so enabling this can change which vms are returned.
+                - Matching is done by the API, which can differ from Jinja2 evaluation, for example
+                  in case sensitivity and handling of special characters.
+            default: false
+            type: bool
+        select_required_fields:
+            description:
+                - If set to C(True), only VM fields needed by C(compose), C(groups), C(keyed_groups),
+                  C(filters), C(hostnames) and for resolving C(ansible_host) are fetched, using C($select)
+                  in List VMs API call.
+                - VM NICs are fetched only if C(ansible_host) is resolved from VM IP, that is if
+                  C(custom_ansible_host) is not used.
+                - Other VM fields are not added as host variables. To keep any of them, refer
+                  them in C(compose), for example as C(memory_size_bytes) set to C(memory_size_bytes).
+                - This reduces size of the API response and time to parse it for large number of VMs.
+                - All fields are fetched if any of the expressions can not be parsed.
+            default: false
+            type: bool
     extends_documentation_fragment:
         - constructed
+        - inventory_cache
         - nutanix.ncp.ntnx_logger
 """
 
@@ -229,6 +327,47 @@ EXAMPLES = r"""
   custom_ansible_host:
     expr: "{vm_name}.nutanix1.{vm_ext_id}.nutanix2.{cluster_name}.nutanix3.{cluster_ext_id}.nutanix4.{vm_description}.com"
 
+# Cache VMs and refresh only VMs updated since last run
+- plugin: nutanix.ncp.ntnx_prism_vm_inventory_v2
+  nutanix_host: 10.x.x.x
+  nutanix_username: admin
+  nutanix_password: password
+  validate_certs: false
+  fetch_all_vms: true
+  cache: true
+  cache_plugin: jsonfile
+  cache_connection: /tmp/nutanix_inventory
+  cache_timeout: 86400
+  incremental_refresh: true
+
+# Fetch VMs from multiple Prism Centrals concurrently
+- plugin: nutanix.ncp.ntnx_prism_vm_inventory_v2
+  nutanix_username: admin
+  nutanix_password: password
+  validate_certs: false
+  duplicate_hostnames: suffix
+  prism_centrals:
+    - name: pc_east
+      nutanix_host: 10.x.x.x
+    - name: pc_west
+      nutanix_host: 10.y.y.y
+      nutanix_api_key: api_key
+
+# Fetch only VM fields required to build the inventory
+- plugin: nutanix.ncp.ntnx_prism_vm_inventory_v2
+  nutanix_host: 10.x.x.x
+  nutanix_username: admin
+  nutanix_password: password
+  validate_certs: false
+  fetch_all_vms: true
+  select_required_fields: true
+  compose:
+    memory_size_bytes: memory_size_bytes
+  keyed_groups:
+    - key: power_state
+      prefix: power
+      separator: "_"
+
 # Minimal inventory file (nutanix.yml) using API key
 - plugin: nutanix.ncp.ntnx_prism_vm_inventory_v2
   nutanix_host: 10.x.x.x
@@ -242,14 +381,61 @@ import re  # noqa: E402
 import tempfile  # noqa: E402
 
 from ansible.errors import AnsibleError  # noqa: E402
-from ansible.plugins.inventory import BaseInventoryPlugin, Constructable  # noqa: E402
+from ansible.plugins.inventory import (  # noqa: E402
+    BaseInventoryPlugin,
+    Cacheable,
+    Constructable,
+)
 
 from ..module_utils.v4.clusters_mgmt.api_client import (  # noqa: E402
     get_clusters_api_instance,
 )
 from ..module_utils.v4.utils import strip_internal_attributes  # noqa: E402
 from ..module_utils.v4.vmm.api_client import get_vm_api_instance  # noqa: E402
-from ..plugin_utils.inventory_utils import get_hostname  # noqa: E402
+from ..plugin_utils.inventory_utils import (  # noqa: E402
+    add_prism_central_group,
+    combine_odata_filters,
+    fetch_from_prism_centrals,
+    get_cacheable_data,
+    get_expression_variables,
+    get_hostname,
+    get_inventory_cache_key,
+    get_prism_central_endpoints,
+    load_inventory_cache,
+    push_down_filters,
+    resolve_duplicate_hostname,
+)
+
+try:
+    from ntnx_vmm_py_client import AhvConfigVm  # noqa: E402
+except ImportError:
+    AhvConfigVm = None
+
+# max VMs re-fetched using one list call during incremental refresh,
+# kept low to bound length of the $filter query
+REFRESH_BATCH_SIZE = 50
+
+# VM fields always fetched: identity, cluster group and incremental refresh
+REQUIRED_VM_FIELDS = ("ext_id", "name", "cluster", "update_time")
+
+# host vars built from VM fields with other names
+DERIVED_HOST_VARS = {
+    "vm_name": "name",
+    "vm_ext_id": "ext_id",
+    "vm_description": "description",
+    "cluster_name": "cluster",
+    "cluster_ext_id": "cluster",
+    "owner_ext_id": "ownership_info",
+    "project_ext_id": "project",
+}
+
+# filter variables which can be pushed down to list VMs as OData
+PUSH_DOWN_FILTER_FIELDS = {
+    "power_state": ("powerState", "Vmm.Ahv.Config.PowerState"),
+    "vm_name": ("name", None),
+    "name": ("name", None),
+    "cluster_ext_id": ("cluster/extId", None),
+}
 
 
 class Mock_Module:
@@ -293,7 +479,7 @@ class Mock_Module:
         raise AnsibleError(self.jsonify(kwargs))
 
 
-class InventoryModule(BaseInventoryPlugin, Constructable):
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
     """Nutanix VM dynamic inventory module for ansible using V4 APIs"""
 
     NAME = "nutanix.ncp.ntnx_prism_vm_inventory_v2"
@@ -311,10 +497,13 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
         )
         return path.endswith(inventory_file_fmts)
 
-    def _fetch_vms(self, vmm, fetch_all_vms=False, page=0, limit=50, filter=None):
+    def _fetch_vms(
+        self, vmm, fetch_all_vms=False, page=0, limit=50, filter=None, select=None
+    ):
         """
         Fetch VMs from Nutanix using V4 SDK.
         Handles pagination if fetch_all_vms is True.
+        Only given comma separated fields are fetched if select is provided.
         """
         vms = []
 
@@ -326,6 +515,8 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
                     kwargs = {"_page": current_page, "_limit": 100}
                     if filter:
                         kwargs["_filter"] = filter
+                    if select:
+                        kwargs["_select"] = select
 
                     resp = vmm.list_vms(**kwargs)
                 except Exception as e:
@@ -350,6 +541,8 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
                 kwargs = {"_page": page, "_limit": limit}
                 if filter:
                     kwargs["_filter"] = filter
+                if select:
+                    kwargs["_select"] = select
 
                 resp = vmm.list_vms(**kwargs)
             except Exception as e:
@@ -361,6 +554,154 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
 
         return vms
 
+    def _fetch_vms_by_ext_ids(self, vmm, ext_ids, select=None):
+        """
+        Fetch given VMs in batches using extId filter.
+        Returns map of VM ext_id to VM.
+        """
+        vms = {}
+        for i in range(0, len(ext_ids), REFRESH_BATCH_SIZE):
+            batch = ext_ids[i : i + REFRESH_BATCH_SIZE]
+            filter = " or ".join("extId eq '{0}'".format(ext_id) for ext_id in batch)
+            for vm in self._fetch_vms(
+                vmm, limit=len(batch), filter=filter, select=select
+            ):
+                vms[vm.get("ext_id")] = vm
+        return vms
+
+    def _get_update_time(self, vm):
+        """Return VM update_time in the format it is kept in cache."""
+        update_time = vm.get("update_time")
+        if hasattr(update_time, "isoformat"):
+            return update_time.isoformat()
+        return update_time
+
+    def _refresh_vms(self, vmm, cached_vms, fetch_all_vms, page, limit, filter):
+        """
+        Refresh cached VMs by fetching only VMs whose update_time has changed.
+        VMs are listed with only extId and updateTime to find changed, new and
+        deleted VMs. Order of VMs is kept as per current listing.
+        """
+        current_vms = self._fetch_vms(
+            vmm,
+            fetch_all_vms=fetch_all_vms,
+            page=page,
+            limit=limit,
+            filter=filter,
+            select="extId,updateTime",
+        )
+        cached_vms = dict((vm.get("ext_id"), vm) for vm in cached_vms if vm)
+
+        changed = []
+        for vm in current_vms:
+            cached_vm = cached_vms.get(vm.get("ext_id"))
+            if not cached_vm or self._get_update_time(
+                cached_vm
+            ) != self._get_update_time(vm):
+                changed.append(vm.get("ext_id"))
+        fetched_vms = self._fetch_vms_by_ext_ids(vmm, changed, select=self.select)
+
+        changed = set(changed)
+        vms = []
+        for vm in current_vms:
+            ext_id = vm.get("ext_id")
+            if ext_id in changed:
+                # VMs deleted between listing and refetch are skipped
+                vm = fetched_vms.get(ext_id)
+            else:
+                vm = cached_vms.get(ext_id)
+            if vm:
+                vms.append(vm)
+        return vms
+
+    def _get_select(self):
+        """
+        Return comma separated VM fields needed by compose, groups, keyed_groups,
+        filters, hostnames and ansible_host to be used as $select in list VMs.
+        Returns None, to fetch all fields, if fields can not be determined.
+        """
+        if not self.get_option("select_required_fields") or AhvConfigVm is None:
+            return None
+
+        expressions = list((self.get_option("compose") or {}).values())
+        expressions.extend((self.get_option("groups") or {}).values())
+        for keyed_group in self.get_option("keyed_groups") or []:
+            if isinstance(keyed_group, dict):
+                expressions.append(keyed_group.get("key"))
+        expressions.extend(self.host_filters or [])
+        expressions.extend(self.get_option("hostnames") or [])
+        variables = get_expression_variables(expressions)
+        if variables is None or "vars" in variables:
+            return None
+
+        fields = set(REQUIRED_VM_FIELDS)
+        if self.custom_ansible_host and self.custom_ansible_host.get("expr"):
+            fields.add("description")
+        else:
+            # only needed for extracting VM IP as ansible_host
+            fields.add("nics")
+        for variable in variables:
+            fields.add(DERIVED_HOST_VARS.get(variable, variable))
+
+        # composed variables and unknown names are not VM fields
+        attribute_map = AhvConfigVm.attribute_map
+        return ",".join(
+            sorted(
+                attribute_map[field]
+                for field in fields
+                if field in attribute_map and not field.startswith("_")
+            )
+        )
+
+    def _fetch_cluster_names(self, module):
+        """Return map of cluster ext_id to cluster name."""
+        clusters = get_clusters_api_instance(module)
+        list_clusters = clusters.list_clusters()
+        cluster_ext_id_name_map = {}
+        for cluster in list_clusters.data or []:
+            if cluster:
+                cluster_dict = cluster.to_dict()
+                ext_id = cluster_dict.get("ext_id")
+                name = cluster_dict.get("name")
+                cluster_ext_id_name_map[ext_id] = name
+        return cluster_ext_id_name_map
+
+    def _get_inventory_data(self, module, cached_data=None):
+        """
+        Fetch VMs and cluster names from PC.
+        If cached_data is given, only VMs updated since it was cached are fetched.
+        """
+        vmm = get_vm_api_instance(module)
+        if not cached_data:
+            return {
+                "clusters": self._fetch_cluster_names(module),
+                "vms": self._fetch_vms(
+                    vmm,
+                    fetch_all_vms=self.fetch_all_vms,
+                    page=self.page,
+                    limit=self.limit,
+                    filter=self.filter,
+                    select=self.select,
+                ),
+            }
+
+        vms = self._refresh_vms(
+            vmm,
+            cached_data.get("vms") or [],
+            fetch_all_vms=self.fetch_all_vms,
+            page=self.page,
+            limit=self.limit,
+            filter=self.filter,
+        )
+        # cluster names are fetched again only if VMs moved to unknown cluster
+        cluster_ext_id_name_map = cached_data.get("clusters") or {}
+        for vm in vms:
+            cluster_ext_id = (vm.get("cluster") or {}).get("ext_id")
+            if cluster_ext_id and cluster_ext_id not in cluster_ext_id_name_map:
+                cluster_ext_id_name_map = self._fetch_cluster_names(module)
+                break
+        return {"clusters": cluster_ext_id_name_map, "vms": vms}
+
     def _extract_vm_ip(self, vm):
         """
         Extract IP address from VM NICs.
@@ -559,18 +900,6 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
             "NUTANIX_API_KEY"
         )
 
-        # Validate required parameters
-        if not self.nutanix_host:
-            raise AnsibleError(
-                "nutanix_host must be provided either in inventory file or as NUTANIX_HOSTNAME environment variable or NUTANIX_HOST environment variable"
-            )
-        if (
-            not self.nutanix_username or not self.nutanix_password
-        ) and not self.nutanix_api_key:
-            raise AnsibleError(
-                "Either nutanix_username and nutanix_password or nutanix_api_key is required"
-            )
-
         self.validate_certs = (
             self.get_option("validate_certs")
             or os.environ.get(
@@ -591,46 +920,77 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
         self.nutanix_log_file = self.get_option("nutanix_log_file") or os.environ.get(
             "NUTANIX_LOG_FILE"
         )
+        self.duplicate_hostnames = self.get_option("duplicate_hostnames")
+        self.host_filters = self.get_option("filters")
+        if self.get_option("push_down_filters"):
+            odata_filter, self.host_filters = push_down_filters(
+                self.host_filters, PUSH_DOWN_FILTER_FIELDS
+            )
+            self.filter = combine_odata_filters(self.filter, odata_filter)
+        self.select = self._get_select()
+        endpoints = get_prism_central_endpoints(self)
+
+        # Use cached VMs if caching is enabled, else fetch them from PC
+        use_cache = self.get_option("cache")
+        incremental_refresh = use_cache and self.get_option("incremental_refresh")
+        cache_keys = {}
+        cached_data = {}
+        for endpoint in endpoints:
+            cache_key = self._get_endpoint_cache_key(path, endpoint)
+            cache_keys[endpoint["name"]] = cache_key
+            if use_cache and (cache or incremental_refresh):
+                cached_data[endpoint["name"]] = load_inventory_cache(
+                    self._cache, cache_key
+                )
 
-        # Determines if composed variables or groups using nonexistent variables is an error
-        strict = self.get_option("strict")
-        host_filters = self.get_option("filters")
-        hostnames = self.get_option("hostnames")
+        def fetch(endpoint):
+            data = cached_data.get(endpoint["name"])
+            if data and cache and not incremental_refresh:
+                return data
+            module = self._get_module(endpoint)
+            data = self._get_inventory_data(
+                module, data if incremental_refresh else None
+            )
+            return get_cacheable_data(data) if use_cache else data
 
-        # Create mock module for SDK
-        module = Mock_Module(
-            self.nutanix_host,
-            self.nutanix_port,
-            self.nutanix_username,
-            self.nutanix_password,
-            self.validate_certs,
+        # Fetch VMs from all PCs concurrently
+        results = fetch_from_prism_centrals(endpoints, fetch, self.display)
+
+        seen_hostnames = set()
+        for endpoint, data, error, elapsed in results:
+            pc_group_name = add_prism_central_group(
+                self.inventory, endpoint, elapsed, error
+            )
+            if error:
+                continue
+            if use_cache and data is not cached_data.get(endpoint["name"]):
+                self._cache[cache_keys[endpoint["name"]]] = data
+            self._add_vms(data, endpoint, pc_group_name, seen_hostnames)
+
+    def _get_module(self, endpoint):
+        """Create mock module for SDK for given PC endpoint."""
+        return Mock_Module(
+            endpoint["nutanix_host"],
+            endpoint["nutanix_port"],
+            endpoint["nutanix_username"],
+            endpoint["nutanix_password"],
+            endpoint["validate_certs"],
             self.fetch_all_vms,
             self.custom_ansible_host,
             self.nutanix_debug,
             self.nutanix_log_file,
-            self.nutanix_api_key,
+            endpoint["nutanix_api_key"],
         )
 
-        # Get VM API instance
-        vmm = get_vm_api_instance(module)
-        clusters = get_clusters_api_instance(module)
-        list_clusters = clusters.list_clusters()
-        cluster_ext_id_name_map = {}
-        for cluster in list_clusters.data or []:
-            if cluster:
-                cluster_dict = cluster.to_dict()
-                ext_id = cluster_dict.get("ext_id")
-                name = cluster_dict.get("name")
-                cluster_ext_id_name_map[ext_id] = name
+    def _add_vms(self, data, endpoint, pc_group_name, seen_hostnames):
+        """Add VMs fetched from given PC endpoint to inventory."""
+        # Determines if composed variables or groups using nonexistent variables is an error
+        strict = self.get_option("strict")
+        host_filters = self.host_filters
+        hostnames = self.get_option("hostnames")
 
-        # Fetch VMs
-        vms = self._fetch_vms(
-            vmm,
-            fetch_all_vms=self.fetch_all_vms,
-            page=self.page,
-            limit=self.limit,
-            filter=self.filter,
-        )
+        cluster_ext_id_name_map = data.get("clusters") or {}
+        vms = data.get("vms") or []
 
         # Process each VM
         for vm in vms:
@@ -665,6 +1025,7 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
             host_vars["vm_ext_id"] = vm_ext_id
             host_vars["cluster_name"] = cluster_name
             host_vars["cluster_ext_id"] = cluster_ext_id
+            host_vars["prism_central"] = endpoint["name"]
             if owner_ext_id is not None:
                 host_vars["owner_ext_id"] = owner_ext_id
             if project_ext_id is not None:
@@ -675,6 +1036,16 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
             hostname = get_hostname(
                 self._compose, host_vars, hostnames, vm_name, strict=strict
             )
+            if hostname:
+                hostname = resolve_duplicate_hostname(
+                    hostname,
+                    seen_hostnames,
+                    self.duplicate_hostnames,
+                    endpoint["name"],
+                    vm_ext_id,
+                )
+                if not hostname:
+                    continue
 
             # Create group based on cluster
             if cluster_ext_id:
@@ -686,6 +1057,7 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
 
             if hostname:
                 self.inventory.add_host(hostname, group=group_name)
+                self.inventory.add_host(hostname, group=pc_group_name)
                 for key, value in host_vars.items():
                     self.inventory.set_variable(hostname, key, value)
 
@@ -708,6 +1080,20 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
                 strict=strict,
             )
 
+    def _get_endpoint_cache_key(self, path, endpoint):
+        """Build cache key from inventory path, PC endpoint and VM filter options."""
+        options = {
+            "nutanix_host": endpoint["nutanix_host"],
+            "nutanix_port": endpoint["nutanix_port"],
+            "nutanix_username": endpoint["nutanix_username"],
+            "fetch_all_vms": self.fetch_all_vms,
+            "page": self.page,
+            "limit": self.limit,
+            "filter": self.filter,
+            "select": self.select,
+        }
+        return get_inventory_cache_key(self.get_cache_key(path), options)
+
     def get_replacement_function(self, lookup):
 
         def repl(match):
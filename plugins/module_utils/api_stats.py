@@ -0,0 +1,250 @@
+# Copyright: (c) 2026, Nutanix
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import math
+import os
+import re
+import threading
+import time
+import warnings
+from datetime import datetime
+
+try:
+    from urllib.parse import urlparse
+except ImportError:
+    from urlparse import urlparse  # python2
+
+# path segments replaced by {id} in endpoints, so that calls for different
+# entities are counted together
+_ID_SEGMENT = re.compile(
+    r"^([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+    r"|\d+|.*[:=].*)$"
+)
+
+PERCENTILES = [50, 90, 99]
+
+
+def get_endpoint(url):
+    """
+    This routine returns path of given url with entity ids replaced by {id}.
+    """
+    path = urlparse(url).path or "/"
+    return "/".join(
+        "{id}" if segment and _ID_SEGMENT.match(segment) else segment
+        for segment in path.split("/")
+    )
+
+
+def get_percentile(sorted_values, percentile):
+    """Nearest rank percentile of sorted values."""
+    if not sorted_values:
+        return None
+    rank = int(math.ceil(percentile / 100.0 * len(sorted_values))) - 1
+    return sorted_values[min(max(rank, 0), len(sorted_values) - 1)]
+
+
+def _get_size(data):
+    if data is None:
+        return 0
+    if isinstance(data, (bytes, str)):
+        return len(data)
+    try:
+        return len(json.dumps(data, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+class ApiStats(object):
+    """
+    Collector of api calls made and time spent polling during a module run.
+    Recording is a no-op till it is enabled, so it can be called from every
+    request path at no cost.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.start_time = time.time()
+            self.endpoints = {}
+            self.retries = 0
+            self.polls = 0
+            self.poll_sleep_time = 0.0
+
+    def record_api_call(
+        self,
+        method,
+        url,
+        status_code=None,
+        elapsed_time=None,
+        request_body=None,
+        bytes_received=None,
+        bytes_sent=None,
+    ):
+        """
+        Record an api call.
+        Args:
+            method (str): HTTP method
+            url (str): request url
+            status_code (int): HTTP status code, None if request failed
+            elapsed_time (float): seconds taken by the call
+            request_body: request body, used to count bytes sent
+            bytes_received (int): size of response body
+            bytes_sent (int): size of request body, if it is not given as request_body
+        """
+        if not self.enabled:
+            return
+        key = (str(method).upper(), get_endpoint(url))
+        if bytes_sent is None:
+            bytes_sent = _get_size(request_body)
+        with self._lock:
+            stats = self.endpoints.get(key)
+            if stats is None:
+                stats = self.endpoints[key] = {
+                    "calls": 0,
+                    "errors": 0,
+                    "latencies": [],
+                    "bytes_sent": 0,
+                    "bytes_received": 0,
+                }
+            stats["calls"] += 1
+            if status_code is None or status_code >= 400:
+                stats["errors"] += 1
+            if elapsed_time is not None:
+                stats["latencies"].append(elapsed_time)
+            stats["bytes_sent"] += bytes_sent
+            stats["bytes_received"] += int(bytes_received or 0)
+
+    def record_retry(self):
+        """Record a request retried, for example due to stale etag."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.retries += 1
+
+    def record_poll_sleep(self, delay):
+        """Record time slept by a poller before next status read."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.polls += 1
+            self.poll_sleep_time += delay
+
+    def get_summary(self):
+        """
+        This routine returns totals and per endpoint stats of recorded calls.
+        Endpoints are sorted by total time spent in them.
+        """
+        with self._lock:
+            endpoints = []
+            for (method, endpoint), stats in self.endpoints.items():
+                latencies = sorted(stats["latencies"])
+                latency = dict(
+                    ("p{0}".format(p), _round(get_percentile(latencies, p)))
+                    for p in PERCENTILES
+                )
+                latency["max"] = _round(latencies[-1] if latencies else None)
+                endpoints.append(
+                    {
+                        "method": method,
+                        "endpoint": endpoint,
+                        "calls": stats["calls"],
+                        "errors": stats["errors"],
+                        "total_time": _round(sum(latencies)),
+                        "latency": latency,
+                        "bytes_sent": stats["bytes_sent"],
+                        "bytes_received": stats["bytes_received"],
+                    }
+                )
+            endpoints.sort(key=lambda e: (-e["total_time"], -e["calls"]))
+            return {
+                "total_calls": sum(e["calls"] for e in endpoints),
+                "total_errors": sum(e["errors"] for e in endpoints),
+                "total_api_time": _round(sum(e["total_time"] for e in endpoints)),
+                "bytes_sent": sum(e["bytes_sent"] for e in endpoints),
+                "bytes_received": sum(e["bytes_received"] for e in endpoints),
+                "retries": self.retries,
+                "polls": self.polls,
+                "poll_sleep_time": _round(self.poll_sleep_time),
+                "run_time": _round(time.time() - self.start_time),
+                "endpoints": endpoints,
+            }
+
+
+def _round(value):
+    return round(value, 4) if value is not None else None
+
+
+# stats of current module run, shared by v3 entities, v4 api clients and pollers
+API_STATS = ApiStats()
+
+
+def enable_api_stats(module):
+    """
+    This routine enables api stats collection if they are requested using
+    module params nutanix_api_stats or nutanix_api_stats_file.
+    """
+    params = module.params
+    if params.get("nutanix_api_stats") or params.get("nutanix_api_stats_file"):
+        if not API_STATS.enabled:
+            API_STATS.reset()
+        API_STATS.enabled = True
+
+
+def add_api_stats(module, result):
+    """
+    This routine adds api stats to module result as api_stats if requested,
+    and appends them as a json line to nutanix_api_stats_file if given.
+    Args:
+        module (AnsibleModule): certain ansible module
+        result (dict): module result
+    """
+    if not API_STATS.enabled:
+        return
+    params = module.params
+    summary = API_STATS.get_summary()
+    if params.get("nutanix_api_stats"):
+        result["api_stats"] = summary
+
+    stats_file = params.get("nutanix_api_stats_file")
+    if not stats_file:
+        return
+    line = {
+        "timestamp": datetime.now().isoformat(),
+        "module": getattr(module, "_name", None),
+        "pid": os.getpid(),
+        "changed": result.get("changed", False),
+        "failed": result.get("failed", False),
+        "api_stats": summary,
+    }
+    try:
+        with open(stats_file, "a") as f:
+            f.write(json.dumps(line) + "\n")
+    except Exception as e:
+        warnings.warn(
+            "Failed to write API stats file '{0}': {1}".format(stats_file, str(e)),
+            RuntimeWarning,
+        )
+
+
+class ApiStatsModuleMixin(object):
+    """
+    Module mixin which adds api stats of the run to module result on exit.
+    """
+
+    def exit_json(self, **kwargs):
+        add_api_stats(self, kwargs)
+        super(ApiStatsModuleMixin, self).exit_json(**kwargs)
+
+    def fail_json(self, msg, **kwargs):
+        kwargs["failed"] = True
+        add_api_stats(self, kwargs)
+        super(ApiStatsModuleMixin, self).fail_json(msg, **kwargs)
@@ -6,12 +6,13 @@ from copy import deepcopy
 
 from ansible.module_utils.basic import AnsibleModule, env_fallback
 
+from .api_stats import ApiStatsModuleMixin, enable_api_stats
 from .constants import DEFAULT_LOG_FILE
 
 __metaclass__ = type
 
 
-class BaseModule(AnsibleModule):
+class BaseModule(ApiStatsModuleMixin, AnsibleModule):
     """Basic module with common arguments"""
 
     unsupported_spec_keys = ["obj"]
@@ -50,6 +51,12 @@ class BaseModule(AnsibleModule):
             default=DEFAULT_LOG_FILE,
             fallback=(env_fallback, ["NUTANIX_LOG_FILE"]),
         ),
+        nutanix_api_stats=dict(
+            type="bool", default=False, fallback=(env_fallback, ["NUTANIX_API_STATS"])
+        ),
+        nutanix_api_stats_file=dict(
+            type="str", fallback=(env_fallback, ["NUTANIX_API_STATS_FILE"])
+        ),
     )
 
     def __init__(self, **kwargs):
@@ -64,6 +71,7 @@ class BaseModule(AnsibleModule):
             kwargs["supports_check_mode"] = True
 
         super(BaseModule, self).__init__(**kwargs)
+        enable_api_stats(self)
 
         # Note: Authentication validation is handled by the API client
         # The env_fallback in argument_spec will populate credentials from environment variables
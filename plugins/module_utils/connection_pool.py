@@ -0,0 +1,191 @@
+# Copyright: (c) 2026, Nutanix
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+
+from ansible.module_utils._text import to_bytes, to_native
+
+from .constants import DEFAULT_MAX_CONNECTIONS_PER_HOST
+
+try:
+    import urllib3
+
+    HAS_URLLIB3 = True
+except ImportError:
+    HAS_URLLIB3 = False
+
+try:
+    from urllib.request import getproxies, proxy_bypass
+except ImportError:
+    from urllib import getproxies, proxy_bypass  # python2
+
+try:
+    from urllib.parse import urlparse
+except ImportError:
+    from urlparse import urlparse  # python2
+
+
+# Pool managers are module level so that every Entity subclass (Prism, NDB,
+# Foundation, Karbon, FC) created during one module run shares the same
+# keep-alive connections. Keyed by (validate_certs, max connections per host).
+_POOL_MANAGERS = {}
+
+
+def is_pooling_enabled(module, url):
+    """
+    This routine checks if given url can be served by the shared connection pool.
+    Pooling is skipped if urllib3 is unavailable, if it is disabled using
+    NUTANIX_CONNECTION_POOL=false or if a proxy applies to the url, in which
+    case the caller should fall back to fetch_url.
+    Args:
+        module (AnsibleModule): certain ansible module
+        url (str): request url
+    Returns:
+        bool: True if pooled connection can be used
+    """
+    if not HAS_URLLIB3:
+        return False
+    if os.environ.get("NUTANIX_CONNECTION_POOL", "true").lower() != "true":
+        return False
+
+    parsed = urlparse(url)
+    proxies = getproxies()
+    if proxies.get(parsed.scheme) and not proxy_bypass(parsed.hostname or ""):
+        return False
+    return True
+
+
+def get_max_connections_per_host():
+    """
+    This routine returns max number of keep-alive connections kept per host
+    as per NUTANIX_MAX_CONNECTIONS_PER_HOST environment variable.
+    """
+    max_connections = os.environ.get("NUTANIX_MAX_CONNECTIONS_PER_HOST")
+    try:
+        max_connections = int(max_connections)
+    except (TypeError, ValueError):
+        return DEFAULT_MAX_CONNECTIONS_PER_HOST
+    return max_connections if max_connections > 0 else DEFAULT_MAX_CONNECTIONS_PER_HOST
+
+
+def get_pool_manager(module):
+    """
+    This routine returns pool manager shared by all entities of current module run.
+    """
+    validate_certs = bool(module.params.get("validate_certs", True))
+    max_connections = get_max_connections_per_host()
+    key = (validate_certs, max_connections)
+
+    manager = _POOL_MANAGERS.get(key)
+    if manager is None:
+        if validate_certs:
+            cert_reqs = "CERT_REQUIRED"
+        else:
+            cert_reqs = "CERT_NONE"
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        manager = urllib3.PoolManager(
+            num_pools=max(10, max_connections),
+            maxsize=max_connections,
+            block=False,
+            cert_reqs=cert_reqs,
+        )
+        _POOL_MANAGERS[key] = manager
+    return manager
+
+
+def fetch_url_pooled(module, url, data=None, method="GET", headers=None, timeout=30):
+    """
+    This routine sends request using shared keep-alive connection pool.
+    Response and info are returned in same format as fetch_url so that callers
+    can switch between both transparently.
+    Args:
+        module (AnsibleModule): certain ansible module
+        url (str): request url
+        data (str|bytes): request body
+        method (str): http method
+        headers (dict): request headers
+        timeout (int): connect and read timeout in seconds
+    Returns:
+        resp (HTTPResponse): response object with read(), None on connection failure
+        info (dict): response status, msg, lowercase headers and error body if any
+    """
+    manager = get_pool_manager(module)
+    info = {"url": url, "status": -1}
+
+    pool = manager.connection_from_url(url)
+    connections_before = pool.num_connections
+
+    if data is not None and not hasattr(data, "read"):
+        data = to_bytes(data, errors="surrogate_or_strict")
+
+    try:
+        resp = manager.urlopen(
+            method,
+            url,
+            body=data,
+            headers=headers,
+            timeout=urllib3.Timeout(connect=timeout, read=timeout),
+            retries=urllib3.Retry(
+                connect=0, read=0, redirect=5, raise_on_redirect=False
+            ),
+            preload_content=False,
+            decode_content=True,
+        )
+    except urllib3.exceptions.HTTPError as e:
+        info["msg"] = "Request failed: {0}".format(to_native(e))
+        return None, info
+    except Exception as e:
+        info["msg"] = "Connection failure: {0}".format(to_native(e))
+        return None, info
+
+    # pool could be replaced if it was evicted, so read counters again
+    pool = manager.connection_from_url(url)
+    info["connection_reused"] = pool.num_connections <= connections_before
+    info.update(dict((k.lower(), v) for k, v in resp.headers.items()))
+    info["status"] = resp.status
+
+    if resp.status >= 400:
+        info["msg"] = "HTTP Error {0}: {1}".format(resp.status, resp.reason)
+        info["body"] = resp.read()
+        resp.release_conn()
+    else:
+        info["msg"] = "OK ({0} bytes)".format(
+            resp.headers.get("Content-Length", "unknown")
+        )
+    return resp, info
+
+
+def get_connection_stats():
+    """
+    This routine returns connection reuse statistics for all hosts served by pool.
+    Returns:
+        stats (list): list of dicts with host, requests, connections and reused count
+    """
+    stats = []
+    for manager in _POOL_MANAGERS.values():
+        for pool_key in list(manager.pools.keys()):
+            pool = manager.pools.get(pool_key)
+            if pool is None:
+                continue
+            stats.append(
+                {
+                    "host": "{0}:{1}".format(pool.host, pool.port),
+                    "requests": pool.num_requests,
+                    "connections": pool.num_connections,
+                    "reused": max(pool.num_requests - pool.num_connections, 0),
+                }
+            )
+    return stats
+
+
+def clear_pools():
+    """
+    This routine closes all pooled connections.
+    """
+    for manager in _POOL_MANAGERS.values():
+        manager.clear()
+    _POOL_MANAGERS.clear()
@@ -11,3 +11,14 @@ __metaclass__ = type
 
 DEFAULT_LOG_FILE = "/tmp/nutanix_ansible_debug.log"
 ALLOW_VERSION_NEGOTIATION = True
+
+# Max keep-alive connections kept per host by v3 Entity connection pool.
+# Can be overridden using NUTANIX_MAX_CONNECTIONS_PER_HOST environment variable.
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 10
+
+# Max pages fetched concurrently while listing all v3 entities or v4 info pages.
+# Can be overridden using NUTANIX_LIST_CONCURRENCY environment variable.
+DEFAULT_LIST_CONCURRENCY = 4
+
+# Page size used by v4 info modules to fetch all pages when limit is not given.
+DEFAULT_V4_PAGE_LIMIT = 100
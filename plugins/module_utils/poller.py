@@ -0,0 +1,174 @@
+# Copyright: (c) 2026, Nutanix
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import random
+import time
+
+from .api_stats import API_STATS
+
+
+class PollingStrategy:
+    EXPONENTIAL = "exponential"
+    FIXED = "fixed"
+    ALL = [EXPONENTIAL, FIXED]
+
+
+class Poller(object):
+    """
+    Polling engine shared by v3, v4, NDB and Foundation task waits.
+
+    Poller is iterated once per status read. The first read happens after
+    first_delay (immediate by default), later reads are spaced as per strategy:
+
+    - exponential: initial_delay * multiplier ** n with +/- jitter, capped at max_delay
+    - fixed: max_delay between every read
+
+    If percent complete is reported using report_progress(), next delay is
+    scheduled as per estimated time of completion (within initial_delay and
+    max_delay). Iteration stops once hard deadline (timeout) is crossed, in
+    which case timed_out is set.
+
+    Example:
+        poller = Poller(timeout=600)
+        for _ in poller:
+            resp = read_status()
+            if done(resp):
+                break
+        else:
+            # timed out
+    """
+
+    def __init__(
+        self,
+        timeout=None,
+        first_delay=0,
+        initial_delay=0.25,
+        max_delay=15,
+        multiplier=2,
+        jitter=0.1,
+        strategy=PollingStrategy.EXPONENTIAL,
+        sleep=time.sleep,
+        clock=time.time,
+    ):
+        if strategy not in PollingStrategy.ALL:
+            raise ValueError("Invalid polling strategy: {0}".format(strategy))
+        self.timeout = timeout
+        self.first_delay = first_delay
+        self.initial_delay = min(initial_delay, max_delay)
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.strategy = strategy
+        self._sleep = sleep
+        self._clock = clock
+
+        self.polls = 0
+        self.total_sleep = 0.0
+        self.timed_out = False
+        self.start_time = None
+        self.deadline = None
+        self._next_delay = None
+        self._last_progress = None
+
+    @classmethod
+    def from_module(cls, module, timeout=None, **kwargs):
+        """
+        This routine creates poller as per module's timeout and environment overrides.
+        Hard deadline is taken from given timeout, else from module param C(timeout).
+        Environment variables NUTANIX_POLL_STRATEGY, NUTANIX_POLL_INITIAL_DELAY and
+        NUTANIX_POLL_MAX_DELAY can be used to tune polling for all modules.
+        Args:
+            module (AnsibleModule): certain ansible module
+            timeout (int): hard deadline in seconds
+            kwargs (dict): Poller arguments
+        Returns:
+            poller (Poller): poller object
+        """
+        if timeout is None:
+            timeout = module.params.get("timeout")
+
+        strategy = os.environ.get("NUTANIX_POLL_STRATEGY")
+        if strategy in PollingStrategy.ALL:
+            kwargs["strategy"] = strategy
+        for env, arg in [
+            ("NUTANIX_POLL_INITIAL_DELAY", "initial_delay"),
+            ("NUTANIX_POLL_MAX_DELAY", "max_delay"),
+        ]:
+            try:
+                kwargs[arg] = float(os.environ[env])
+            except (KeyError, ValueError):
+                pass
+        return cls(timeout=timeout, **kwargs)
+
+    def __iter__(self):
+        self.start_time = self._clock()
+        self.deadline = self.start_time + self.timeout if self.timeout else None
+        self.polls = 0
+        self.timed_out = False
+        self._last_progress = None
+        self._next_delay = None
+
+        self._wait(self.first_delay)
+        while True:
+            self.polls += 1
+            yield self.polls
+            if self.deadline is not None and self._clock() >= self.deadline:
+                self.timed_out = True
+                return
+            self._wait(self._get_next_delay())
+
+    def report_progress(self, percent):
+        """
+        This routine schedules next poll as per estimated time of completion.
+        Args:
+            percent (int|float): percent complete of the polled task
+        """
+        if percent is None:
+            return
+        now = self._clock()
+        last = self._last_progress
+        if last and percent == last[1]:
+            return
+        self._last_progress = (now, percent)
+        if not last or percent < last[1] or percent >= 100:
+            return
+
+        rate = (percent - last[1]) / max(now - last[0], 1e-6)
+        eta = (100 - percent) / rate
+        # poll at half of remaining time so that completion is noticed early
+        self._next_delay = min(max(eta / 2.0, self.initial_delay), self.max_delay)
+
+    def elapsed(self):
+        if self.start_time is None:
+            return 0
+        return self._clock() - self.start_time
+
+    def _get_next_delay(self):
+        if self._next_delay is not None:
+            delay, self._next_delay = self._next_delay, None
+            return delay
+
+        if self.strategy == PollingStrategy.FIXED:
+            return self.max_delay
+
+        # cap exponent to avoid overflow for long running tasks
+        exponent = min(self.polls - 1, 32)
+        delay = min(self.initial_delay * (self.multiplier**exponent), self.max_delay)
+        if self.jitter:
+            delay += delay * random.uniform(-self.jitter, self.jitter)
+        return delay
+
+    def _wait(self, delay):
+        if not delay or delay <= 0:
+            return
+        if self.deadline is not None:
+            delay = min(delay, max(self.deadline - self._clock(), 0))
+        if delay > 0:
+            self.total_sleep += delay
+            API_STATS.record_poll_sleep(delay)
+            self._sleep(delay)
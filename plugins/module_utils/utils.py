@@ -5,6 +5,10 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import os
+
+from .constants import DEFAULT_LIST_CONCURRENCY
+
 
 def remove_param_with_none_value(d):
     for k, v in d.copy().items():
@@ -122,3 +126,37 @@ def create_filter_criteria_string(filters):
     filter_criteria = filter_criteria[:-1]
 
     return filter_criteria
+
+
+def get_list_concurrency():
+    """
+    This routine returns max pages fetched concurrently while listing all entities
+    as per NUTANIX_LIST_CONCURRENCY environment variable.
+    """
+    try:
+        concurrency = int(os.environ.get("NUTANIX_LIST_CONCURRENCY"))
+    except (TypeError, ValueError):
+        return DEFAULT_LIST_CONCURRENCY
+    return concurrency if concurrency > 0 else DEFAULT_LIST_CONCURRENCY
+
+
+def project_attributes(data, attributes):
+    """
+    This routine returns dict having only given attributes of data. Nested
+    attributes are given as dot separated path, for example vm_reference.uuid.
+    Attributes missing in data are skipped.
+    """
+    projected = {}
+    for attribute in attributes:
+        value = data
+        keys = attribute.split(".")
+        for key in keys:
+            if not isinstance(value, dict) or key not in value:
+                break
+            value = value[key]
+        else:
+            target = projected
+            for key in keys[:-1]:
+                target = target.setdefault(key, {})
+            target[keys[-1]] = value
+    return projected
@@ -5,22 +5,43 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import copy
+import hashlib
 import json
 import os
 import time
 from base64 import b64encode
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
 from ansible.module_utils._text import to_text
 from ansible.module_utils.urls import fetch_url
 
 from .. import utils
+from ..api_stats import API_STATS
+from ..connection_pool import fetch_url_pooled, is_pooling_enabled
+from ..poller import Poller
 from ..v4.api_logger import APILogger
+from .json_stream import iter_json_items, iter_text_chunks
+from .uuid_cache import invalidate_uuids
 
 try:
     from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 except ImportError:
     from urlparse import urlparse  # python2
 
+# file is read and sent in chunks of this size while uploading, large chunks
+# keep syscalls and TLS records per GB low
+UPLOAD_CHUNK_SIZE = 1 << 22
+# times upload is restarted after connection drop or below status codes
+UPLOAD_RETRIES = 3
+UPLOAD_RETRY_STATUS_CODES = [502, 503, 504]
+# checksums computed while file is uploaded
+UPLOAD_HASH_ALGORITHMS = ["sha1", "sha256"]
+# endpoints of calls made through create() which only read entities, so that
+# cached name to uuid mappings stay valid
+READ_ONLY_ENDPOINTS = ["list", "query", "query_entities", "search"]
+
 
 class Entity(object):
     entities_limitation = 20
@@ -35,6 +56,7 @@ class Entity(object):
         additional_headers=None,
     ):
         self.module = module
+        self.resource_path = resource_type
         self.base_url = self._build_url(module, scheme, resource_type)
         self.headers = self._build_headers(module, additional_headers)
         self.cookies = cookies
@@ -60,6 +82,7 @@ class Entity(object):
             raise_error=raise_error,
             no_response=no_response,
             timeout=timeout,
+            invalidate_uuids=True,
         )
 
     def read(
@@ -87,6 +110,100 @@ class Entity(object):
             **kwargs  # fmt: skip
         )
 
+    def read_stream(
+        self,
+        uuid=None,
+        endpoint=None,
+        query=None,
+        result=None,
+        timeout=30,
+        items_key=None,
+    ):
+        """
+        This routine yields items of list returned by GET api one by one as
+        response is read, so that memory used stays bounded for large lists.
+        Args:
+            uuid (str): entity uuid
+            endpoint (str): endpoint
+            query (dict): query params
+            result (dict): dict which gets response, if response is not a list
+            timeout (int): timeout
+            items_key (str): key of list in response, if response is an object
+        Yields:
+            item (dict): list item
+        """
+        url = self.base_url + "/{0}".format(uuid) if uuid else self.base_url
+        if endpoint:
+            url = url + "/{0}".format(endpoint)
+        if query:
+            url = self._build_url_with_query(url, query)
+        return self._stream_url(
+            url, method="GET", items_key=items_key, result=result, timeout=timeout
+        )
+
+    def read_pages_stream(
+        self,
+        uuid=None,
+        endpoint=None,
+        items_key=None,
+        page_size=None,
+        result=None,
+        timeout=30,
+    ):
+        """
+        This routine yields items of list returned by GET api one by one. If
+        page_size is given, list is read in pages using offset and length query
+        params, so that no single call has to return whole list. Reading stops
+        at a page having other than page_size items, or once total_matches in
+        response metadata are read.
+        Args:
+            uuid (str): entity uuid
+            endpoint (str): endpoint
+            items_key (str): key of list in response, if response is an object
+            page_size (int): items per page, whole list is read in one call if not given
+            result (dict): dict which gets rest of response of last page
+            timeout (int): timeout per page
+        Yields:
+            item (dict): list item
+        """
+        if not page_size:
+            for item in self.read_stream(
+                uuid,
+                endpoint,
+                result=result,
+                timeout=timeout,
+                items_key=items_key,
+            ):
+                yield item
+            return
+
+        offset = 0
+        first_item = None
+        while True:
+            page_result = {}
+            count = 0
+            for item in self.read_stream(
+                uuid,
+                endpoint,
+                query={"offset": offset, "length": page_size},
+                result=page_result,
+                timeout=timeout,
+                items_key=items_key,
+            ):
+                if count == 0:
+                    if offset and item == first_item:
+                        # api ignores offset, whole list was read in first page
+                        return
+                    first_item = first_item or item
+                count += 1
+                yield item
+            if result is not None:
+                result.update(page_result)
+            offset += count
+            total = (page_result.get("metadata") or {}).get("total_matches")
+            if count != page_size or (total is not None and offset >= total):
+                return
+
     def update(
         self,
         data=None,
@@ -111,6 +228,7 @@ class Entity(object):
             raise_error=raise_error,
             no_response=no_response,
             timeout=timeout,
+            invalidate_uuids=True,
             **kwargs  # fmt: skip
         )
 
@@ -159,6 +277,7 @@ class Entity(object):
             raise_error=raise_error,
             no_response=no_response,
             timeout=timeout,
+            invalidate_uuids=True,
         )
 
     def list(
@@ -238,6 +357,158 @@ class Entity(object):
 
         return resp
 
+    def list_pages(
+        self,
+        data=None,
+        endpoint=None,
+        use_base_url=False,
+        page_size=None,
+        max_workers=None,
+        timeout=30,
+    ):
+        """
+        This routine fetches all entities as per given list spec page by page.
+        First page gives total_matches, remaining offsets are fetched concurrently
+        using bounded thread pool and merged in order. custom_filter, if given,
+        is applied on each page as it arrives.
+        Args:
+            data (dict): list spec, length upto which entities are fetched (all if not given)
+            endpoint (str): list endpoint
+            use_base_url (bool): use base url instead of base url + /list
+            page_size (int): entities fetched per call
+            max_workers (int): max pages fetched concurrently
+            timeout (int): timeout per call
+        Returns:
+            resp (dict): first page response containing entities of all pages
+        """
+        spec = copy.deepcopy(data) if data else {}
+        page_size = page_size or self.entities_limitation
+        offset = spec.get("offset", 0)
+        length = spec.get("length")
+
+        spec["offset"] = offset
+        spec["length"] = min(page_size, length) if length else page_size
+        resp = self.list(
+            data=spec, endpoint=endpoint, use_base_url=use_base_url, timeout=timeout
+        )
+        if self.entity_type not in resp:
+            return resp
+
+        total_matches = resp.get("metadata", {}).get("total_matches") or 0
+        page_specs = self._get_page_specs(spec, total_matches, page_size, length)
+
+        entities = resp[self.entity_type]
+        for page in self._iter_pages(
+            page_specs, endpoint, use_base_url, max_workers, timeout
+        ):
+            entities.extend(page[self.entity_type])
+
+        resp[self.entity_type] = entities
+        resp["metadata"]["offset"] = offset
+        resp["metadata"]["length"] = len(entities)
+        return resp
+
+    def iter_entities(
+        self,
+        data=None,
+        endpoint=None,
+        use_base_url=False,
+        page_size=None,
+        max_workers=None,
+        timeout=30,
+    ):
+        """
+        This routine yields entities as per given list spec one by one. Pages are
+        fetched as in list_pages(), but at most max_workers pages are in flight
+        and every page is dropped once its entities are consumed, so memory used
+        stays bounded irrespective of total entities.
+        Args:
+            data (dict): list spec, length upto which entities are fetched (all if not given)
+            endpoint (str): list endpoint
+            use_base_url (bool): use base url instead of base url + /list
+            page_size (int): entities fetched per call
+            max_workers (int): max pages fetched concurrently
+            timeout (int): timeout per call
+        Yields:
+            entity (dict): entity
+        """
+        spec = copy.deepcopy(data) if data else {}
+        page_size = page_size or self.entities_limitation
+        offset = spec.get("offset", 0)
+        length = spec.get("length")
+
+        spec["offset"] = offset
+        spec["length"] = min(page_size, length) if length else page_size
+        resp = self.list(
+            data=spec, endpoint=endpoint, use_base_url=use_base_url, timeout=timeout
+        )
+        if self.entity_type not in resp:
+            return
+        total_matches = resp.get("metadata", {}).get("total_matches") or 0
+        page_specs = self._get_page_specs(spec, total_matches, page_size, length)
+        for entity in resp.pop(self.entity_type):
+            yield entity
+        for page in self._iter_pages(
+            page_specs, endpoint, use_base_url, max_workers, timeout
+        ):
+            for entity in page[self.entity_type]:
+                yield entity
+
+    @staticmethod
+    def _get_page_specs(spec, total_matches, page_size, length=None):
+        """
+        This routine returns list specs of pages after first page of given spec.
+        """
+        offset = spec["offset"]
+        end = total_matches if not length else min(total_matches, offset + length)
+        page_specs = []
+        for page_offset in range(offset + page_size, end, page_size):
+            page_spec = copy.deepcopy(spec)
+            page_spec["offset"] = page_offset
+            page_spec["length"] = min(page_size, end - page_offset)
+            page_specs.append(page_spec)
+        return page_specs
+
+    def _iter_pages(self, page_specs, endpoint, use_base_url, max_workers, timeout):
+        """
+        This routine fetches pages of given list specs concurrently and yields them
+        in order of offsets. At most max_workers pages are fetched ahead of the
+        page being consumed.
+        """
+        if not page_specs:
+            return
+
+        def fetch_page(page_spec):
+            return self.list(
+                data=page_spec,
+                endpoint=endpoint,
+                use_base_url=use_base_url,
+                raise_error=False,
+                timeout=timeout,
+            )
+
+        max_workers = min(max_workers or utils.get_list_concurrency(), len(page_specs))
+        specs = iter(page_specs)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque(
+                (page_spec, executor.submit(fetch_page, page_spec))
+                for page_spec in islice(specs, max_workers)
+            )
+            while pending:
+                page_spec, future = pending.popleft()
+                page = future.result()
+                next_spec = next(specs, None)
+                if next_spec is not None:
+                    pending.append((next_spec, executor.submit(fetch_page, next_spec)))
+                if not page or self.entity_type not in page:
+                    self.module.fail_json(
+                        msg="Failed fetching entities at offset {0}".format(
+                            page_spec["offset"]
+                        ),
+                        response=page,
+                    )
+                yield page
+
     # "params" can be used to override module.params to create spec by other modules backened
     def get_spec(self, old_spec=None, params=None, **kwargs):
         spec = copy.deepcopy(old_spec) or self._get_default_spec()
@@ -288,6 +559,49 @@ class Entity(object):
                     return entity["metadata"]["uuid"]
         return None
 
+    def get_name_uuid_map(self, names, key="name", batch_size=20):
+        """
+        This routine resolves given names to uuids using one list call per batch
+        of names, with names or-ed in filter. Filter matches substrings of names,
+        so pages of a batch are fetched till all its names are found exactly or
+        all matches are read. Names not found, or having filter separators in
+        them, are skipped and can be resolved using get_uuid().
+        Args:
+            names (list): entity names
+            key (str): filter attribute of name
+            batch_size (int): max names per list call
+        Returns:
+            name_uuid_map (dict): name to uuid map of found entities
+        """
+        names = sorted(
+            set(name for name in names if name and not set(name) & {",", ";"})
+        )
+        name_uuid_map = {}
+        for i in range(0, len(names), batch_size):
+            batch = names[i : i + batch_size]
+            pending = set(batch)
+            offset = 0
+            while pending:
+                filter_spec = {
+                    "filter": ",".join("{0}=={1}".format(key, name) for name in batch),
+                    "offset": offset,
+                    "length": len(batch) * 5,
+                }
+                resp = self.list(data=filter_spec, raise_error=False) or {}
+                entities = resp.get("entities") or []
+                for entity in entities:
+                    name = entity.get("spec", {}).get("name") or entity.get(
+                        "status", {}
+                    ).get("name")
+                    if name in pending:
+                        name_uuid_map[name] = entity["metadata"]["uuid"]
+                        pending.discard(name)
+                offset += len(entities)
+                total_matches = (resp.get("metadata") or {}).get("total_matches")
+                if not entities or not total_matches or offset >= total_matches:
+                    break
+        return name_uuid_map
+
     @staticmethod
     def update_entity_spec_version(spec):
         spec["metadata"]["entity_version"] = str(
@@ -390,14 +704,8 @@ class Entity(object):
         if kwargs.get("additional_headers"):
             headers.update(kwargs.get("additional_headers"))
 
-        resp, info = fetch_url(
-            self.module,
-            url,
-            data=data,
-            method=method,
-            headers=headers,
-            cookies=self.cookies,
-            timeout=timeout,
+        resp, info = self._send_request(
+            url, method=method, data=data, headers=headers, timeout=timeout
         )
 
         status_code = info.get("status")
@@ -405,9 +713,6 @@ class Entity(object):
 
         body = None
 
-        # buffer size with ref. to max read size of http.client.HTTPResponse.read() defination
-        buffer_size = 65536
-
         # From ansible-core>=2.13, incase of http error, urllib.HTTPError object is returned in resp
         # as per the docs of ansible we need to use body in that case.
         if not resp or status_code >= 400:
@@ -417,22 +722,23 @@ class Entity(object):
             # For case when response body size is > 65536, read() will fail due to http.client.IncompleteRead exception
             # This eventually closes connection and can't read response further.
             # So here we read all content in chunks (of size < 65536) and combine data at last to get final response.
-            resp_chunk = None
-            resp_chunks = []
-            while True:
-                resp_chunk = resp.read(buffer_size)
-                if resp_chunk:
-                    resp_chunks.append(to_text(resp_chunk.decode("utf-8")))
-                else:
-                    break
-
-            body = "".join(resp_chunks)
+            # Chunks are decoded incrementally as multibyte characters can be split across chunks.
+            body = "".join(iter_text_chunks(resp))
 
         try:
             resp_json = json.loads(to_text(body)) if body else None
         except ValueError:
             resp_json = None
 
+        API_STATS.record_api_call(
+            method,
+            url,
+            status_code,
+            time.time() - start_time,
+            data,
+            len(body) if body else 0,
+        )
+
         # Log the API call
 
         try:
@@ -445,6 +751,7 @@ class Entity(object):
                 response=resp_json,
                 status_code=status_code,
                 elapsed_time=elapsed_time,
+                connection_reused=info.get("connection_reused"),
             )
         except Exception as e:
             self.logger.log_api_call(
@@ -460,24 +767,18 @@ class Entity(object):
             )
             raise e
 
+        if kwargs.get("invalidate_uuids") and 200 <= status_code < 300:
+            self._invalidate_uuids(url)
+
         if not raise_error:
+            if kwargs.get("include_status_code"):
+                # status code is returned along with response, even if empty
+                resp_json = resp_json if isinstance(resp_json, dict) else {}
+                resp_json["status_code"] = status_code
             return resp_json
 
         if status_code >= 300:
-            if (
-                resp_json and isinstance(resp_json, dict) and resp_json.get("message")
-            ):  # for ndb apis
-                err = resp_json["message"]
-            elif info.get("msg"):
-                err = info["msg"]
-            else:
-                err = "Status code != 2xx"
-            self.module.fail_json(
-                msg="Failed fetching URL: {0}".format(url),
-                status_code=status_code,
-                error=err,
-                response=resp_json,
-            )
+            self._fail_request(url, status_code, info, resp_json)
 
         if no_response:
             return {"status_code": status_code}
@@ -499,25 +800,195 @@ class Entity(object):
             resp_json["etag"] = info.get("etag")
         return resp_json
 
-    # upload file in chunks to the given url
-    def _upload_file(
-        self, url, source, method, raise_error=True, no_response=False, timeout=30
+    def _invalidate_uuids(self, url):
+        """
+        This method drops cached uuids of this kind once its entities are
+        changed. Calls to read only endpoints, like list, change nothing.
+        """
+        endpoint = urlparse(url).path.rstrip("/").rsplit("/", 1)[-1]
+        if endpoint not in READ_ONLY_ENDPOINTS:
+            # cached name to uuid mappings of this kind can be stale from now on
+            invalidate_uuids(self.module, self.resource_path)
+
+    def _fail_request(self, url, status_code, info, resp_json):
+        if (
+            resp_json and isinstance(resp_json, dict) and resp_json.get("message")
+        ):  # for ndb apis
+            err = resp_json["message"]
+        elif info.get("msg"):
+            err = info["msg"]
+        else:
+            err = "Status code != 2xx"
+        self.module.fail_json(
+            msg="Failed fetching URL: {0}".format(url),
+            status_code=status_code,
+            error=err,
+            response=resp_json,
+        )
+
+    def _stream_url(
+        self, url, method, data=None, items_key=None, result=None, timeout=30
     ):
-        file_chunks_iterator = FileChunksIterator(source)
+        """
+        This routine yields items of list in response one by one as response is
+        read, so that whole response is never held in memory. Refer
+        iter_json_items() for items_key and result.
+        """
+        start_time = time.time()
+
+        if self.headers["Content-Type"] == "application/json" and data is not None:
+            data = self.module.jsonify(data)
         headers = copy.deepcopy(self.headers)
-        headers["Content-Length"] = file_chunks_iterator.length
-        resp, info = fetch_url(
+
+        resp, info = self._send_request(
+            url, method=method, data=data, headers=headers, timeout=timeout
+        )
+        status_code = info.get("status")
+
+        if not resp or status_code >= 300:
+            body = info.get("body") if not resp or status_code >= 400 else None
+            if body is None and resp:
+                body = "".join(iter_text_chunks(resp))
+            try:
+                resp_json = json.loads(to_text(body)) if body else None
+            except ValueError:
+                resp_json = None
+            elapsed_time = time.time() - start_time
+            API_STATS.record_api_call(
+                method, url, status_code, elapsed_time, data, len(body) if body else 0
+            )
+            self.logger.log_api_call(
+                method=method,
+                url=url,
+                headers=headers,
+                body=data,
+                response=resp_json,
+                status_code=status_code,
+                elapsed_time=elapsed_time,
+                connection_reused=info.get("connection_reused"),
+            )
+            self._fail_request(url, status_code, info, resp_json)
+
+        count = 0
+        try:
+            for item in iter_json_items(
+                iter_text_chunks(resp), items_key=items_key, result=result
+            ):
+                count += 1
+                yield item
+        except ValueError as e:
+            self.module.fail_json(
+                msg="Failed to convert API response to json",
+                status_code=status_code,
+                error=to_text(e),
+            )
+
+        # streamed items are not kept, so only their count is logged
+        elapsed_time = time.time() - start_time
+        API_STATS.record_api_call(
+            method,
+            url,
+            status_code,
+            elapsed_time,
+            data,
+            info.get("content-length"),
+        )
+        self.logger.log_api_call(
+            method=method,
+            url=url,
+            headers=headers,
+            body=data,
+            response={"streamed_items": count},
+            status_code=status_code,
+            elapsed_time=elapsed_time,
+            connection_reused=info.get("connection_reused"),
+        )
+
+    def _send_request(self, url, method, data=None, headers=None, timeout=30):
+        """
+        Send request over keep-alive connections shared by all entities of this
+        module run. Cookies and proxies are only supported by fetch_url.
+        """
+        if not self.cookies and is_pooling_enabled(self.module, url):
+            return fetch_url_pooled(
+                self.module,
+                url,
+                data=data,
+                method=method,
+                headers=headers,
+                timeout=timeout,
+            )
+        return fetch_url(
             self.module,
             url,
-            data=file_chunks_iterator,
+            data=data,
             method=method,
             headers=headers,
             cookies=self.cookies,
             timeout=timeout,
         )
 
-        status_code = info.get("status")
+    # upload file in chunks to the given url
+    def _upload_file(
+        self, url, source, method, raise_error=True, no_response=False, timeout=30
+    ):
+        """
+        This routine uploads file in large chunks. Checksums of file are computed
+        while it is sent and upload is restarted from start with backoff if
+        connection drops or a gateway error is returned, upto UPLOAD_RETRIES times.
+        Size, attempts, throughput and checksums of upload are set in upload_stats.
+        """
+        start_time = time.time()
+        headers = copy.deepcopy(self.headers)
+        poller = Poller(initial_delay=2, max_delay=30)
+        for attempt in poller:
+            file_chunks_iterator = FileChunksIterator(
+                source,
+                hash_algorithms=UPLOAD_HASH_ALGORITHMS,
+                progress=self._get_upload_progress_logger(source),
+            )
+            headers["Content-Length"] = file_chunks_iterator.length
+            attempt_start_time = time.time()
+            resp, info = fetch_url(
+                self.module,
+                url,
+                data=file_chunks_iterator,
+                method=method,
+                headers=headers,
+                cookies=self.cookies,
+                timeout=timeout,
+            )
+            status_code = info.get("status")
+            if attempt > UPLOAD_RETRIES or (
+                status_code != -1 and status_code not in UPLOAD_RETRY_STATUS_CODES
+            ):
+                break
+            API_STATS.record_retry()
+            self.logger.log_message(
+                "Upload of {0} failed with status {1}: {2}, retrying".format(
+                    source, status_code, info.get("msg")
+                )
+            )
+
         body = resp.read() if resp else info.get("body")
+        elapsed_time = time.time() - attempt_start_time
+        API_STATS.record_api_call(
+            method,
+            url,
+            status_code,
+            elapsed_time,
+            bytes_sent=file_chunks_iterator.bytes_read,
+            bytes_received=len(body) if body else 0,
+        )
+        self.upload_stats = {
+            "bytes": file_chunks_iterator.length,
+            "attempts": attempt,
+            "elapsed_time": round(time.time() - start_time, 3),
+            "throughput_mbps": round(
+                file_chunks_iterator.bytes_read * 8 / 1e6 / max(elapsed_time, 1e-6), 2
+            ),
+            "checksums": file_chunks_iterator.get_checksums(),
+        }
         try:
             resp_json = json.loads(to_text(body)) if body else None
         except ValueError:
@@ -554,6 +1025,28 @@ class Entity(object):
 
         return resp_json
 
+    def _get_upload_progress_logger(self, source):
+        """
+        This routine returns progress callback which logs upload progress and
+        throughput at every 10 percent of upload.
+        """
+        start_time = time.time()
+        logged = {"decile": 0}
+
+        def log_progress(bytes_read, total_bytes):
+            decile = bytes_read * 10 // max(total_bytes, 1)
+            if decile <= logged["decile"]:
+                return
+            logged["decile"] = decile
+            elapsed_time = max(time.time() - start_time, 1e-6)
+            self.logger.log_message(
+                "Uploaded {0} of {1} bytes of {2} ({3:.2f} Mbps)".format(
+                    bytes_read, total_bytes, source, bytes_read * 8 / 1e6 / elapsed_time
+                )
+            )
+
+        return log_progress
+
     def unify_spec(self, spec1, spec2):
         """
         This routine return intersection of two specs(dict) as per
@@ -581,13 +1074,14 @@ class Entity(object):
 
 # Read files in chunks and yeild it
 class CreateChunks(object):
-    def __init__(self, filename, chunk_size=1 << 13):
+    def __init__(self, filename, chunk_size=UPLOAD_CHUNK_SIZE):
         self.filename = filename
         self.chunk_size = chunk_size
         self.total_size = os.path.getsize(filename)
 
     def __iter__(self):
-        with open(self.filename, "rb") as file:
+        # chunks are large, so python level buffering only adds a copy
+        with open(self.filename, "rb", buffering=0) as file:
             while True:
                 data = file.read(self.chunk_size)
                 if not data:
@@ -600,14 +1094,42 @@ class CreateChunks(object):
 
 # to iterate over chunks of file
 class FileChunksIterator(object):
-    def __init__(self, filename, chunk_size=1 << 13):
+    """
+    File like object to upload file in chunks. Checksums of file are computed
+    as chunks are read, and progress(bytes_read, total_bytes) is called after
+    every chunk.
+    """
+
+    def __init__(
+        self,
+        filename,
+        chunk_size=UPLOAD_CHUNK_SIZE,
+        hash_algorithms=None,
+        progress=None,
+    ):
         iterable = CreateChunks(filename, chunk_size)
         self.iterator = iter(iterable)
         self.length = len(iterable)
+        self.bytes_read = 0
+        self.hashes = [(alg, hashlib.new(alg)) for alg in hash_algorithms or []]
+        self.progress = progress
 
     # request lib checks for read func in iterable object
     def read(self, size=None):
-        return next(self.iterator, b"")
+        data = next(self.iterator, b"")
+        if data:
+            self.bytes_read += len(data)
+            for _, hash_obj in self.hashes:
+                hash_obj.update(data)
+            if self.progress:
+                self.progress(self.bytes_read, self.length)
+        return data
+
+    def get_checksums(self):
+        """Hex digests of file by algorithm, empty if file is not fully read."""
+        if self.bytes_read != self.length:
+            return {}
+        return dict((alg, hash_obj.hexdigest()) for alg, hash_obj in self.hashes)
 
     def __len__(self):
         return self.length
@@ -2,8 +2,7 @@
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 from __future__ import absolute_import, division, print_function
 
-import time
-
+from ...poller import Poller
 from .foundation import Foundation
 
 __metaclass__ = type
@@ -19,11 +18,19 @@ class Progress(Foundation):
         resp = self.read(query=query)
         return resp
 
-    def wait_for_completion(self, uuid):
-        state = ""
-        delay = 30
-        timeout = time.time() + (max(3600, self.module.params["timeout"]))
-        while state != "COMPLETED":
+    def wait_for_completion(self, uuid, max_delay=30):
+        """
+        Poll imaging progress till it stops. Polling starts immediately and
+        next poll is scheduled as per aggregate percent complete, upto
+        max_delay seconds between reads.
+        """
+        poller = Poller.from_module(
+            self.module,
+            timeout=max(3600, self.module.params["timeout"]),
+            initial_delay=5,
+            max_delay=max_delay,
+        )
+        for _ in poller:
             response = self.get(uuid)
             stopped = response.get("imaging_stopped", False)
             aggregate_percent_complete = response.get("aggregate_percent_complete", -1)
@@ -31,16 +38,12 @@ class Progress(Foundation):
                 if aggregate_percent_complete < 100:
                     status = self._get_progress_error_status(response)
                     return response, status
-                state = "COMPLETED"
-            else:
-                state = "PENDING"
-                if time.time() > timeout:
-                    return (
-                        None,
-                        "Failed to poll on image node progress. Reason: Timeout",
-                    )
-                time.sleep(delay)
-        return response, None
+                return response, None
+            poller.report_progress(aggregate_percent_complete)
+        return (
+            None,
+            "Failed to poll on image node progress. Reason: Timeout",
+        )
 
     def _get_progress_error_status(self, progress):
         return "Imaging stopped before completion.\nClusters: {0}\nNodes: {1}".format(
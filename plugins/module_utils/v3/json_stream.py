@@ -0,0 +1,174 @@
+# Copyright: (c) 2026, Nutanix
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import codecs
+import json
+import re
+
+# buffer size with ref. to max read size of http.client.HTTPResponse.read() defination
+DEFAULT_BUFFER_SIZE = 65536
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# characters which can continue a number decoded from text cut by chunk boundary
+_NUMBER_CHARS = frozenset(".eE+-0123456789")
+
+
+def iter_text_chunks(resp, buffer_size=DEFAULT_BUFFER_SIZE):
+    """
+    This routine reads response in chunks and yields them as text. Chunks are
+    decoded incrementally, so multibyte utf-8 characters split across chunks
+    are decoded correctly.
+    Args:
+        resp (object): response object having read(size)
+        buffer_size (int): max bytes read at once
+    Yields:
+        text (str): decoded text
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    while True:
+        chunk = resp.read(buffer_size)
+        if not chunk:
+            break
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    text = decoder.decode(b"", final=True)
+    if text:
+        yield text
+
+
+class _TextBuffer(object):
+    """
+    Text read so far from chunks, from which decoded values are dropped.
+    """
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, min_size=1):
+        """
+        Read chunks till at least min_size more characters than already
+        buffered are available. Returns False if nothing could be read.
+        """
+        parts = [self.text[self.pos :]]
+        size = len(parts[0])
+        target = size + min_size
+        while size < target:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self.eof = True
+                break
+            parts.append(chunk)
+            size += len(chunk)
+        self.text = "".join(parts)
+        self.pos = 0
+        return len(parts) > 1
+
+    def peek(self):
+        """Skip whitespaces and return next character, None at end of input."""
+        while True:
+            self.pos = _WHITESPACE.match(self.text, self.pos).end()
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return None
+
+    def expect(self, chars):
+        char = self.peek()
+        if char is None or char not in chars:
+            raise ValueError(
+                "Expecting one of '{0}' but found '{1}'".format(chars, char or "EOF")
+            )
+        self.pos += 1
+        return char
+
+    def decode_value(self, decoder):
+        """Decode next JSON value, reading more chunks till it is complete."""
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.text, self.pos)
+                # numbers or literals ending at buffer end can be incomplete,
+                # "1." or "1e+" decode as 1 leaving rest of number undecoded
+                if self.eof or (
+                    end < len(self.text)
+                    and not (_is_number(value) and self.text[end] in _NUMBER_CHARS)
+                ):
+                    self.pos = end
+                    return value
+            except ValueError:
+                if self.eof:
+                    raise
+            # double buffered text to keep re-decoding of large values linear
+            self.fill(max(len(self.text) - self.pos, 1))
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _iter_array(buf, decoder):
+    buf.expect("[")
+    if buf.peek() == "]":
+        buf.pos += 1
+        return
+    while True:
+        yield buf.decode_value(decoder)
+        if buf.expect(",]") == "]":
+            return
+
+
+def iter_json_items(chunks, items_key=None, result=None):
+    """
+    This routine decodes JSON text given in chunks and yields items of its list
+    one by one, so that whole text and list are never held in memory at once.
+    Items of a top level list are yielded. If top level value is an object,
+    items of list at items_key are yielded and all other members are added to
+    result. Any other top level value is added to result as is, if it is an object.
+    Args:
+        chunks (iterable): JSON text chunks
+        items_key (str): key of list to be yielded in top level object
+        result (dict): dict to which other members of top level object are added
+    Yields:
+        item (object): decoded list item
+    Raises:
+        ValueError: if text is not valid JSON
+    """
+    buf = _TextBuffer(chunks)
+    decoder = json.JSONDecoder()
+    char = buf.peek()
+    if char == "[":
+        for item in _iter_array(buf, decoder):
+            yield item
+    elif char == "{" and items_key is not None:
+        buf.expect("{")
+        if buf.peek() == "}":
+            buf.pos += 1
+        else:
+            while True:
+                key = buf.decode_value(decoder)
+                buf.expect(":")
+                if key == items_key and buf.peek() == "[":
+                    for item in _iter_array(buf, decoder):
+                        yield item
+                else:
+                    value = buf.decode_value(decoder)
+                    if result is not None:
+                        result[key] = value
+                if buf.expect(",}") == "}":
+                    break
+    else:
+        value = buf.decode_value(decoder)
+        if result is not None and isinstance(value, dict):
+            result.update(value)
+
+    if buf.peek() is not None:
+        raise ValueError("Extra data after JSON value")
@@ -4,12 +4,13 @@ from __future__ import absolute_import, division, print_function
 
 from ansible.module_utils.basic import AnsibleModule, env_fallback
 
+from ...api_stats import ApiStatsModuleMixin, enable_api_stats
 from ...constants import DEFAULT_LOG_FILE
 
 __metaclass__ = type
 
 
-class NdbBaseModule(AnsibleModule):
+class NdbBaseModule(ApiStatsModuleMixin, AnsibleModule):
     argument_spec = dict(
         nutanix_host=dict(
             type="str", required=True, fallback=(env_fallback, ["NUTANIX_HOST"])
@@ -37,6 +38,12 @@ class NdbBaseModule(AnsibleModule):
             default=DEFAULT_LOG_FILE,
             fallback=(env_fallback, ["NUTANIX_LOG_FILE"]),
         ),
+        nutanix_api_stats=dict(
+            type="bool", default=False, fallback=(env_fallback, ["NUTANIX_API_STATS"])
+        ),
+        nutanix_api_stats_file=dict(
+            type="str", fallback=(env_fallback, ["NUTANIX_API_STATS_FILE"])
+        ),
     )
 
     def __init__(self, **kwargs):
@@ -49,3 +56,4 @@ class NdbBaseModule(AnsibleModule):
             kwargs["supports_check_mode"] = True
 
         super(NdbBaseModule, self).__init__(**kwargs)
+        enable_api_stats(self)
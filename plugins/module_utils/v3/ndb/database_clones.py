@@ -10,6 +10,7 @@ from .database_engines.db_engine_factory import create_db_engine
 from .db_server_vm import DBServerVM
 from .nutanix_database import NutanixDatabase
 from .profiles.profile_types import DatabaseParameterProfile
+from .snapshots import Snapshot
 from .time_machines import TimeMachine
 
 
@@ -237,6 +238,14 @@ class DatabaseClone(NutanixDatabase):
 
         if time_machine.get("snapshot_uuid"):
             payload["snapshotId"] = time_machine.get("snapshot_uuid")
+        elif time_machine.get("snapshot_name"):
+            snapshot = Snapshot(self.module)
+            snapshot_uuid, err = snapshot.get_snapshot_uuid(
+                uuid, time_machine["snapshot_name"]
+            )
+            if err:
+                return None, err
+            payload["snapshotId"] = snapshot_uuid
         elif time_machine.get("pitr_timestamp"):
             payload["userPitrTimestamp"] = time_machine.get("pitr_timestamp")
         elif time_machine.get("latest_snapshot", False):
@@ -244,7 +253,7 @@ class DatabaseClone(NutanixDatabase):
         else:
             return (
                 None,
-                "Required one of snapshot_uuid, pitr_timestamp or latest_snapshot for source of db clone",
+                "Required one of snapshot_uuid, snapshot_name, pitr_timestamp or latest_snapshot for source of db clone",
             )
 
         payload["timeZone"] = time_machine.get("timezone")
@@ -2,14 +2,17 @@
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 from __future__ import absolute_import, division, print_function
 
-import time
-
 __metaclass__ = type
 
 
+from ...api_stats import API_STATS
+from ...poller import Poller
 from ..constants import NDB
 from .nutanix_database import NutanixDatabase
 
+# max seconds for which reads of an operation not yet visible are retried
+OPERATION_VISIBILITY_TIMEOUT = 30
+
 
 class Operation(NutanixDatabase):
     def __init__(self, module):
@@ -19,10 +22,15 @@ class Operation(NutanixDatabase):
     def wait_for_completion(
         self, uuid, raise_error=True, delay=NDB.OPERATIONS_POLLING_DELAY
     ):
-        timeout = time.time() + self.module.params["timeout"]
-        resp = None
-        while True:
-            resp = self.read(uuid)
+        """
+        Poll operation till it completes. Operation is first read till it is
+        visible, then polling backs off up to delay seconds between reads.
+        """
+        resp = self.wait_till_visible(uuid)
+        poller = Poller.from_module(self.module, max_delay=delay)
+        for count in poller:
+            if count > 1:
+                resp = self.read(uuid)
             status = resp.get("status")
             if (
                 status == NDB.StatusCodes.SUCCESS
@@ -36,11 +44,36 @@ class Operation(NutanixDatabase):
                     msg=resp["message"],
                     response=resp,
                 )
-            else:
-                if time.time() > timeout:
-                    self.module.fail_json(
-                        msg="Failed to poll on provision database instance operations. Reason: Timeout",
-                        response=resp,
-                    )
-            time.sleep(delay)
+            poller.report_progress(self._get_percentage_complete(resp))
+        else:
+            self.module.fail_json(
+                msg="Failed to poll on provision database instance operations. Reason: Timeout",
+                response=resp,
+            )
         return resp
+
+    def wait_till_visible(self, uuid, timeout=OPERATION_VISIBILITY_TIMEOUT):
+        """
+        Operation returned by an api can take few seconds to be visible, till
+        then it is read as 404 or empty response. Such reads are retried with
+        short backoff, after which error of last read is raised. Other errors
+        are raised at once.
+        """
+        poller = Poller(timeout=timeout, initial_delay=0.5, max_delay=2)
+        for count in poller:
+            if count > 1:
+                API_STATS.record_retry()
+            resp = self.read(uuid, raise_error=False, include_status_code=True)
+            status_code = resp.pop("status_code")
+            if 200 <= status_code < 300 and resp.get("status"):
+                return resp
+            if status_code != 404 and not 200 <= status_code < 300:
+                break
+        return self.read(uuid)
+
+    @staticmethod
+    def _get_percentage_complete(resp):
+        try:
+            return float(resp.get("percentageComplete"))
+        except (TypeError, ValueError):
+            return None
@@ -11,6 +11,10 @@ from .clusters import Cluster
 from .nutanix_database import NutanixDatabase
 from .time_machines import TimeMachine
 
+# Index of snapshot name to (uuid, timestamp) of latest snapshot with that name,
+# per (ndb host, time machine uuid), built once per module run.
+_SNAPSHOT_INDEXES = {}
+
 
 class Snapshot(NutanixDatabase):
     def __init__(self, module):
@@ -23,11 +27,13 @@ class Snapshot(NutanixDatabase):
         }
 
     def create_snapshot(self, time_machine_uuid, data):
+        self.invalidate_snapshot_index(time_machine_uuid)
         endpoint = "{0}/{1}".format(time_machine_uuid, "snapshots")
         time_machine = TimeMachine(self.module)
         return time_machine.create(data=data, endpoint=endpoint)
 
     def rename_snapshot(self, uuid, data):
+        _SNAPSHOT_INDEXES.clear()
         endpoint = "i/{0}".format(uuid)
         return self.update(data=data, endpoint=endpoint, method="PATCH")
 
@@ -58,32 +64,50 @@ class Snapshot(NutanixDatabase):
         )
 
     def get_snapshot_uuid(self, time_machine_uuid, name):
+        index = self.get_snapshot_index(time_machine_uuid)
+        if name not in index:
+            return None, "Snapshot with name {0} not found".format(name)
+        return index[name][0], None
+
+    def get_snapshot_index(self, time_machine_uuid):
+        """
+        This routine returns index of snapshot name to (uuid, timestamp) of latest
+        snapshot with that name in given time machine. Snapshots are listed without
+        details and decoded one by one, and index is cached for the module run.
+        Args:
+            time_machine_uuid (str): time machine uuid
+        Returns:
+            index (dict): snapshot name to (uuid, timestamp)
+        """
+        key = (self.module.params.get("nutanix_host"), time_machine_uuid)
+        index = _SNAPSHOT_INDEXES.get(key)
+        if index is not None:
+            return index
+
+        # ndb doesn't support filtering snapshots by name, so only
+        # light fields of all snapshots of time machine are listed
         query = {
             "value-type": "time-machine",
             "value": time_machine_uuid,
-            "detailed": True,
+            "detailed": False,
             "all": True,
         }
-
-        snapshots = self.read(query=query)
-        uuid = ""
-        if isinstance(snapshots, list):
+        index = {}
+        for snapshot in self.read_stream(query=query):
+            name = snapshot.get("name")
+            timestamp = snapshot.get("snapshotTimeStampDate") or 0
 
             # multiple snapshots can have same name
-            # check for latest snapshot with given name using latest timestamp
-            latest_timestamp = 0
-            for snapshot in snapshots:
-                if (
-                    snapshot.get("name") == name
-                    and snapshot.get("snapshotTimeStampDate") > latest_timestamp
-                ):
-                    uuid = snapshot.get("id")
-                    latest_timestamp = snapshot.get("snapshotTimeStampDate")
+            # keep latest snapshot with given name using latest timestamp
+            if name not in index or timestamp > index[name][1]:
+                index[name] = (snapshot.get("id"), timestamp)
 
-            if not uuid:
-                return None, "Snapshot with name {0} not found".format(name)
+        _SNAPSHOT_INDEXES[key] = index
+        return index
 
-        return uuid, None
+    def invalidate_snapshot_index(self, time_machine_uuid):
+        key = (self.module.params.get("nutanix_host"), time_machine_uuid)
+        _SNAPSHOT_INDEXES.pop(key, None)
 
     def _get_default_spec(self):
         return deepcopy({"name": ""})
@@ -182,13 +206,13 @@ class Snapshot(NutanixDatabase):
         return query_params
 
     def get_snapshots(self, query_params=None):
-        if query_params:
-            queries = self._build_query_params(query_params)
-            resp = self.read(query=queries)
-        else:
-            resp = self.read()
+        queries = self._build_query_params(query_params) if query_params else None
 
-        return resp
+        # snapshots are decoded one by one from response, as detailed response
+        # of all snapshots can be very large
+        resp = {}
+        snapshots = list(self.read_stream(query=queries, result=resp))
+        return resp or snapshots
 
     def get_snapshot_files(self, uuid):
         endpoint = "files"
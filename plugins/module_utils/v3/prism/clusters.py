@@ -4,6 +4,7 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+from ..uuid_cache import cache_uuids, get_cached_uuid
 from .prism import Prism
 
 
@@ -45,9 +46,14 @@ def get_cluster_uuid(config, module):
     if "name" in config:
         cluster = Cluster(module)
         name = config["name"]
-        clusters_name_uuid_map = cluster.get_all_clusters_name_uuid_map()
-        if clusters_name_uuid_map.get(name):
-            return clusters_name_uuid_map.get(name), None
+        uuid = get_cached_uuid(module, cluster.resource_path, name)
+        if not uuid:
+            # all clusters are listed anyway, so cache all of them
+            clusters_name_uuid_map = cluster.get_all_clusters_name_uuid_map()
+            cache_uuids(module, cluster.resource_path, clusters_name_uuid_map)
+            uuid = clusters_name_uuid_map.get(name)
+        if uuid:
+            return uuid, None
         else:
             error = "Cluster {0} not found.".format(name)
             return None, error
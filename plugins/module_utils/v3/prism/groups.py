@@ -4,6 +4,7 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+from ..uuid_cache import resolve_uuid
 from .prism import Prism
 
 
@@ -34,12 +35,58 @@ class Groups(Prism):
             return resp["group_results"][0]["entity_results"][0]["entity_id"]
         return None
 
+    def get_uuid_name_map(self, uuids, entity_type, attribute="name", batch_size=100):
+        """
+        This routine resolves given entity uuids to names using one groups call
+        per batch of uuids. Uuids not found are skipped.
+        Args:
+            uuids (list): entity uuids
+            entity_type (str): groups entity type, for example mh_vm
+            attribute (str): name attribute of entity type
+            batch_size (int): max uuids per groups call
+        Returns:
+            uuid_name_map (dict): uuid to name map of found entities
+        """
+        uuids = sorted(set(uuids))
+        uuid_name_map = {}
+        for i in range(0, len(uuids), batch_size):
+            batch = uuids[i : i + batch_size]
+            data = {
+                "entity_type": entity_type,
+                "entity_ids": batch,
+                "group_member_count": len(batch),
+                "group_member_attributes": [{"attribute": attribute}],
+            }
+            resp = self.list(data, use_base_url=True, raise_error=False) or {}
+            for group in resp.get("group_results") or []:
+                for entity in group.get("entity_results") or []:
+                    name = _get_attribute_value(entity, attribute)
+                    if entity.get("entity_id") in batch and name:
+                        uuid_name_map[entity["entity_id"]] = name
+        return uuid_name_map
+
+
+def _get_attribute_value(entity, attribute):
+    for item in entity.get("data") or []:
+        if item.get("name") != attribute:
+            continue
+        for value in item.get("values") or []:
+            if value.get("values"):
+                return value["values"][0]
+    return None
+
 
 def get_entity_uuid(config, module, key, entity_type):
     if "name" in config:
         groups = Groups(module)
         name = config["name"]
-        uuid = groups.get_uuid(value=name, key=key, entity_type=entity_type)
+        uuid = resolve_uuid(
+            module,
+            "{0}/{1}".format(groups.resource_path, entity_type),
+            name,
+            lambda: groups.get_uuid(value=name, key=key, entity_type=entity_type),
+            scope=key,
+        )
         if not uuid:
             entity_type = entity_type.replace("_", " ")
             error = "{0} {1} not found.".format(entity_type.capitalize(), name)
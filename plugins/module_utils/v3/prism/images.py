@@ -4,6 +4,7 @@ from __future__ import absolute_import, division, print_function
 
 from copy import deepcopy
 
+from ..uuid_cache import resolve_uuid
 from .clusters import Cluster
 from .prism import Prism
 from .spec.categories_mapping import CategoriesMapping
@@ -122,7 +123,9 @@ def get_image_uuid(config, module):
     if "name" in config:
         image = Image(module)
         name = config["name"]
-        uuid = image.get_uuid(name)
+        uuid = resolve_uuid(
+            module, image.resource_path, name, lambda: image.get_uuid(name)
+        )
         if not uuid:
             error = "Image {0} not found.".format(name)
             return None, error
@@ -25,6 +25,19 @@ class ProtectionRule(Prism):
     def get_affected_entities(self, rule_uuid):
         return self.read(uuid=rule_uuid, endpoint="query_entities")
 
+    def iter_affected_entities(self, rule_uuid, page_size=None, result=None):
+        """
+        This routine yields entities affected by protection rule one by one as
+        they are read, in pages of page_size if given. Refer read_pages_stream().
+        """
+        return self.read_pages_stream(
+            uuid=rule_uuid,
+            endpoint="query_entities",
+            items_key="entity_list",
+            page_size=page_size,
+            result=result,
+        )
+
     def _get_default_spec(self):
         return deepcopy(
             {
@@ -4,7 +4,7 @@ from __future__ import absolute_import, division, print_function
 
 from copy import deepcopy
 
-from ..prism.vms import get_vm_reference_spec
+from ..prism.vms import get_vm_reference_specs
 from .prism import Prism
 
 __metaclass__ = type
@@ -27,6 +27,20 @@ class RecoveryPlan(Prism):
     def get_associated_entities(self, recovery_plan_uuid):
         return self.read(uuid=recovery_plan_uuid, endpoint="entities")
 
+    def iter_associated_entities(self, recovery_plan_uuid, page_size=None, result=None):
+        """
+        This routine yields entities of recovery plan per availability zone one
+        by one as they are read, in pages of page_size if given. Refer
+        read_pages_stream().
+        """
+        return self.read_pages_stream(
+            uuid=recovery_plan_uuid,
+            endpoint="entities",
+            items_key="entities_per_availability_zone_list",
+            page_size=page_size,
+            result=result,
+        )
+
     def _get_default_spec(self):
         return deepcopy(
             {
@@ -56,6 +70,14 @@ class RecoveryPlan(Prism):
         return payload, None
 
     def _build_spec_stages(self, payload, stages):
+        # resolve vms of all stages together
+        vm_refs, err = get_vm_reference_specs(
+            [vm for stage in stages for vm in stage.get("vms", [])], self.module
+        )
+        if err:
+            return None, err
+        vm_refs = iter(vm_refs)
+
         stage_list = []
         for stage in stages:
             stage_spec = {
@@ -65,10 +87,7 @@ class RecoveryPlan(Prism):
             # for each stage add all vms and categories
             stage_entities = []
             for vm in stage.get("vms", []):
-                vm_ref, err = get_vm_reference_spec(vm, self.module)
-                if err:
-                    return None, err
-                vm_spec = {"any_entity_reference": vm_ref}
+                vm_spec = {"any_entity_reference": next(vm_refs)}
                 if vm.get("enable_script_exec"):
                     vm_spec["script_list"] = [
                         {"enable_script_exec": vm["enable_script_exec"]}
@@ -102,10 +121,13 @@ class RecoveryPlan(Prism):
 
         # set custom IP mappings for vms
         if config.get("custom_ip_config") and not are_network_stretched:
-            for ip_config in config["custom_ip_config"]:
-                vm_ref, err = get_vm_reference_spec(ip_config["vm"], self.module)
-                if err:
-                    return None, err
+            vm_refs, err = get_vm_reference_specs(
+                [ip_config["vm"] for ip_config in config["custom_ip_config"]],
+                self.module,
+            )
+            if err:
+                return None, err
+            for ip_config, vm_ref in zip(config["custom_ip_config"], vm_refs):
                 custom_ip_spec = {
                     "vm_reference": vm_ref,
                     "ip_config_list": [{"ip_address": ip_config["ip"]}],
@@ -281,14 +303,18 @@ class RecoveryPlan(Prism):
             floating_ip_assignment_spec["availability_zone_url"] = config[
                 "availability_zone_url"
             ]
+            vm_refs, err = get_vm_reference_specs(
+                [ip_spec["vm"] for ip_spec in config["vm_ip_assignments"]],
+                self.module,
+            )
+            if err:
+                return None, err
+
             vm_ip_assignment_specs = []
-            for ip_spec in config["vm_ip_assignments"]:
+            for ip_spec, vm_ref in zip(config["vm_ip_assignments"], vm_refs):
                 ip_assignment_spec = {}
 
                 # add vm reference
-                vm_ref, err = get_vm_reference_spec(ip_spec["vm"], self.module)
-                if err:
-                    return None, err
                 ip_assignment_spec["vm_reference"] = vm_ref
 
                 # add nic info
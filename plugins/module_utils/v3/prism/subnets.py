@@ -6,6 +6,7 @@ __metaclass__ = type
 
 from copy import deepcopy
 
+from ..uuid_cache import resolve_uuid
 from .clusters import get_cluster_uuid
 from .prism import Prism
 from .virtual_switches import get_dvs_uuid
@@ -161,19 +162,30 @@ def get_subnet_uuid(config, module):
 
         # incase subnet of particular cluster is needed
         if config.get("cluster_uuid"):
-            filter_spec = {"filter": "{0}=={1}".format("name", name)}
-            resp = subnet.list(data=filter_spec)
-            entities = resp.get("entities") if resp else None
-            if entities:
-                for entity in entities:
+
+            def get_cluster_subnet_uuid():
+                filter_spec = {"filter": "{0}=={1}".format("name", name)}
+                resp = subnet.list(data=filter_spec)
+                entities = resp.get("entities") if resp else None
+                for entity in entities or []:
                     if (
                         entity["status"].get("cluster_reference", {}).get("uuid")
                         == config["cluster_uuid"]
                     ):
-                        uuid = entity["metadata"]["uuid"]
-                        break
+                        return entity["metadata"]["uuid"]
+                return None
+
+            uuid = resolve_uuid(
+                module,
+                subnet.resource_path,
+                name,
+                get_cluster_subnet_uuid,
+                scope=config["cluster_uuid"],
+            )
         else:
-            uuid = subnet.get_uuid(name)
+            uuid = resolve_uuid(
+                module, subnet.resource_path, name, lambda: subnet.get_uuid(name)
+            )
 
         if not uuid:
             error = "Subnet {0} not found.".format(name)
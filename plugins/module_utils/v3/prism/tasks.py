@@ -4,8 +4,7 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-import time
-
+from ...poller import Poller
 from .prism import Prism
 
 
@@ -29,12 +28,13 @@ class Task(Prism):
     def get_uuid(self, name):
         raise NotImplementedError("get_uuid not permitted")
 
-    def wait_for_completion(self, uuid, raise_error=True):
-        state = ""
-        while state != "SUCCEEDED":
-            time.sleep(2)
+    def wait_for_completion(self, uuid, raise_error=True, max_delay=10):
+        poller = Poller.from_module(self.module, max_delay=max_delay)
+        for _ in poller:
             response = self.read(uuid, raise_error=raise_error)
             state = response.get("status")
+            if state == "SUCCEEDED":
+                break
             if state == "FAILED":
                 if not raise_error:
                     break
@@ -44,5 +44,11 @@ class Task(Prism):
                     error=response["error_detail"],
                     response=response,
                 )
+            poller.report_progress(response.get("percentage_complete"))
+        else:
+            self.module.fail_json(
+                msg="Timeout Error: Task did not complete in time",
+                response=response,
+            )
 
         return response
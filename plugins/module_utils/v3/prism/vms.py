@@ -10,13 +10,14 @@ from copy import deepcopy
 
 from ansible.module_utils.basic import _load_params
 
-from .clusters import Cluster, get_cluster_uuid
-from .groups import get_entity_uuid
-from .images import get_image_uuid
+from ..uuid_cache import cache_uuids, get_cached_uuid, resolve_uuid
+from .clusters import get_cluster_uuid
+from .groups import Groups, get_entity_uuid
+from .images import Image, get_image_uuid
 from .prism import Prism
 from .projects import Project
 from .spec.categories_mapping import CategoriesMapping
-from .subnets import get_subnet_uuid
+from .subnets import Subnet, get_subnet_uuid
 from .users import User
 
 
@@ -60,33 +61,40 @@ class VM(Prism):
     ):
         if fetch_all_vms or data.get("length", 0) > max_length:
             spec = deepcopy(data)
-            resp = {"entities": []}
-            total_matches = None
-            total_length = spec["length"]
-            spec["length"] = max_length
-            spec["offset"] = spec.get("offset", 0)
             if fetch_all_vms:
-                sub_resp = super(VM, self).list(spec)
-                total_length = sub_resp["metadata"].get("total_matches")
-            while True:
-                sub_resp = super(VM, self).list(spec)
-                resp["entities"].extend(sub_resp["entities"])
-                total_matches = sub_resp["metadata"].get("total_matches")
-                total_length -= max_length
-                if total_length <= 0:
-                    break
-                spec["length"] = (
-                    total_length if total_length < max_length else max_length
-                )
-                spec["offset"] += max_length
+                spec.pop("length", None)
+            sub_resp = self.list_pages(
+                data=spec,
+                endpoint=endpoint,
+                use_base_url=use_base_url,
+                page_size=max_length,
+                timeout=timeout,
+            )
+            if "entities" not in sub_resp:
+                return sub_resp
 
+            resp = {"entities": sub_resp["entities"]}
             resp["metadata"] = data
-            resp["metadata"]["total_matches"] = total_matches
+            resp["metadata"]["total_matches"] = sub_resp["metadata"].get(
+                "total_matches"
+            )
             resp["metadata"]["length"] = len(resp["entities"])
         else:
             resp = super(VM, self).list(data)
         return resp
 
+    def iter_list(self, data=None, max_length=500, fetch_all_vms=False):
+        """
+        This routine yields vms as per given list spec one by one, same as list()
+        but without holding all pages in memory.
+        """
+        if fetch_all_vms or data.get("length", 0) > max_length:
+            spec = deepcopy(data)
+            if fetch_all_vms:
+                spec.pop("length", None)
+            return self.iter_entities(data=spec, page_size=max_length)
+        return iter(super(VM, self).list(data).get("entities", []))
+
     @staticmethod
     def is_on(payload):
         return True if payload["spec"]["resources"]["power_state"] == "ON" else False
@@ -221,7 +229,12 @@ class VM(Prism):
         if "name" in param:
             project = Project(self.module)
             name = param["name"]
-            uuid = project.get_uuid(name)
+            uuid = resolve_uuid(
+                self.module,
+                project.resource_path,
+                name,
+                lambda: project.get_uuid(name),
+            )
             if not uuid:
                 error = "Project {0} not found.".format(name)
                 return None, error
@@ -274,8 +287,29 @@ class VM(Prism):
         payload["spec"]["resources"]["memory_size_mib"] = mem_mib
         return payload, None
 
+    def _prefetch_uuids(self, entity, names):
+        """
+        This routine resolves uncached names of given entity kind using batched
+        list calls, so that per NIC or disk lookups are served from cache.
+        """
+        kind = entity.resource_path
+        names = [
+            name for name in set(names) if not get_cached_uuid(self.module, kind, name)
+        ]
+        if len(names) > 1:
+            cache_uuids(self.module, kind, entity.get_name_uuid_map(names))
+
     def _build_spec_networks(self, payload, networks):
-        cluster_name_uuid_map = {}
+        self._prefetch_uuids(
+            Subnet(self.module),
+            [
+                network["subnet"]["name"]
+                for network in networks
+                if (network.get("subnet") or {}).get("name")
+                and not network["subnet"].get("uuid")
+                and not network["subnet"].get("cluster")
+            ],
+        )
 
         nics = []
         for network in networks:
@@ -319,13 +353,9 @@ class VM(Prism):
                         if network["subnet"]["cluster"].get("uuid"):
                             cluster_uuid = network["subnet"]["cluster"].get("uuid")
                         else:
-                            if not cluster_name_uuid_map:
-                                cluster = Cluster(self.module)
-                                cluster_name_uuid_map = (
-                                    cluster.get_all_clusters_name_uuid_map()
-                                )
-                            cluster_uuid = cluster_name_uuid_map.get(
-                                network["subnet"]["cluster"]["name"]
+                            cluster_uuid, _ = get_cluster_uuid(
+                                {"name": network["subnet"]["cluster"]["name"]},
+                                self.module,
                             )
 
                             if not cluster_uuid:
@@ -349,6 +379,16 @@ class VM(Prism):
         return payload, None
 
     def _build_spec_disks(self, payload, vdisks):
+        self._prefetch_uuids(
+            Image(self.module),
+            [
+                vdisk["clone_image"]["name"]
+                for vdisk in vdisks
+                if (vdisk.get("clone_image") or {}).get("name")
+                and not vdisk.get("storage_container")
+            ],
+        )
+
         device_indexes = {}
         existing_devise_indexes = list(
             map(
@@ -584,3 +624,64 @@ def get_vm_reference_spec(config, module):
 
     vm_ref_spec = {"kind": "vm", "name": name, "uuid": uuid}
     return vm_ref_spec, None
+
+
+def get_vm_reference_specs(configs, module):
+    """
+    This routine builds vm reference specs of many vms together. Names are
+    resolved using batched list calls and uuids using batched groups calls, so
+    that api calls don't grow per vm. All vms not found are reported together.
+    Args:
+        configs (list): vm configs having name and/or uuid
+        module (AnsibleModule): certain ansible module
+    Returns:
+        vm_ref_specs (list): vm reference specs in order of configs
+        error (str): error if any vm is not found
+    """
+    for config in configs:
+        if ("name" not in config) and ("uuid" not in config):
+            return None, "Provide name or uuid for building vm reference spec"
+
+    vm = VM(module)
+    kind = vm.resource_path
+
+    # resolve names to uuids
+    names = set(config["name"] for config in configs if "uuid" not in config)
+    uncached_names = [name for name in names if not get_cached_uuid(module, kind, name)]
+    if uncached_names:
+        cache_uuids(module, kind, vm.get_name_uuid_map(uncached_names, key="vm_name"))
+    name_uuid_map = {}
+    for name in names:
+        uuid = get_cached_uuid(module, kind, name)
+        if not uuid and set(name) & {",", ";"}:
+            # names having filter separators are not resolved in batches
+            uuid = resolve_uuid(
+                module, kind, name, lambda: vm.get_uuid(name, "vm_name")
+            )
+        name_uuid_map[name] = uuid
+
+    # resolve uuids to names
+    uuids = list(set(config["uuid"] for config in configs if "name" not in config))
+    uuid_name_map = {}
+    if uuids:
+        uuid_name_map = Groups(module).get_uuid_name_map(
+            uuids, entity_type="mh_vm", attribute="vm_name"
+        )
+
+    missing = sorted(
+        [name for name, uuid in name_uuid_map.items() if not uuid]
+        + [uuid for uuid in uuids if uuid not in uuid_name_map]
+    )
+    if missing:
+        return None, "VMs {0} not found.".format(", ".join(missing))
+
+    vm_ref_specs = []
+    for config in configs:
+        if "name" not in config:
+            name, uuid = uuid_name_map[config["uuid"]], config["uuid"]
+        elif "uuid" not in config:
+            name, uuid = config["name"], name_uuid_map[config["name"]]
+        else:
+            name, uuid = config["name"], config["uuid"]
+        vm_ref_specs.append({"kind": "vm", "name": name, "uuid": uuid})
+    return vm_ref_specs, None
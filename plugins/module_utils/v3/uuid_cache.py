@@ -0,0 +1,260 @@
+# Copyright: (c) 2026, Nutanix
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import stat
+import tempfile
+import time
+
+# Name to uuid resolutions done during current module run, keyed by
+# (connection key, kind, scope, name). Spec builders resolve same cluster,
+# subnet or image names for every disk and NIC, so each name is looked up
+# once per module run.
+_UUID_CACHE = {}
+
+# connection keys for which on-disk cache was already loaded
+_LOADED_DISK_CACHES = set()
+
+# Names resolved through groups api are cached as kind groups/<entity type>.
+# They are dropped along with v3 kind whose changes make them stale. Entity
+# types not changed through v3 apis, like storage_container, are cached only
+# in memory, as nothing would drop them from on-disk cache.
+GROUPS_ENTITY_TYPES = {
+    "clusters": ["cluster"],
+    "images": ["image"],
+    "subnets": ["subnet"],
+    "vms": ["mh_vm", "vm"],
+}
+
+
+def get_disk_cache_ttl():
+    """
+    This routine returns ttl in seconds of on-disk uuid cache shared across
+    module invocations as per NUTANIX_UUID_CACHE_TTL environment variable.
+    On-disk cache is disabled if ttl is 0, which is default.
+    """
+    try:
+        ttl = int(os.environ.get("NUTANIX_UUID_CACHE_TTL", 0))
+    except ValueError:
+        return 0
+    return max(ttl, 0)
+
+
+def _get_connection_key(module):
+    params = module.params
+    key = "{0}:{1}:{2}:{3}".format(
+        params.get("nutanix_host") or "",
+        params.get("nutanix_port") or "",
+        params.get("nutanix_username") or "",
+        params.get("nutanix_api_key") or "",
+    )
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def _get_disk_cache_path(connection_key):
+    # per user directory, so that cache of other users is never read
+    cache_dir = os.environ.get("NUTANIX_UUID_CACHE_DIR") or os.path.join(
+        tempfile.gettempdir(), "nutanix_uuid_cache_{0}".format(os.getuid())
+    )
+    return os.path.join(cache_dir, "{0}.json".format(connection_key[:32]))
+
+
+def _is_private(st):
+    """Whether file stat is of file owned by and only writable by current user."""
+    return st.st_uid == os.getuid() and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def _is_private_dir(path):
+    # lstat, so that symlinks to directories of other users are not trusted
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISDIR(st.st_mode) and _is_private(st) and not st.st_mode & 0o077
+
+
+def _read_disk_cache(connection_key):
+    path = _get_disk_cache_path(connection_key)
+    if not _is_private_dir(os.path.dirname(path)):
+        return {}
+    try:
+        with open(path) as f:
+            st = os.fstat(f.fileno())
+            if not stat.S_ISREG(st.st_mode) or not _is_private(st):
+                return {}
+            entries = json.load(f)
+    except (IOError, OSError, ValueError):
+        return {}
+    if not isinstance(entries, dict):
+        return {}
+    now = time.time()
+    return dict(
+        (key, value)
+        for key, value in entries.items()
+        if isinstance(value, list) and len(value) == 2 and value[1] > now
+    )
+
+
+def _write_disk_cache(connection_key, entries):
+    path = _get_disk_cache_path(connection_key)
+    try:
+        cache_dir = os.path.dirname(path)
+        if not os.path.lexists(cache_dir):
+            os.makedirs(cache_dir, 0o700)
+        # directory created by someone else can't be trusted
+        if not _is_private_dir(cache_dir):
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+        with os.fdopen(fd, "w") as f:
+            json.dump(entries, f)
+        # atomic replace so that parallel module runs never read partial file
+        os.rename(tmp_path, path)
+    except (IOError, OSError):
+        # cache is best effort
+        pass
+
+
+def _get_disk_key(kind, scope, name):
+    return json.dumps([kind, scope, name])
+
+
+def _get_disk_key_kind(key):
+    try:
+        return json.loads(key)[0]
+    except (ValueError, TypeError, IndexError):
+        return None
+
+
+def _get_groups_kinds(kind):
+    """Kinds of groups api lookups which are made stale by changes of kind."""
+    base, _, name = kind.rpartition("/")
+    return [
+        "{0}/groups/{1}".format(base, entity_type)
+        for entity_type in GROUPS_ENTITY_TYPES.get(name, [])
+    ]
+
+
+def _is_persistent(kind):
+    base, _, name = kind.rpartition("/")
+    if not base.endswith("/groups"):
+        return True
+    return any(name in entity_types for entity_types in GROUPS_ENTITY_TYPES.values())
+
+
+def _load_disk_cache(connection_key):
+    if connection_key in _LOADED_DISK_CACHES:
+        return
+    _LOADED_DISK_CACHES.add(connection_key)
+    if not get_disk_cache_ttl():
+        return
+    for key, value in _read_disk_cache(connection_key).items():
+        try:
+            kind, scope, name = json.loads(key)
+        except (ValueError, TypeError):
+            continue
+        _UUID_CACHE.setdefault((connection_key, kind, scope, name), value[0])
+
+
+def get_cached_uuid(module, kind, name, scope=None):
+    """
+    This routine returns cached uuid of entity of given kind and name.
+    Args:
+        module (AnsibleModule): certain ansible module
+        kind (str): entity kind, for example clusters or subnets
+        name (str): entity name
+        scope (str): optional scope of name, for example cluster uuid
+    Returns:
+        uuid (str): uuid, None if not cached
+    """
+    connection_key = _get_connection_key(module)
+    _load_disk_cache(connection_key)
+    return _UUID_CACHE.get((connection_key, kind, scope, name))
+
+
+def cache_uuids(module, kind, name_uuid_map, scope=None):
+    """
+    This routine caches name to uuid mappings of entities of given kind.
+    Mappings are also written to on-disk cache if it is enabled.
+    Args:
+        module (AnsibleModule): certain ansible module
+        kind (str): entity kind, for example clusters or subnets
+        name_uuid_map (dict): entity name to uuid map
+        scope (str): optional scope of names, for example cluster uuid
+    """
+    if not name_uuid_map:
+        return
+    connection_key = _get_connection_key(module)
+    for name, uuid in name_uuid_map.items():
+        if name and uuid:
+            _UUID_CACHE[(connection_key, kind, scope, name)] = uuid
+
+    ttl = get_disk_cache_ttl()
+    if ttl and _is_persistent(kind):
+        entries = _read_disk_cache(connection_key)
+        expiry = time.time() + ttl
+        for name, uuid in name_uuid_map.items():
+            if name and uuid:
+                entries[_get_disk_key(kind, scope, name)] = [uuid, expiry]
+        _write_disk_cache(connection_key, entries)
+
+
+def resolve_uuid(module, kind, name, lookup, scope=None):
+    """
+    This routine returns uuid of entity of given kind and name from cache,
+    else resolves it using lookup() and caches it. Not found entities are
+    never cached.
+    Args:
+        module (AnsibleModule): certain ansible module
+        kind (str): entity kind, for example clusters or subnets
+        name (str): entity name
+        lookup (callable): callable returning uuid, None if not found
+        scope (str): optional scope of name, for example cluster uuid
+    Returns:
+        uuid (str): uuid, None if not found
+    """
+    uuid = get_cached_uuid(module, kind, name, scope=scope)
+    if uuid:
+        return uuid
+    uuid = lookup()
+    if uuid:
+        cache_uuids(module, kind, {name: uuid}, scope=scope)
+    return uuid
+
+
+def invalidate_uuids(module, kind):
+    """
+    This routine drops cached uuids of entities of given kind, along with ones
+    of same entities resolved through groups api, to be used once entities of
+    given kind are created, updated or deleted.
+    Args:
+        module (AnsibleModule): certain ansible module
+        kind (str): entity kind, for example clusters or subnets
+    """
+    connection_key = _get_connection_key(module)
+    kinds = set([kind] + _get_groups_kinds(kind))
+    for key in [k for k in _UUID_CACHE if k[0] == connection_key and k[1] in kinds]:
+        _UUID_CACHE.pop(key, None)
+
+    if get_disk_cache_ttl():
+        entries = _read_disk_cache(connection_key)
+        remaining = dict(
+            (key, value)
+            for key, value in entries.items()
+            if _get_disk_key_kind(key) not in kinds
+        )
+        if len(remaining) != len(entries):
+            _write_disk_cache(connection_key, remaining)
+
+
+def clear_uuid_cache():
+    """
+    This routine drops all uuids cached in memory.
+    """
+    _UUID_CACHE.clear()
+    _LOADED_DISK_CACHES.clear()
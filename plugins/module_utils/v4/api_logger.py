@@ -11,6 +11,8 @@ import time
 import warnings
 from datetime import datetime
 
+from ..api_stats import API_STATS
+from ..connection_pool import get_connection_stats
 from ..constants import DEFAULT_LOG_FILE
 
 
@@ -43,6 +45,7 @@ class APILogger:
         status_code=None,
         elapsed_time=None,
         error=None,
+        connection_reused=None,
     ):
         """
         Log detailed information about an API call.
@@ -56,6 +59,7 @@ class APILogger:
             status_code (int): HTTP status code
             elapsed_time (float): Time taken for the request in seconds
             error (Exception): Any exception that occurred
+            connection_reused (bool): Whether a pooled keep-alive connection was reused
         """
         if not self.enabled:
             return
@@ -79,6 +83,9 @@ class APILogger:
         # Add request body
         self._log_request_body(log_lines, body)
 
+        # Add connection pool details
+        self._log_connection(log_lines, connection_reused)
+
         # Add response details
         self._log_response(log_lines, response, status_code, elapsed_time)
 
@@ -91,6 +98,16 @@ class APILogger:
         # Write log message to all outputs
         self._write_log("\n".join(log_lines))
 
+    def log_message(self, message):
+        """
+        Log a timestamped message, for example progress of long running operations.
+        Args:
+            message (str): message to log
+        """
+        if not self.enabled:
+            return
+        self._write_log("{} {}".format(datetime.now().isoformat(), message))
+
     def _log_query_params(self, log_lines, query_params):
         """Add query parameters to log lines."""
         if not query_params:
@@ -137,6 +154,21 @@ class APILogger:
         else:
             log_lines.append("  (empty)")
 
+    def _log_connection(self, log_lines, connection_reused):
+        """Add connection reuse details and pool statistics to log lines."""
+        if connection_reused is None:
+            return
+
+        log_lines.append(
+            "CONNECTION: {}".format("reused" if connection_reused else "new")
+        )
+        for stats in get_connection_stats():
+            log_lines.append(
+                "  {host}: {requests} requests over {connections} connections ({reused} reused)".format(
+                    **stats
+                )
+            )
+
     def _log_response(self, log_lines, response, status_code, elapsed_time):
         """Add response details to log lines."""
         if status_code is not None:
@@ -400,59 +432,15 @@ class LoggedRequestHandler:
             )
 
             elapsed = time.time() - start_time
+            status_code = response.status if hasattr(response, "status") else None
+            self._record_stats(
+                method, url, body, response, status_code, elapsed, _preload_content
+            )
 
-            # Try to get response data (handle different response types)
-            response_data = None
-
-            # Skip reading response body for file downloads to avoid consuming the stream
-            # The SDK needs to stream file downloads, so we must not read the body here
-            content_type = None
-            if hasattr(response, "getheader"):
-                content_type = response.getheader("Content-Type")
-            file_download_types = [
-                "application/octet-stream",
-                "application/pdf",
-                "application/zip",
-            ]
-            is_file_download = content_type in file_download_types
-
-            if is_file_download:
-                content_length = (
-                    response.getheader("Content-Length")
-                    if hasattr(response, "getheader")
-                    else None
-                )
-                if content_length:
-                    response_data = (
-                        "(binary file download - {} bytes - body not logged)".format(
-                            content_length
-                        )
-                    )
-                else:
-                    response_data = "(binary file download - body not logged)"
-            elif hasattr(response, "data"):
-                response_data = response.data
-                # If data is bytes, try to decode it
-                if isinstance(response_data, bytes):
-                    try:
-                        response_data = response_data.decode("utf-8")
-                    except Exception:
-                        pass
-                # If data is still None, try to read from urllib3_response
-                if response_data is None and hasattr(response, "urllib3_response"):
-                    try:
-                        response_data = response.urllib3_response.data
-                        if isinstance(response_data, bytes):
-                            response_data = response_data.decode("utf-8")
-                    except Exception:
-                        pass
-            elif hasattr(response, "text"):
-                response_data = response.text
-            elif hasattr(response, "content"):
-                try:
-                    response_data = response.content.decode("utf-8")
-                except Exception:
-                    response_data = str(response.content)
+            if not self.logger.enabled:
+                return response
+
+            response_data = self._get_response_data(response)
 
             # Log the successful call
             self.logger.log_api_call(
@@ -462,7 +450,7 @@ class LoggedRequestHandler:
                 headers=headers,
                 body=body,
                 response=response_data,
-                status_code=response.status if hasattr(response, "status") else None,
+                status_code=status_code,
                 elapsed_time=elapsed,
             )
 
@@ -470,6 +458,9 @@ class LoggedRequestHandler:
 
         except Exception as e:
             elapsed = time.time() - start_time
+            API_STATS.record_api_call(
+                method, url, getattr(e, "status", None), elapsed, body
+            )
 
             # Log the failed call
             self.logger.log_api_call(
@@ -486,6 +477,85 @@ class LoggedRequestHandler:
             # Re-raise the original exception to preserve error details
             raise
 
+    @staticmethod
+    def _get_response_data(response):
+        """Response body to be logged, file downloads are not read."""
+        # Try to get response data (handle different response types)
+        response_data = None
+
+        # Skip reading response body for file downloads to avoid consuming the stream
+        # The SDK needs to stream file downloads, so we must not read the body here
+        content_type = None
+        if hasattr(response, "getheader"):
+            content_type = response.getheader("Content-Type")
+        file_download_types = [
+            "application/octet-stream",
+            "application/pdf",
+            "application/zip",
+        ]
+        is_file_download = content_type in file_download_types
+
+        if is_file_download:
+            content_length = (
+                response.getheader("Content-Length")
+                if hasattr(response, "getheader")
+                else None
+            )
+            if content_length:
+                response_data = (
+                    "(binary file download - {} bytes - body not logged)".format(
+                        content_length
+                    )
+                )
+            else:
+                response_data = "(binary file download - body not logged)"
+        elif hasattr(response, "data"):
+            response_data = response.data
+            # If data is bytes, try to decode it
+            if isinstance(response_data, bytes):
+                try:
+                    response_data = response_data.decode("utf-8")
+                except Exception:
+                    pass
+            # If data is still None, try to read from urllib3_response
+            if response_data is None and hasattr(response, "urllib3_response"):
+                try:
+                    response_data = response.urllib3_response.data
+                    if isinstance(response_data, bytes):
+                        response_data = response_data.decode("utf-8")
+                except Exception:
+                    pass
+        elif hasattr(response, "text"):
+            response_data = response.text
+        elif hasattr(response, "content"):
+            try:
+                response_data = response.content.decode("utf-8")
+            except Exception:
+                response_data = str(response.content)
+
+        return response_data
+
+    @staticmethod
+    def _record_stats(
+        method, url, body, response, status_code, elapsed, preload_content=True
+    ):
+        if not API_STATS.enabled:
+            return
+        bytes_received = None
+        if hasattr(response, "getheader"):
+            bytes_received = response.getheader("Content-Length")
+        # response which is not preloaded is raw urllib3 response, reading its
+        # data would consume the stream the SDK is going to read
+        if (
+            bytes_received is None
+            and preload_content
+            and isinstance(getattr(response, "data", None), bytes)
+        ):
+            bytes_received = len(response.data)
+        API_STATS.record_api_call(
+            method, url, status_code, elapsed, body, bytes_received
+        )
+
 
 def setup_api_logging(module, api_client):
     """
@@ -499,7 +569,7 @@ def setup_api_logging(module, api_client):
     """
     logger = APILogger(module)
 
-    if not logger.enabled:
+    if not logger.enabled and not API_STATS.enabled:
         return logger
 
     # Get the REST client from the API client
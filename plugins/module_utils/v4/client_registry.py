@@ -0,0 +1,105 @@
+# Copyright: (c) 2026, Nutanix
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import hashlib
+import threading
+
+from .utils import _get_proxy_url
+
+# SDK api clients built during current module run, keyed by
+# (namespace, host, port, credentials, proxy, verify_ssl, read_timeout).
+# Reusing a client keeps its urllib3 connection pool alive across all api
+# instances and task polling and skips the costly SDK client construction.
+_API_CLIENTS = {}
+_REGISTRY_STATS = {"hits": 0, "misses": 0}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def _get_credentials_digest(module):
+    """
+    This routine returns digest of credentials so that plain text credentials
+    are not kept as part of registry keys.
+    """
+    params = module.params
+    cred = "{0}:{1}:{2}".format(
+        params.get("nutanix_username") or "",
+        params.get("nutanix_password") or "",
+        params.get("nutanix_api_key") or "",
+    )
+    return hashlib.sha256(cred.encode("utf-8")).hexdigest()
+
+
+def get_api_client_key(module, namespace):
+    """
+    This routine returns registry key of api client for given SDK namespace.
+    Args:
+        module (AnsibleModule): certain ansible module
+        namespace (str): SDK namespace, for example vmm, prism or clustermgmt
+    Returns:
+        key (tuple): registry key
+    """
+    params = module.params
+    proxy = (
+        _get_proxy_url(module),
+        params.get("no_proxy"),
+        params.get("proxy_username"),
+        params.get("proxy_password"),
+    )
+    return (
+        namespace,
+        params.get("nutanix_host"),
+        params.get("nutanix_port"),
+        _get_credentials_digest(module),
+        proxy,
+        params.get("validate_certs"),
+        params.get("read_timeout"),
+    )
+
+
+def get_cached_api_client(module, namespace, build_client):
+    """
+    This routine returns api client of given SDK namespace from registry and
+    builds it using build_client() only once per registry key.
+    Args:
+        module (AnsibleModule): certain ansible module
+        namespace (str): SDK namespace, for example vmm, prism or clustermgmt
+        build_client (callable): callable returning new api client
+    Returns:
+        client (object): api client object
+    """
+    key = get_api_client_key(module, namespace)
+    with _REGISTRY_LOCK:
+        client = _API_CLIENTS.get(key)
+        if client is not None:
+            _REGISTRY_STATS["hits"] += 1
+            return client
+        _REGISTRY_STATS["misses"] += 1
+        client = build_client()
+        _API_CLIENTS[key] = client
+    return client
+
+
+def get_api_client_registry_stats():
+    """
+    This routine returns hit/miss counters of api client registry.
+    Returns:
+        stats (dict): hits, misses and number of cached clients
+    """
+    with _REGISTRY_LOCK:
+        stats = dict(_REGISTRY_STATS)
+        stats["clients"] = len(_API_CLIENTS)
+    return stats
+
+
+def clear_api_client_registry():
+    """
+    This routine drops all cached api clients and resets counters.
+    """
+    with _REGISTRY_LOCK:
+        _API_CLIENTS.clear()
+        _REGISTRY_STATS["hits"] = 0
+        _REGISTRY_STATS["misses"] = 0
@@ -8,9 +8,11 @@ __metaclass__ = type
 import traceback
 from copy import deepcopy
 
+from ...sdk_loader import lazy_import
+
 SDK_IMP_ERROR = None
 try:
-    import ntnx_clustermgmt_py_client as clusters_sdk  # noqa: E402
+    clusters_sdk = lazy_import("ntnx_clustermgmt_py_client")
 except ImportError:
     from ....v4.sdk_mock import mock_sdk as clusters_sdk  # noqa: E402
 
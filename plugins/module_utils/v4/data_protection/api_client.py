@@ -12,16 +12,29 @@ from ansible.module_utils.basic import missing_required_lib
 
 from ...constants import ALLOW_VERSION_NEGOTIATION
 from ..api_logger import setup_api_logging
+from ..client_registry import get_cached_api_client
+from ..sdk_loader import lazy_import
 from ..utils import _apply_proxy_from_env
 
 SDK_IMP_ERROR = None
 try:
-    import ntnx_dataprotection_py_client
+    ntnx_dataprotection_py_client = lazy_import("ntnx_dataprotection_py_client")
 except ImportError:
     SDK_IMP_ERROR = traceback.format_exc()
 
 
 def get_api_client(module):
+    """
+    This method will return client to be used in api connection using
+    given connection details. Client is built once per module run and shared
+    by all api instances and task polling with same connection details.
+    """
+    return get_cached_api_client(
+        module, "dataprotection", lambda: _build_api_client(module)
+    )
+
+
+def _build_api_client(module):
     """
     This method will return client to be used in api connection using
     given connection details.
@@ -48,17 +61,14 @@ def get_api_client(module):
         config.username = nutanix_username
         config.password = nutanix_password
     config.verify_ssl = module.params.get("validate_certs")
+    config.read_timeout = module.params.get("read_timeout")
+    _apply_proxy_from_env(config, module)
     try:
         client = ntnx_dataprotection_py_client.ApiClient(
             configuration=config, allow_version_negotiation=ALLOW_VERSION_NEGOTIATION
         )
     except TypeError:
         client = ntnx_dataprotection_py_client.ApiClient(configuration=config)
-    config.read_timeout = module.params.get("read_timeout")
-    _apply_proxy_from_env(config, module)
-    client = ntnx_dataprotection_py_client.ApiClient(
-        configuration=config, allow_version_negotiation=ALLOW_VERSION_NEGOTIATION
-    )
 
     if not api_key:
         cred = "{0}:{1}".format(config.username, config.password)
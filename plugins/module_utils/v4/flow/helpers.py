@@ -5,8 +5,23 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import hashlib  # noqa: E402
+import json  # noqa: E402
+from collections import Counter, defaultdict  # noqa: E402
+
 from ..utils import raise_api_exception  # noqa: E402
 
+# category references of security rule spec and their associated entity type,
+# which is not significant when references are not set
+RULE_CATEGORY_REFERENCES = [
+    ("src_category_references", "src_category_associated_entity_type"),
+    ("dest_category_references", "dest_category_associated_entity_type"),
+    (
+        "secured_group_category_references",
+        "secured_group_category_associated_entity_type",
+    ),
+]
+
 
 def get_network_security_policy(module, api_instance, ext_id):
     """
@@ -102,3 +117,78 @@ def strip_service_group_extra_attributes(obj):
         setattr(obj, field, None)
 
     return obj
+
+
+def _get_canonical_json(value):
+    """
+    This routine returns json of given value with keys sorted and list items
+    sorted, as order of references, services and ranges in rules is not significant.
+    """
+    if isinstance(value, dict):
+        return (
+            "{"
+            + ",".join(
+                json.dumps(k) + ":" + _get_canonical_json(value[k])
+                for k in sorted(value)
+            )
+            + "}"
+        )
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(sorted(_get_canonical_json(v) for v in value)) + "]"
+    return json.dumps(value, default=str)
+
+
+def get_security_rule_fingerprint(rule):
+    """
+    This method will return order independent fingerprint of security policy rule.
+    ext_id of rule is ignored, as update overrides all existing rules, and so
+    is associated entity type of category references which are not set.
+    Args:
+        rule (dict): security policy rule
+    return:
+        fingerprint (str): sha1 hex digest of canonical rule
+    """
+    rule = dict(rule, ext_id=None)
+    spec = rule.get("spec")
+    if isinstance(spec, dict):
+        spec = dict(spec)
+        for references, entity_type in RULE_CATEGORY_REFERENCES:
+            if references in spec and spec[references] is None:
+                spec[entity_type] = None
+        rule["spec"] = spec
+    canonical_rule = _get_canonical_json(rule).encode("utf-8")
+    return hashlib.sha1(canonical_rule).hexdigest()
+
+
+def diff_security_rules(old_rules, new_rules):
+    """
+    This method will compare rules of security policy as multisets of rule
+    fingerprints, so that comparison is linear in number of rules.
+    Args:
+        old_rules (list): rules of current security policy
+        new_rules (list): rules of updated security policy
+    return:
+        diff (dict): added and removed rules, and count of unchanged rules
+    """
+    old_by_fingerprint = defaultdict(list)
+    for rule in old_rules or []:
+        old_by_fingerprint[get_security_rule_fingerprint(rule)].append(rule)
+
+    added = []
+    unchanged = Counter()
+    for rule in new_rules or []:
+        fingerprint = get_security_rule_fingerprint(rule)
+        if unchanged[fingerprint] < len(old_by_fingerprint.get(fingerprint, [])):
+            unchanged[fingerprint] += 1
+        else:
+            added.append(rule)
+
+    removed = []
+    for fingerprint, rules in old_by_fingerprint.items():
+        removed.extend(rules[unchanged[fingerprint] :])
+
+    return {
+        "added": added,
+        "removed": removed,
+        "unchanged": sum(unchanged.values()),
+    }
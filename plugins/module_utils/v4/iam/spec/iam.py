@@ -8,10 +8,12 @@ __metaclass__ = type
 import traceback
 from copy import deepcopy
 
+from ...sdk_loader import lazy_import
+
 SDK_IMP_ERROR = None
 
 try:
-    import ntnx_iam_py_client as iam_sdk  # noqa: E402
+    iam_sdk = lazy_import("ntnx_iam_py_client")
 except ImportError:
 
     from ...sdk_mock import mock_sdk as iam_sdk  # noqa: E402
@@ -7,9 +7,11 @@ __metaclass__ = type
 import traceback
 from copy import deepcopy
 
+from ...sdk_loader import lazy_import
+
 SDK_IMP_ERROR = None
 try:
-    import ntnx_objects_py_client as objects_sdk  # noqa: E402
+    objects_sdk = lazy_import("ntnx_objects_py_client")
 except ImportError:
 
     from ...sdk_mock import mock_sdk as objects_sdk  # noqa: E402
@@ -3,9 +3,8 @@
 
 from __future__ import absolute_import, division, print_function
 
-from copy import deepcopy
-
-from ..utils import strip_internal_attributes  # noqa: E40
+from ..sdk_loader import lazy_import  # noqa: E40
+from ..utils import raise_api_exception, strip_internal_attributes  # noqa: E40
 
 __metaclass__ = type
 
@@ -15,20 +14,47 @@ import traceback  # noqa: E40
 
 PRISM_SDK_IMP_ERROR = None
 try:
-    import ntnx_prism_py_client  # noqa: E40
+    ntnx_prism_py_client = lazy_import("ntnx_prism_py_client")
 except ImportError:
     PRISM_SDK_IMP_ERROR = traceback.format_exc()
 
 
+from ...api_stats import API_STATS  # noqa: E40
+from ...poller import Poller  # noqa: E40
 from ..constants import Tasks  # noqa: E40
 from .pc_api_client import get_pc_api_client  # noqa: E40
 
+# tasks fetched per list call while waiting for multiple tasks
+TASKS_BATCH_SIZE = 100
+
+TASK_FAILURE_STATUSES = ["FAILED", "CANCELED"]
+TASK_TIMEOUT_ERROR = "Timeout Error: Task did not complete in time"
+TASKS_LIST_ERROR = "Api Exception raised while fetching tasks"
+
+
+def _is_transient_error(exception):
+    """Errors of tasks list call which are retried in next poll cycle."""
+    status = getattr(exception, "status", None)
+    return not status or status == 429 or status >= 500
+
+
+def _get_task_attr(task, attr):
+    if isinstance(task, dict):
+        return task.get(attr)
+    return getattr(task, attr, None)
+
+
+def _task_to_dict(task):
+    if task is None or isinstance(task, dict):
+        return task
+    return strip_internal_attributes(task.to_dict())
+
 
 def wait_for_completion(
     module,
     ext_id,
     task_service=None,
-    polling_gap=2,
+    polling_gap=10,
     raise_error=True,
     add_task_service=False,
 ):
@@ -38,7 +64,8 @@ def wait_for_completion(
         module: The Ansible module.
         ext_id: The external ID of the task.
         task_service: The service of the task.
-        polling_gap: The time interval between polling.
+        polling_gap: The max time interval between polling. Polling starts
+            immediately and backs off exponentially up to this gap.
         raise_error: Flag to raise an error if the task fails.
         add_task_service: Flag to add the task service to the external ID.
     Returns:
@@ -56,44 +83,134 @@ def wait_for_completion(
                 base64.b64encode(Tasks.TASK_SERVICE.encode()).decode() + ":" + ext_id
             )
 
-    status = ""
-
-    timeout_time = None
-    if module.params.get("timeout", None):
-        timeout_time = time.time() + module.params.get("timeout")
-
-    while status != "SUCCEEDED":
+    poller = Poller.from_module(module, max_delay=polling_gap)
+    for _ in poller:
         task = tasks.get_task_by_id(ext_id).data
-        # convert to dict to output as module output in case of errors
-        resp = deepcopy(task)
-        if not isinstance(resp, dict):
-            resp = resp.to_dict()
-
-        status = resp["status"]
+        status = _get_task_attr(task, "status")
 
+        # task is converted to dict only to output as module output in case of errors
         if not status:
             module.fail_json(
                 msg="Unable to fetch task status",
-                response=strip_internal_attributes(resp),
+                response=_task_to_dict(task),
             )
+        if status == "SUCCEEDED":
+            break
         if status == "FAILED":
             if not raise_error:
                 break
             module.fail_json(
                 msg="Task Failed",
-                response=strip_internal_attributes(resp),
+                response=_task_to_dict(task),
             )
-        time.sleep(polling_gap)
-        if timeout_time:
-            if time.time() > timeout_time:
-                module.fail_json(
-                    msg="Timeout Error: Task did not complete in time",
-                    response=strip_internal_attributes(resp),
-                )
+        poller.report_progress(_get_task_attr(task, "progress_percentage"))
+    else:
+        module.fail_json(
+            msg=TASK_TIMEOUT_ERROR,
+            response=_task_to_dict(task),
+        )
 
     return task
 
 
+def _list_tasks(tasks, ext_ids):
+    """
+    Fetch given tasks using extId filter, one list call per TASKS_BATCH_SIZE tasks.
+    Returns map of task ext_id to task.
+    """
+    found = {}
+    for i in range(0, len(ext_ids), TASKS_BATCH_SIZE):
+        batch = ext_ids[i : i + TASKS_BATCH_SIZE]
+        filter = "extId in ({0})".format(
+            ",".join("'{0}'".format(ext_id) for ext_id in batch)
+        )
+        resp = tasks.list_tasks(_filter=filter, _limit=len(batch))
+        for task in getattr(resp, "data", None) or []:
+            found[_get_task_attr(task, "ext_id")] = task
+    return found
+
+
+def wait_for_tasks(
+    module,
+    ext_ids,
+    polling_gap=10,
+    task_timeout=None,
+    timeout=None,
+    first_completed=False,
+):
+    """
+    Wait for multiple tasks to complete. All unfinished tasks are polled together
+    using tasks list api with extId filter, in one call per poll cycle (per 100 tasks).
+    Args:
+        module: The Ansible module.
+        ext_ids: The external IDs of the tasks.
+        polling_gap: The max time interval between polling.
+        task_timeout: Max seconds a task can run, counted from when it is first
+            seen running, so that queued tasks don't use up their time.
+        timeout: Global deadline in seconds for all tasks, module param timeout
+            is used if not given.
+        first_completed: Return after first poll cycle in which any task
+            finished, once all tasks finished in that cycle are yielded. Used
+            to refill a window of running tasks as soon as it has room.
+    Transient failures of tasks list call, like timeouts and 5xx errors, are
+    retried in next poll cycle. Module fails if they last till the deadline.
+    Yields:
+        (ext_id, task, err): for every task in order of completion. err is None
+            if task succeeded, else error message. task is None if it was never
+            fetched.
+    """
+    api_client = get_pc_api_client(module=module)
+    tasks = ntnx_prism_py_client.TasksApi(api_client=api_client)
+
+    pending = list(dict.fromkeys(ext_ids))
+    last_seen = {}
+    running_since = {}
+    list_error = None
+    poller = Poller.from_module(module, timeout=timeout, max_delay=polling_gap)
+    for _ in poller:
+        try:
+            found = _list_tasks(tasks, pending)
+        except Exception as e:
+            if not _is_transient_error(e):
+                raise_api_exception(module=module, exception=e, msg=TASKS_LIST_ERROR)
+            API_STATS.record_retry()
+            list_error = e
+            continue
+        list_error = None
+        last_seen.update(found)
+        now = poller.elapsed()
+        unfinished = []
+        progress = []
+        for ext_id in pending:
+            task = found.get(ext_id)
+            status = _get_task_attr(task, "status")
+            if status == "SUCCEEDED":
+                yield ext_id, task, None
+                continue
+            if status in TASK_FAILURE_STATUSES:
+                yield ext_id, task, "Task {0}".format(status.capitalize())
+                continue
+            if status and status != "QUEUED":
+                running_since.setdefault(ext_id, now)
+            if task_timeout and now - running_since.get(ext_id, now) >= task_timeout:
+                yield ext_id, task, TASK_TIMEOUT_ERROR
+                continue
+            unfinished.append(ext_id)
+            progress.append(_get_task_attr(task, "progress_percentage") or 0)
+
+        finished = len(pending) - len(unfinished)
+        pending = unfinished
+        if not pending or (first_completed and finished):
+            return
+        # next poll as per slowest task
+        poller.report_progress(min(progress))
+
+    if list_error is not None:
+        raise_api_exception(module=module, exception=list_error, msg=TASKS_LIST_ERROR)
+    for ext_id in pending:
+        yield ext_id, last_seen.get(ext_id), TASK_TIMEOUT_ERROR
+
+
 def get_entity_ext_id_from_task(data, rel=None):
     """
     Get the external ID of an entity from a task.
@@ -163,6 +280,7 @@ def wait_for_entity_ext_id_in_task(module, ext_id, rel, time_out=300):
         entity_ext_id = get_entity_ext_id_from_task(data=data, rel=rel)
         if entity_ext_id:
             return entity_ext_id, err
+        API_STATS.record_poll_sleep(2)
         time.sleep(2)
         time_out -= 2
         data = wait_for_completion(module=module, ext_id=ext_id)
@@ -0,0 +1,90 @@
+# Copyright: (c) 2026, Nutanix
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import importlib
+import importlib.util
+
+
+class LazyAttribute(object):
+    """
+    Reference to attribute of SDK package, for example a model class used in
+    argument spec, which is looked up only when it is called or its
+    attributes are used.
+    """
+
+    def __init__(self, sdk, name):
+        self._sdk = sdk
+        self._name = name
+
+    def _resolve(self):
+        return getattr(self._sdk._load(), self._name)
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __getattr__(self, item):
+        if item.startswith("__"):
+            raise AttributeError(item)
+        return getattr(self._resolve(), item)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return "<lazy attribute '{0}.{1}'>".format(self._sdk._name, self._name)
+
+
+class LazySDK(object):
+    """
+    Proxy of a v4 SDK package which imports it on first use.
+
+    SDK packages import all of their api and model classes in their
+    __init__, so importing any part of them costs hundreds of milliseconds.
+    Using proxy, that cost is paid only by module runs which actually call
+    the SDK, and only for SDKs they call.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, item):
+        if self._module is None and not item.startswith("_"):
+            # attributes referred before SDK is needed, like model classes in
+            # argument specs, are resolved when they are used
+            return LazyAttribute(self, item)
+        value = getattr(self._load(), item)
+        # cache, so that later lookups of same attribute skip proxy
+        setattr(self, item, value)
+        return value
+
+    def __repr__(self):
+        return "<lazy sdk '{0}'>".format(self._name)
+
+
+def lazy_import(name):
+    """
+    This routine returns proxy of SDK package with given name, which is
+    imported on first use.
+    Args:
+        name (str): SDK package name, for example ntnx_vmm_py_client
+    Returns:
+        LazySDK: proxy of SDK package
+    Raises:
+        ImportError: if SDK package is not installed
+    """
+    if importlib.util.find_spec(name) is None:
+        raise ImportError("No module named '{0}'".format(name))
+    return LazySDK(name)
@@ -5,6 +5,10 @@ from __future__ import absolute_import, division, print_function
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+from ..constants import DEFAULT_V4_PAGE_LIMIT
+from ..utils import get_list_concurrency
 
 try:
     # Python 3
@@ -52,6 +56,62 @@ def strip_internal_attributes(data, exclude_attributes=None):
     return data
 
 
+def list_all_pages(module, list_method, *args, **kwargs):
+    """
+    This routine calls given v4 list api. If module param C(fetch_all) is set,
+    first page gives total_available_results and remaining pages are fetched
+    concurrently using bounded thread pool. Data of all pages is merged in order
+    into first page response. Query params like _select and _filter are sent
+    with every page.
+    Args:
+        module (AnsibleModule): certain ansible module
+        list_method (callable): sdk list api method
+        args (list): positional args of list_method
+        kwargs (dict): keyword args of list_method, as per SpecGenerator.get_info_spec().
+            fetch_all, if given, overrides module param C(fetch_all)
+    Returns:
+        resp (object): list api response
+    """
+    fetch_all = kwargs.pop("fetch_all", None)
+    if fetch_all is None:
+        fetch_all = module.params.get("fetch_all")
+    if not fetch_all:
+        return list_method(*args, **kwargs)
+
+    limit = kwargs.get("_limit") or DEFAULT_V4_PAGE_LIMIT
+    start_page = kwargs.get("_page") or 0
+    kwargs["_limit"] = limit
+    kwargs["_page"] = start_page
+
+    resp = list_method(*args, **kwargs)
+    data = getattr(resp, "data", None)
+    metadata = getattr(resp, "metadata", None)
+    total = getattr(metadata, "total_available_results", None) or 0
+    if not isinstance(data, list) or not total:
+        return resp
+
+    total_pages = (total + limit - 1) // limit
+    pages = list(range(start_page + 1, total_pages))
+    if not pages:
+        return resp
+
+    def fetch_page(page):
+        page_kwargs = dict(kwargs)
+        page_kwargs["_page"] = page
+        return list_method(*args, **page_kwargs)
+
+    max_workers = min(get_list_concurrency(), len(pages))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # pages are returned in order, exceptions are raised to caller
+        for page_resp in executor.map(fetch_page, pages):
+            page_data = getattr(page_resp, "data", None)
+            if page_data:
+                data.extend(page_data)
+
+    resp.data = data
+    return resp
+
+
 def raise_api_exception(module, exception, msg=None):
     """
     This routine raise module failure as per exception
@@ -5,7 +5,16 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import time  # noqa: E402
+
+from ...api_stats import API_STATS  # noqa: E402
+from ..prism.tasks import TASK_TIMEOUT_ERROR, wait_for_tasks  # noqa: E402
 from ..utils import raise_api_exception  # noqa: E402
+from .api_client import get_etag  # noqa: E402
+
+# statuses of updates rejected due to stale etag or conflicting update of VM
+ETAG_CONFLICT_STATUS_CODES = [409, 412]
+MAX_ETAG_RETRIES = 5
 
 
 def get_vm(module, api_instance, ext_id):
@@ -191,3 +200,100 @@ def get_ova(module, api_instance, ext_id):
             exception=e,
             msg="Api Exception raised while fetching OVA info using ext_id",
         )
+
+
+def _record_vm_operation(outcome, task, err, vm_ext_id, rel):
+    if err:
+        outcome["status"] = "failed"
+        outcome["error"] = err
+        return
+    outcome["status"] = "succeeded"
+    if rel and not outcome.get("ext_id"):
+        # entities affected by task include given VM itself
+        for entity in getattr(task, "entities_affected", None) or []:
+            if entity.rel == rel and entity.ext_id != vm_ext_id:
+                outcome["ext_id"] = entity.ext_id
+                break
+
+
+def run_vm_operations(
+    module,
+    api_instance,
+    vm_ext_id,
+    operations,
+    etag=None,
+    rel=None,
+    changes_etag=True,
+):
+    """
+    Submit operations on a VM or its devices pipelined, with at most module param
+    max_in_flight tasks running at once, and wait for all of them together.
+    Whole batch has one deadline, module param timeout if set. Operations not
+    submitted by then fail with timeout error.
+    All submissions share the VM etag. It is refreshed and the submission is
+    retried, once a running task finishes, if it is rejected as stale or
+    conflicting with another update of the VM.
+    Args:
+        module: Ansible module
+        api_instance: VmApi instance from ntnx_vmm_py_client sdk
+        vm_ext_id: ext_id of VM
+        operations (list): (outcome, submit) pairs, where submit(etag) submits
+            operation and returns api response, and outcome (dict) gets
+            status, task_ext_id and error of operation
+        etag: current etag of VM, fetched if not given
+        rel: entity type of created entities, to set their ext_id in outcome
+        changes_etag (bool): whether accepted operations change etag of VM.
+            If not, like for clones of VM, etag is fetched only on conflicts
+    """
+    max_in_flight = max(module.params.get("max_in_flight") or 1, 1)
+    in_flight = {}
+    # one deadline for whole batch, every wait gets only the time left of it
+    timeout = module.params.get("timeout")
+    deadline = time.time() + timeout if timeout else None
+
+    def wait(first_completed=False):
+        remaining = None
+        if deadline is not None:
+            # poller treats 0 as no timeout, one more status read is made
+            remaining = max(deadline - time.time(), 0.001)
+        for task_ext_id, task, err in wait_for_tasks(
+            module, list(in_flight), timeout=remaining, first_completed=first_completed
+        ):
+            _record_vm_operation(in_flight.pop(task_ext_id), task, err, vm_ext_id, rel)
+
+    for outcome, submit in operations:
+        while len(in_flight) >= max_in_flight:
+            wait(first_completed=True)
+        if deadline is not None and time.time() >= deadline:
+            outcome["status"] = "failed"
+            outcome["error"] = TASK_TIMEOUT_ERROR
+            continue
+
+        for attempt in range(MAX_ETAG_RETRIES + 1):
+            if etag is None:
+                etag = get_etag(get_vm(module, api_instance, vm_ext_id))
+            try:
+                resp = submit(etag)
+            except Exception as e:
+                status = getattr(e, "status", None)
+                if status in ETAG_CONFLICT_STATUS_CODES and attempt < MAX_ETAG_RETRIES:
+                    API_STATS.record_retry()
+                    if in_flight:
+                        wait(first_completed=True)
+                    else:
+                        time.sleep(attempt + 1)
+                    etag = None
+                    continue
+                outcome["status"] = "failed"
+                outcome["error"] = getattr(e, "body", None) or str(e)
+                break
+            outcome["status"] = "submitted"
+            outcome["task_ext_id"] = resp.data.ext_id
+            in_flight[resp.data.ext_id] = outcome
+            # every accepted update changes etag of VM
+            if changes_etag:
+                etag = None
+            break
+
+    if in_flight and module.params.get("wait"):
+        wait()
@@ -8,9 +8,11 @@ __metaclass__ = type
 import traceback
 from copy import deepcopy
 
+from ...sdk_loader import lazy_import
+
 SDK_IMP_ERROR = None
 try:
-    import ntnx_vmm_py_client as vmm_sdk  # noqa: E402
+    vmm_sdk = lazy_import("ntnx_vmm_py_client")
 except ImportError:
 
     from ...sdk_mock import mock_sdk as vmm_sdk  # noqa: E402
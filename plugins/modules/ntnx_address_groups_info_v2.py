@@ -127,6 +127,7 @@ from ..module_utils.v4.flow.api_client import (  # noqa: E402
 from ..module_utils.v4.flow.helpers import get_address_group  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -163,7 +164,7 @@ def get_address_groups(module, result):
         module.fail_json(msg="Failed generating address groups info Spec", **result)
 
     try:
-        resp = address_groups.list_address_groups(**kwargs)
+        resp = list_all_pages(module, address_groups.list_address_groups, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
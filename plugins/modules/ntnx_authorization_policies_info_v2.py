@@ -161,6 +161,7 @@ from ..module_utils.v4.iam.helpers import (  # noqa: E402
 )
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -210,7 +211,9 @@ def get_authorization_policies(module, api_instance, result):
         )
 
     try:
-        resp = api_instance.list_authorization_policies(**kwargs)
+        resp = list_all_pages(
+            module, api_instance.list_authorization_policies, **kwargs
+        )
     except Exception as e:
         raise_api_exception(
             module=module,
@@ -133,15 +133,17 @@ from ansible.module_utils.basic import missing_required_lib  # noqa: E402
 from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
 from ..module_utils.v4.base_info_module import BaseInfoModule  # noqa: E402
 from ..module_utils.v4.prism.pc_api_client import get_pc_api_client  # noqa: E402
+from ..module_utils.v4.sdk_loader import lazy_import  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
 
 SDK_IMP_ERROR = None
 try:
-    import ntnx_prism_py_client as prism_sdk  # noqa: E402
+    prism_sdk = lazy_import("ntnx_prism_py_client")
 except ImportError:
 
     from ..module_utils.v4.sdk_mock import mock_sdk as prism_sdk  # noqa: E402
@@ -195,7 +197,7 @@ def get_categories(module, result):
         module.fail_json(msg="Failed generating categories info Spec", **result)
 
     try:
-        resp = categories.list_categories(**kwargs)
+        resp = list_all_pages(module, categories.list_categories, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
@@ -252,6 +252,7 @@ from ..module_utils.v4.clusters_mgmt.api_client import (  # noqa: E402
 from ..module_utils.v4.clusters_mgmt.helpers import get_cluster  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -285,7 +286,7 @@ def get_clusters(module, result):
         module.fail_json("Failed creating query parameters for fetching clusters info")
     resp = None
     try:
-        resp = clusters.list_clusters(**kwargs)
+        resp = list_all_pages(module, clusters.list_clusters, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
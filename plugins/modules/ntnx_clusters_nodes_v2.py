@@ -630,6 +630,7 @@ from ..module_utils.v4.clusters_mgmt.api_client import (  # noqa: E402
     get_clusters_api_instance,
 )
 from ..module_utils.v4.prism.tasks import wait_for_completion  # noqa: E402
+from ..module_utils.v4.sdk_loader import lazy_import  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
     raise_api_exception,
@@ -640,7 +641,7 @@ SDK_IMP_ERROR = None
 from ansible.module_utils.basic import missing_required_lib  # noqa: E402
 
 try:
-    import ntnx_clustermgmt_py_client as clustermgmt_sdk  # noqa: E402
+    clustermgmt_sdk = lazy_import("ntnx_clustermgmt_py_client")
 except ImportError:
 
     from ..module_utils.v4.sdk_mock import mock_sdk as clustermgmt_sdk  # noqa: E402
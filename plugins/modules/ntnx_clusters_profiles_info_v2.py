@@ -258,6 +258,7 @@ from ..module_utils.v4.clusters_mgmt.api_client import (  # noqa: E402
 from ..module_utils.v4.clusters_mgmt.helpers import get_cluster_profile  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -291,7 +292,7 @@ def get_cluster_profiles(module, cluster_profiles, result):
         )
     resp = None
     try:
-        resp = cluster_profiles.list_cluster_profiles(**kwargs)
+        resp = list_all_pages(module, cluster_profiles.list_cluster_profiles, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
@@ -1049,6 +1049,7 @@ from ..module_utils.v4.prism.tasks import (  # noqa: E402
     get_entity_ext_id_from_task,
     wait_for_completion,
 )
+from ..module_utils.v4.sdk_loader import lazy_import  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
     raise_api_exception,
@@ -1057,7 +1058,7 @@ from ..module_utils.v4.utils import (  # noqa: E402
 
 SDK_IMP_ERROR = None
 try:
-    import ntnx_clustermgmt_py_client as clusters_sdk  # noqa: E402
+    clusters_sdk = lazy_import("ntnx_clustermgmt_py_client")
 except ImportError:
 
     from ..module_utils.v4.sdk_mock import mock_sdk as clusters_sdk  # noqa: E402
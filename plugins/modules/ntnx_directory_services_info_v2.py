@@ -150,6 +150,7 @@ from ..module_utils.v4.iam.api_client import (  # noqa: E402
 from ..module_utils.v4.iam.helpers import get_directory_service  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -181,7 +182,9 @@ def get_directory_services(module, directory_services, result):
         module.fail_json(msg="Failed generating directory services info Spec", **result)
 
     try:
-        resp = directory_services.list_directory_services(**kwargs)
+        resp = list_all_pages(
+            module, directory_services.list_directory_services, **kwargs
+        )
     except Exception as e:
         raise_api_exception(
             module=module,
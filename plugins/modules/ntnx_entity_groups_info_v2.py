@@ -155,6 +155,7 @@ from ..module_utils.v4.flow.api_client import (  # noqa: E402
 from ..module_utils.v4.flow.helpers import get_entity_group  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -189,7 +190,7 @@ def get_entity_groups(module, entity_groups, result):
         module.fail_json(msg="Failed generating entity groups info Spec", **result)
 
     try:
-        resp = entity_groups.list_entity_groups(**kwargs)
+        resp = list_all_pages(module, entity_groups.list_entity_groups, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
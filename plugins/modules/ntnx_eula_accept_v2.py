@@ -121,6 +121,7 @@ from ansible.module_utils.basic import missing_required_lib  # noqa: E402
 from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
 from ..module_utils.v4.base_module_v4 import BaseModuleV4  # noqa: E402
 from ..module_utils.v4.licensing.api_client import get_eula_api_instance  # noqa: E402
+from ..module_utils.v4.sdk_loader import lazy_import  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
     raise_api_exception,
@@ -129,7 +130,7 @@ from ..module_utils.v4.utils import (  # noqa: E402
 
 SDK_IMP_ERROR = None
 try:
-    import ntnx_licensing_py_client as licensing_sdk  # noqa: E402
+    licensing_sdk = lazy_import("ntnx_licensing_py_client")
 except ImportError:
 
     from ..module_utils.v4.sdk_mock import mock_sdk as licensing_sdk  # noqa: E402
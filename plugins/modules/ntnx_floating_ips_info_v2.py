@@ -136,6 +136,7 @@ from ..module_utils.v4.network.api_client import (  # noqa: E402
 )
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -165,7 +166,7 @@ def get_floating_ips(module, result):
         module.fail_json(msg="Failed generating floating_ips info Spec", **result)
 
     try:
-        resp = floating_ips.list_floating_ips(**kwargs)
+        resp = list_all_pages(module, floating_ips.list_floating_ips, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
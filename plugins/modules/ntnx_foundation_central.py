@@ -486,9 +486,8 @@ response:
 }
 """
 
-import time  # noqa: E402
-
 from ..module_utils.base_module import BaseModule  # noqa: E402
+from ..module_utils.poller import Poller  # noqa: E402
 from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
 from ..module_utils.v3.fc.imaged_clusters import ImagedCluster  # noqa: E402
 from ..module_utils.v3.fc.imaged_nodes import ImagedNode  # noqa: E402
@@ -624,20 +623,14 @@ def check_node_available(module, nodes, result):
 
 
 def wait_till_node_available(module, node_uuid, node_state):
-    timeout = time.time() + 1800
-    delay = 60
     img = ImagedNode(module)
-    while node_state != "STATE_AVAILABLE":
+    poller = Poller.from_module(module, timeout=1800, initial_delay=5, max_delay=60)
+    for _ in poller:
         node_detail = img.read(node_uuid)
-        new_node_state = node_detail["node_state"]
-        if new_node_state != "STATE_AVAILABLE":
-            if time.time() > timeout:
-                return (None, "Timeout. Node is in {0}\n".format(new_node_state))
-            time.sleep(delay)
-        else:
-            node_state = new_node_state
-
-    return node_state, None
+        node_state = node_detail["node_state"]
+        if node_state == "STATE_AVAILABLE":
+            return node_state, None
+    return (None, "Timeout. Node is in {0}\n".format(node_state))
 
 
 def wait_till_imaging(module, result):
@@ -651,32 +644,48 @@ def wait_till_imaging(module, result):
     result["changed"] = True
 
 
-def wait_for_completion(module, uuid):
-    state = ""
-    delay = 30
-    time.sleep(15 * 60)
-    timeout = time.time() + (3 * 60 * 60)
+def wait_for_completion(module, uuid, max_delay=30):
+    """
+    Poll imaging progress till it stops. Polling starts immediately and next
+    poll is scheduled as per aggregate percent complete, upto max_delay seconds
+    between reads. Per node progress is logged if nutanix_debug is enabled.
+    """
     progress = ImagedCluster(module)
-    while state != "COMPLETED":
+    poller = Poller.from_module(
+        module, timeout=3 * 60 * 60, initial_delay=10, max_delay=max_delay
+    )
+    node_progress = {}
+    for _ in poller:
         response = progress.read(uuid)
-        stopped = response["cluster_status"]["imaging_stopped"]
-        aggregate_percent_complete = response["cluster_status"][
-            "aggregate_percent_complete"
-        ]
+        cluster_status = response["cluster_status"]
+        stopped = cluster_status["imaging_stopped"]
+        aggregate_percent_complete = cluster_status["aggregate_percent_complete"]
+        _log_node_progress(progress.logger, uuid, cluster_status, node_progress)
         if stopped:
             if aggregate_percent_complete < 100:
                 status = _get_progress_error_status(response)
                 return response, status
-            state = "COMPLETED"
-        else:
-            state = "PENDING"
-            if time.time() > timeout:
-                return (
-                    None,
-                    "Failed to poll on image node progress. Reason: Timeout",
-                )
-            time.sleep(delay)
-    return response, None
+            return response, None
+        poller.report_progress(aggregate_percent_complete)
+    return (
+        None,
+        "Failed to poll on image node progress. Reason: Timeout",
+    )
+
+
+def _log_node_progress(logger, uuid, cluster_status, node_progress):
+    """Log progress of nodes whose percent complete or status changed."""
+    for node in cluster_status.get("node_progress_details") or []:
+        node_uuid = node.get("imaged_node_uuid")
+        current = (node.get("percent_complete"), node.get("status"))
+        if node_progress.get(node_uuid) == current:
+            continue
+        node_progress[node_uuid] = current
+        logger.log_message(
+            "Imaged cluster {0}: node {1} is {2}% complete. Status: {3}".format(
+                uuid, node_uuid, current[0], current[1]
+            )
+        )
 
 
 def _get_progress_error_status(progress):
@@ -60,7 +60,28 @@ EXAMPLES = r"""
 """
 
 RETURN = r"""
-
+image_name:
+  description: Name of installer file
+  returned: always
+  type: str
+  sample: "temptar_dont_use.iso"
+upload:
+  description:
+    - Stats of upload of installer file.
+    - Upload is restarted from start upto 3 times if connection drops or a gateway error is returned.
+    - SHA-1 and SHA-256 checksums of file are computed while it is uploaded.
+  returned: when image is uploaded
+  type: dict
+  sample: {
+            "attempts": 1,
+            "bytes": 5368709120,
+            "checksums": {
+                "sha1": "44610efd741a3ab4a548a81ea94869bb8b692977",
+                "sha256": "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08"
+            },
+            "elapsed_time": 450.8,
+            "throughput_mbps": 95.3
+        }
 """
 from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
 from ..module_utils.v3.foundation.base_module import FoundationBaseModule  # noqa: E402
@@ -90,6 +111,7 @@ def upload_image(module, result):
     source = module.params["source"]
     timeout = module.params["timeout"]
     resp = image.upload_image(fname, itype, source, timeout=timeout)
+    result["upload"] = image.upload_stats
     result["changed"] = True
     result["response"] = resp
 
@@ -134,6 +134,7 @@ from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
 from ..module_utils.v4.base_info_module import BaseInfoModule  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -165,7 +166,12 @@ def get_gpus(module, gpus, result):
         module.fail_json(msg="Failed generating GPUs list Spec", **result)
 
     try:
-        resp = gpus.list_gpus_by_vm_id(vmExtId=module.params.get("vm_ext_id"), **kwargs)
+        resp = list_all_pages(
+            module,
+            gpus.list_gpus_by_vm_id,
+            vmExtId=module.params.get("vm_ext_id"),
+            **kwargs  # fmt: skip
+        )
     except Exception as e:
         raise_api_exception(
             module=module,
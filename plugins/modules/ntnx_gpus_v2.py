@@ -164,6 +164,7 @@ from ansible.module_utils.basic import missing_required_lib  # noqa: E402
 from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
 from ..module_utils.v4.base_module_v4 import BaseModuleV4  # noqa: E402
 from ..module_utils.v4.prism.tasks import wait_for_completion  # noqa: E402
+from ..module_utils.v4.sdk_loader import lazy_import  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402)
     raise_api_exception,
@@ -174,7 +175,7 @@ from ..module_utils.v4.vmm.helpers import get_gpu, get_vm  # noqa: E402
 
 SDK_IMP_ERROR = None
 try:
-    import ntnx_vmm_py_client as vmm_sdk  # noqa: E402
+    vmm_sdk = lazy_import("ntnx_vmm_py_client")
 except ImportError:
 
     from ..module_utils.v4.sdk_mock import mock_sdk as vmm_sdk  # noqa: E402
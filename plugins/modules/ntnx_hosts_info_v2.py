@@ -186,6 +186,7 @@ from ..module_utils.v4.clusters_mgmt.api_client import (  # noqa: E402
 from ..module_utils.v4.clusters_mgmt.helpers import get_host  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -223,10 +224,13 @@ def get_hosts(module, result):
     try:
         cluster_ext_id = module.params.get("cluster_ext_id")
         if not cluster_ext_id:
-            resp = clusters.list_hosts(**kwargs)
+            resp = list_all_pages(module, clusters.list_hosts, **kwargs)
         else:
-            resp = clusters.list_hosts_by_cluster_id(
-                clusterExtId=cluster_ext_id, **kwargs
+            resp = list_all_pages(
+                module,
+                clusters.list_hosts_by_cluster_id,
+                clusterExtId=cluster_ext_id,
+                **kwargs  # fmt: skip
             )
     except Exception as e:
         raise_api_exception(
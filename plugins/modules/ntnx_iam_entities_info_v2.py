@@ -183,6 +183,7 @@ from ..module_utils.v4.iam.api_client import get_entity_api_instance  # noqa: E4
 from ..module_utils.v4.iam.helpers import get_entity  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -213,7 +214,7 @@ def get_entities(module, entities, result):
         module.fail_json(msg="Failed generating entities info Spec", **result)
 
     try:
-        resp = entities.list_entities(**kwargs)
+        resp = list_all_pages(module, entities.list_entities, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
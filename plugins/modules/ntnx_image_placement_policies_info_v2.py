@@ -122,6 +122,7 @@ from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
 from ..module_utils.v4.base_info_module import BaseInfoModule  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -170,7 +171,7 @@ def get_policies(module, result):
         )
 
     try:
-        resp = policies.list_placement_policies(**kwargs)
+        resp = list_all_pages(module, policies.list_placement_policies, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
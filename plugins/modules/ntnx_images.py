@@ -305,6 +305,23 @@ image_uuid:
   returned: always
   type: str
   sample: "00000000-0000-0000-0000-000000000000"
+upload:
+  description:
+    - Stats of upload of image contents from C(source_path).
+    - Upload is restarted from start upto 3 times if connection drops or a gateway error is returned.
+    - SHA-1 and SHA-256 checksums of file are computed while it is uploaded.
+  returned: when image is uploaded from C(source_path)
+  type: dict
+  sample: {
+            "attempts": 1,
+            "bytes": 1073741824,
+            "checksums": {
+                "sha1": "44610efd741a3ab4a548a81ea94869bb8b692977",
+                "sha256": "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08"
+            },
+            "elapsed_time": 95.2,
+            "throughput_mbps": 90.2
+        }
 """
 
 from ..module_utils import utils  # noqa: E402
@@ -383,6 +400,7 @@ def create_image(module, result):
         resp = image_upload_obj.upload_image(
             image_uuid, source_path, timeout, raise_error=False
         )
+        result["upload"] = image_upload_obj.upload_stats
         error = resp.get("error")
         if error:
             # delete the image metadata from PC
@@ -118,6 +118,7 @@ from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
 from ..module_utils.v4.base_info_module import BaseInfoModule  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -162,7 +163,7 @@ def get_images(module, result):
         module.fail_json(msg="Failed generating images info Spec", **result)
 
     try:
-        resp = images.list_images(**kwargs)
+        resp = list_all_pages(module, images.list_images, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
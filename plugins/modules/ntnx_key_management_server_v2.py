@@ -234,6 +234,7 @@ from ..module_utils.v4.prism.tasks import (  # noqa: E402
     get_entity_ext_id_from_task,
     wait_for_completion,
 )
+from ..module_utils.v4.sdk_loader import lazy_import  # noqa: E402
 from ..module_utils.v4.security.api_client import (  # noqa: E402
     get_etag,
     get_kms_api_instance,
@@ -247,7 +248,7 @@ from ..module_utils.v4.utils import (  # noqa: E402
 
 SDK_IMP_ERROR = None
 try:
-    import ntnx_security_py_client as security_sdk  # noqa: E402
+    security_sdk = lazy_import("ntnx_security_py_client")
 except ImportError:
 
     from ..module_utils.v4.sdk_mock import mock_sdk as security_sdk  # noqa: E402
@@ -160,6 +160,7 @@ from ..module_utils.v4.lcm.api_client import (  # noqa: E402
 )
 from ..module_utils.v4.lcm.helpers import get_lcm_config  # noqa: E402
 from ..module_utils.v4.prism.tasks import wait_for_completion  # noqa: E402
+from ..module_utils.v4.sdk_loader import lazy_import  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
     raise_api_exception,
@@ -169,7 +170,7 @@ from ..module_utils.v4.utils import (  # noqa: E402
 
 SDK_IMP_ERROR = None
 try:
-    import ntnx_lifecycle_py_client as lifecycle_sdk  # noqa: E402
+    lifecycle_sdk = lazy_import("ntnx_lifecycle_py_client")
 except ImportError:
 
     from ..module_utils.v4.sdk_mock import mock_sdk as lifecycle_sdk  # noqa: E402
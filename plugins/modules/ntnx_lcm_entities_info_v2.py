@@ -136,6 +136,7 @@ from ..module_utils.v4.lcm.api_client import get_entity_api_instance  # noqa: E4
 from ..module_utils.v4.lcm.helpers import get_lcm_entity  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -169,7 +170,7 @@ def get_entities(module, api_instance, result):
         module.fail_json(msg="Failed to generate info spec for entities", **result)
 
     try:
-        resp = api_instance.list_entities(**kwargs)
+        resp = list_all_pages(module, api_instance.list_entities, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
@@ -190,6 +190,7 @@ from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
 from ..module_utils.v4.base_module_v4 import BaseModuleV4  # noqa: E402
 from ..module_utils.v4.lcm.api_client import get_prechecks_api_instance  # noqa: E402
 from ..module_utils.v4.prism.tasks import wait_for_completion  # noqa: E402
+from ..module_utils.v4.sdk_loader import lazy_import  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
     raise_api_exception,
@@ -198,7 +199,7 @@ from ..module_utils.v4.utils import (  # noqa: E402
 
 SDK_IMP_ERROR = None
 try:
-    import ntnx_lifecycle_py_client as lifecycle_sdk  # noqa: E402
+    lifecycle_sdk = lazy_import("ntnx_lifecycle_py_client")
 except ImportError:
 
     from ..module_utils.v4.sdk_mock import mock_sdk as lifecycle_sdk  # noqa: E402
@@ -161,6 +161,11 @@ options:
                     - source snapshot uuid
                     - mutually exclusive with C(pitr_timestamp)
                 type: str
+            snapshot_name:
+                description:
+                    - source snapshot name, latest snapshot with this name in time machine is used
+                    - mutually exclusive with C(snapshot_uuid) and C(pitr_timestamp)
+                type: str
             timezone:
                 description:
                     - timezone related to C(pitr_timestamp)
@@ -601,7 +606,6 @@ uuid:
   sample: "00000000-0000-0000-0000-000000000000"
 """
 
-import time  # noqa: E402
 
 from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
 from ..module_utils.v3.ndb.base_module import NdbBaseModule  # noqa: E402
@@ -656,6 +660,7 @@ def get_module_spec():
         name=dict(type="str", required=False),
         uuid=dict(type="str", required=False),
         snapshot_uuid=dict(type="str", required=False),
+        snapshot_name=dict(type="str", required=False),
         pitr_timestamp=dict(type="str", required=False),
         latest_snapshot=dict(type="bool", required=False),
         timezone=dict(type="str", default="Asia/Calcutta", required=False),
@@ -706,7 +711,9 @@ def get_module_spec():
         time_machine=dict(
             type="dict",
             options=time_machine,
-            mutually_exclusive=[("snapshot_uuid", "pitr_timestamp", "latest_snapshot")],
+            mutually_exclusive=[
+                ("snapshot_uuid", "snapshot_name", "pitr_timestamp", "latest_snapshot")
+            ],
             required=False,
         ),
         postgres=dict(type="dict", options=postgres, required=False),
@@ -804,7 +811,6 @@ def create_db_clone(module, result):
     if module.params.get("wait"):
         ops_uuid = resp["operationId"]
         operations = Operation(module)
-        time.sleep(5)  # to get operation ID functional
         operations.wait_for_completion(ops_uuid, delay=15)
         resp = db_clone.read(uuid)
         db_clone.format_response(resp)
@@ -917,7 +923,6 @@ def delete_db_clone(module, result):
 
     if module.params.get("wait"):
         ops_uuid = resp["operationId"]
-        time.sleep(5)  # to get operation ID functional
         operations = Operation(module)
         resp = operations.wait_for_completion(ops_uuid, delay=5)
 
@@ -101,8 +101,6 @@ response:
 """
 
 
-import time  # noqa: E402
-
 from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
 from ..module_utils.v3.ndb.base_module import NdbBaseModule  # noqa: E402
 from ..module_utils.v3.ndb.operations import Operation  # noqa: E402
@@ -134,7 +132,6 @@ def log_catchup(module, result):
 
     if module.params.get("wait"):
         ops_uuid = resp["operationId"]
-        time.sleep(5)  # to get operation ID functional
         operations = Operation(module)
         resp = operations.wait_for_completion(ops_uuid)
         result["response"] = resp
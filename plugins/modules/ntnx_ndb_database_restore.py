@@ -14,7 +14,7 @@ short_description: module for restoring database instance
 version_added: 1.8.0
 description:
     - module for restoring database instance to certain point in time or snapshot
-    - module will use latest snapshot if pitr timestamp or snapshot uuid is not given
+    - module will use latest snapshot if pitr timestamp, snapshot uuid or snapshot name is not given
 options:
       pitr_timestamp:
         description:
@@ -27,6 +27,11 @@ options:
             - snapshot uuid for restore
             - mutually exclusive with C(pitr_timestamp)
         type: str
+      snapshot_name:
+        description:
+            - snapshot name for restore, latest snapshot with this name in time machine of database is used
+            - mutually exclusive with C(snapshot_uuid) and C(pitr_timestamp)
+        type: str
       timezone:
         description:
             - timezone related to given C(pitr_timestamp)
@@ -119,18 +124,19 @@ response:
 }
 
 """
-import time  # noqa: E402
 
 from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
 from ..module_utils.v3.ndb.base_module import NdbBaseModule  # noqa: E402
 from ..module_utils.v3.ndb.database_instances import DatabaseInstance  # noqa: E402
 from ..module_utils.v3.ndb.operations import Operation  # noqa: E402
+from ..module_utils.v3.ndb.snapshots import Snapshot  # noqa: E402
 
 
 def get_module_spec():
 
     module_args = dict(
         snapshot_uuid=dict(type="str", required=False),
+        snapshot_name=dict(type="str", required=False),
         pitr_timestamp=dict(type="str", required=False),
         db_uuid=dict(type="str", required=True),
         timezone=dict(type="str", required=False),
@@ -144,6 +150,17 @@ def restore_database(module, result):
     if not db_uuid:
         module.fail_json(msg="db_uuid is required field for restoring", **result)
 
+    snapshot_name = module.params.get("snapshot_name")
+    if snapshot_name:
+        database = db.read(db_uuid)
+        snapshot_uuid, err = Snapshot(module).get_snapshot_uuid(
+            database.get("timeMachineId"), snapshot_name
+        )
+        if err:
+            result["error"] = err
+            module.fail_json(msg="Failed fetching snapshot for restore", **result)
+        module.params["snapshot_uuid"] = snapshot_uuid
+
     spec = db.get_restore_spec(module.params)
 
     if module.check_mode:
@@ -155,7 +172,6 @@ def restore_database(module, result):
 
     if module.params.get("wait"):
         ops_uuid = resp["operationId"]
-        time.sleep(5)  # to get operation ID functional
         operations = Operation(module)
         resp = operations.wait_for_completion(ops_uuid)
         result["response"] = resp
@@ -169,7 +185,7 @@ def run_module():
         argument_spec=get_module_spec(),
         supports_check_mode=True,
         required_together=[("pitr_timestamp", "timezone")],
-        mutually_exclusive=[("snapshot_uuid", "pitr_timestamp")],
+        mutually_exclusive=[("snapshot_uuid", "snapshot_name", "pitr_timestamp")],
     )
     remove_param_with_none_value(module.params)
     result = {"changed": False, "error": None, "response": None, "db_uuid": None}
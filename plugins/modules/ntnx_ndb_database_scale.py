@@ -106,7 +106,6 @@ response:
 }
 
 """
-import time  # noqa: E402
 
 from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
 from ..module_utils.v3.ndb.base_module import NdbBaseModule  # noqa: E402
@@ -151,7 +150,6 @@ def scale_db_instance(module, result):
 
     if module.params.get("wait"):
         ops_uuid = resp["operationId"]
-        time.sleep(5)  # to get operation ID functional
         operations = Operation(module)
         resp = operations.wait_for_completion(ops_uuid)
         result["response"] = resp
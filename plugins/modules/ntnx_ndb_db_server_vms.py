@@ -451,7 +451,6 @@ uuid:
   sample: "be524e70-60ad-4a8c-a0ee-8d72f954d7e6"
 """
 
-import time  # noqa: E402
 from copy import deepcopy  # noqa: E402
 
 from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
@@ -590,7 +589,6 @@ def create_db_server(module, result):
     if module.params.get("wait"):
         ops_uuid = resp["operationId"]
         operations = Operation(module)
-        time.sleep(5)  # to get operation ID functional
         operations.wait_for_completion(ops_uuid)
         resp = db_servers.read(db_uuid)
         db_servers.format_response(resp)
@@ -698,7 +696,6 @@ def delete_db_server(module, result):
     if module.params.get("wait") and resp.get("operationId"):
         ops_uuid = resp["operationId"]
         operations = Operation(module)
-        time.sleep(5)  # to get operation ID functional
         resp = operations.wait_for_completion(ops_uuid, delay=5)
         result["response"] = resp
 
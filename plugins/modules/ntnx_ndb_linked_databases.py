@@ -228,7 +228,6 @@ database_instance_uuid:
   type: str
   sample: "be524e70-60ad-4a8c-a0ee-8d72f954d7e6"
 """
-import time  # noqa: E402
 
 from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
 from ..module_utils.v3.ndb.base_module import NdbBaseModule  # noqa: E402
@@ -268,7 +267,6 @@ def add_database(module, result):
 
     if module.params.get("wait"):
         ops_uuid = resp["operationId"]
-        time.sleep(3)  # to get operation ID functional
         operations = Operation(module)
         operations.wait_for_completion(ops_uuid, delay=5)
         resp = _databases.read(uuid=instance_uuid)
@@ -299,7 +297,6 @@ def remove_database(module, result):
     if module.params.get("wait"):
         ops_uuid = resp["operationId"]
         operations = Operation(module)
-        time.sleep(3)  # to get ops ID functional
         operations.wait_for_completion(ops_uuid, delay=5)
         resp = _databases.read(uuid=instance_uuid)
         result["response"] = resp.get("linkedDatabases", [])
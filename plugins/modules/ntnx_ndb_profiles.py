@@ -787,7 +787,6 @@ version_uuid:
   sample: "be524e70-60ad-4a8c-a0ee-8d72f954d7e6"
 """
 
-import time  # noqa: E402
 
 from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
 from ..module_utils.v3.ndb.base_module import NdbBaseModule  # noqa: E402
@@ -963,7 +962,6 @@ def create_profile_version(module, result, profile_uuid, profile_obj):
 
         ops_uuid = resp["operationId"]
         operations = Operation(module)
-        time.sleep(3)  # to get operation ID functional
         operations.wait_for_completion(ops_uuid, delay=10)
 
         result["response"]["version"] = profile_obj.get_profile_by_version(
@@ -1016,7 +1014,6 @@ def update_profile_version(module, result, profile_uuid, profile_obj):
 
         ops_uuid = resp["operationId"]
         operations = Operation(module)
-        time.sleep(3)  # to get operation ID functional
         operations.wait_for_completion(ops_uuid, delay=10)
 
         result["response"]["version"] = profile_obj.get_profile_by_version(
@@ -1103,7 +1100,6 @@ def create_profile(module, result):
 
         ops_uuid = resp["operationId"]
         operations = Operation(module)
-        time.sleep(3)  # to get operation ID functional
         operations.wait_for_completion(ops_uuid, delay=10)
 
         resp = _profile.get_profiles(uuid=uuid)
@@ -1163,7 +1159,6 @@ def update_profile(module, result):
 
             ops_uuid = resp["operationId"]
             operations = Operation(module)
-            time.sleep(3)  # to get operation ID functional
             operations.wait_for_completion(ops_uuid, delay=10)
 
             resp = _profile.get_profiles(uuid=uuid)
@@ -606,7 +606,6 @@ db_uuid:
   type: str
   sample: "be524e70-60ad-4a8c-a0ee-8d72f954d7e6"
 """
-import time  # noqa: E402
 from copy import deepcopy  # noqa: E402
 
 from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
@@ -811,7 +810,6 @@ def register_instance(module, result):
     if module.params.get("wait"):
         ops_uuid = resp["operationId"]
         operations = Operation(module)
-        time.sleep(5)  # to get operation ID functional
         operations.wait_for_completion(ops_uuid, delay=15)
         query = {"detailed": True, "load-dbserver-cluster": True}
         resp = db_instance.read(db_uuid, query=query)
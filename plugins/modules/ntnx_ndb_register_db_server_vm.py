@@ -345,7 +345,6 @@ uuid:
   type: str
   sample: "be524e70-60ad-4a8c-a0ee-8d72f954d7e6"
 """
-import time  # noqa: E402
 from copy import deepcopy  # noqa: E402
 
 from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
@@ -442,7 +441,6 @@ def register_db_server(module, result):
     if module.params.get("wait"):
         ops_uuid = resp["operationId"]
         operations = Operation(module)
-        time.sleep(5)  # to get operation ID functional
         operations.wait_for_completion(ops_uuid)
         resp = db_server_vms.read(db_uuid)
         result["response"] = resp
@@ -23,6 +23,17 @@ options:
       snapshot_uuid:
         description:
             - snapshot uuid
+            - mutually exclusive with C(snapshot_name)
+        type: str
+      snapshot_name:
+        description:
+            - snapshot name, latest snapshot with this name in C(time_machine_uuid) is replicated
+            - mutually exclusive with C(snapshot_uuid)
+        type: str
+      time_machine_uuid:
+        description:
+            - uuid of time machine of snapshot
+            - required with C(snapshot_name)
         type: str
       clusters:
         description:
@@ -146,7 +157,6 @@ snapshot_uuid:
   type: str
   sample: "be524e70-60ad-4a8c-a0ee-8d72f954d7e6"
 """
-import time  # noqa: E402
 
 from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
 from ..module_utils.v3.ndb.base_module import NdbBaseModule  # noqa: E402
@@ -163,6 +173,8 @@ def get_module_spec():
 
     module_args = dict(
         snapshot_uuid=dict(type="str", required=False),
+        snapshot_name=dict(type="str", required=False),
+        time_machine_uuid=dict(type="str", required=False),
         clusters=dict(
             type="list",
             elements="dict",
@@ -177,15 +189,24 @@ def get_module_spec():
 
 def replicate_snapshot(module, result):
 
-    snapshot_uuid = module.params.get("snapshot_uuid")
-    if not snapshot_uuid:
-        module.fail_json(
-            msg="snapshot_uuid is required field for replication", **result
-        )
-
     _snapshot = Snapshot(module)
-    snapshot = _snapshot.read(uuid=snapshot_uuid)
-    time_machine_uuid = snapshot.get("timeMachineId")
+    snapshot_name = module.params.get("snapshot_name")
+    if snapshot_name:
+        time_machine_uuid = module.params.get("time_machine_uuid")
+        snapshot_uuid, err = _snapshot.get_snapshot_uuid(
+            time_machine_uuid, snapshot_name
+        )
+        if err:
+            result["error"] = err
+            module.fail_json(msg="Failed fetching snapshot for replication", **result)
+    else:
+        snapshot_uuid = module.params.get("snapshot_uuid")
+        if not snapshot_uuid:
+            module.fail_json(
+                msg="snapshot_uuid is required field for replication", **result
+            )
+        snapshot = _snapshot.read(uuid=snapshot_uuid)
+        time_machine_uuid = snapshot.get("timeMachineId")
 
     spec, err = _snapshot.get_replicate_snapshot_spec()
     if err:
@@ -206,7 +227,6 @@ def replicate_snapshot(module, result):
     if module.params.get("wait"):
         ops_uuid = resp["operationId"]
         operations = Operation(module)
-        time.sleep(3)
         resp = operations.wait_for_completion(ops_uuid, delay=5)
         result["response"] = resp
 
@@ -218,8 +238,10 @@ def run_module():
         argument_spec=get_module_spec(),
         supports_check_mode=True,
         required_if=[
-            ("state", "present", ("snapshot_uuid",), True),
+            ("state", "present", ("snapshot_uuid", "snapshot_name"), True),
         ],
+        mutually_exclusive=[("snapshot_uuid", "snapshot_name")],
+        required_by={"snapshot_name": "time_machine_uuid"},
     )
     remove_param_with_none_value(module.params)
     result = {"changed": False, "error": None, "response": None, "snapshot_uuid": None}
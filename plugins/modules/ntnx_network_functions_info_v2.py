@@ -165,6 +165,7 @@ from ..module_utils.v4.network.api_client import (  # noqa: E402
 from ..module_utils.v4.network.helpers import get_network_function  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -198,7 +199,9 @@ def get_network_functions(module, network_functions, result):
         module.fail_json(msg="Failed generating network functions info Spec", **result)
 
     try:
-        resp = network_functions.list_network_functions(**kwargs)
+        resp = list_all_pages(
+            module, network_functions.list_network_functions, **kwargs
+        )
     except Exception as e:
         raise_api_exception(
             module=module,
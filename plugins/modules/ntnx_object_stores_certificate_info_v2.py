@@ -131,6 +131,7 @@ from ..module_utils.v4.objects.api_client import get_objects_api_instance  # noq
 from ..module_utils.v4.objects.helpers import get_object_store_certificate  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -168,8 +169,11 @@ def get_object_store_certificates(module, object_stores_api, result):
             msg="Failed generating object store certificates info Spec", **result
         )
     try:
-        resp = object_stores_api.list_certificates_by_objectstore_id(
-            objectStoreExtId=object_store_ext_id, **kwargs
+        resp = list_all_pages(
+            module,
+            object_stores_api.list_certificates_by_objectstore_id,
+            objectStoreExtId=object_store_ext_id,
+            **kwargs  # fmt: skip
         )
     except Exception as e:
         raise_api_exception(
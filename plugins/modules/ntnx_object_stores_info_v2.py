@@ -184,6 +184,7 @@ from ..module_utils.v4.objects.api_client import get_objects_api_instance  # noq
 from ..module_utils.v4.objects.helpers import get_object_store  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -214,7 +215,7 @@ def get_object_stores(module, object_stores_api, result):
         result["error"] = err
         module.fail_json(msg="Failed generating object stores info Spec", **result)
     try:
-        resp = object_stores_api.list_objectstores(**kwargs)
+        resp = list_all_pages(module, object_stores_api.list_objectstores, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
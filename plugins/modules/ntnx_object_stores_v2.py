@@ -407,6 +407,7 @@ from ..module_utils.v4.prism.tasks import (  # noqa: E402
     get_entity_ext_id_from_task,
     wait_for_completion,
 )
+from ..module_utils.v4.sdk_loader import lazy_import  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
     raise_api_exception,
@@ -415,7 +416,7 @@ from ..module_utils.v4.utils import (  # noqa: E402
 
 SDK_IMP_ERROR = None
 try:
-    import ntnx_objects_py_client as objects_sdk  # noqa: E402
+    objects_sdk = lazy_import("ntnx_objects_py_client")
 except ImportError:
 
     from ..module_utils.v4.sdk_mock import mock_sdk as objects_sdk  # noqa: E402
@@ -144,6 +144,7 @@ from ..module_utils.v4.iam.api_client import get_permission_api_instance  # noqa
 from ..module_utils.v4.iam.helpers import get_permission  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -173,7 +174,7 @@ def get_operations(module, operations, result):
         module.fail_json(msg="Failed generating operations info Spec", **result)
 
     try:
-        resp = operations.list_operations(**kwargs)
+        resp = list_all_pages(module, operations.list_operations, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
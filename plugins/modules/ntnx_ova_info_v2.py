@@ -145,6 +145,7 @@ from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
 from ..module_utils.v4.base_info_module import BaseInfoModule  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -180,7 +181,7 @@ def get_ovas(module, ova, result):
         module.fail_json(msg="Failed generating ovas info Spec", **result)
 
     try:
-        resp = ova.list_ovas(**kwargs)
+        resp = list_all_pages(module, ova.list_ovas, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
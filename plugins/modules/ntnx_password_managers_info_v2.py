@@ -160,6 +160,7 @@ from ..module_utils.v4.clusters_mgmt.api_client import (  # noqa: E402
 )
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -179,7 +180,9 @@ def get_password_status_system_users(module, result):
         )
     resp = None
     try:
-        resp = password_manager_api.list_system_user_passwords(**kwargs)
+        resp = list_all_pages(
+            module, password_manager_api.list_system_user_passwords, **kwargs
+        )
     except Exception as e:
         raise_api_exception(
             module=module,
@@ -145,6 +145,7 @@ from ..module_utils.v4.network.api_client import (  # noqa: E402
 )
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -189,7 +190,7 @@ def get_pbrs(module, result):
         module.fail_json(msg="Failed generating pbrs info Spec", **result)
 
     try:
-        resp = pbrs.list_routing_policies(**kwargs)
+        resp = list_all_pages(module, pbrs.list_routing_policies, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
@@ -130,6 +130,7 @@ from ..module_utils.v4.prism.pc_api_client import (  # noqa: E402
 )
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -162,8 +163,11 @@ def get_backup_targets(module, domain_manager_backups_api, result):
         result["error"] = err
         module.fail_json(msg="Failed generating backup targets info Spec", **result)
     try:
-        resp = domain_manager_backups_api.list_backup_targets(
-            domainManagerExtId=domain_manager_ext_id, **kwargs
+        resp = list_all_pages(
+            module,
+            domain_manager_backups_api.list_backup_targets,
+            domainManagerExtId=domain_manager_ext_id,
+            **kwargs  # fmt: skip
         )
     except Exception as e:
         raise_api_exception(
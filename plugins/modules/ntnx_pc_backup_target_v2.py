@@ -280,6 +280,7 @@ from ..module_utils.v4.prism.pc_api_client import (  # noqa: E402
 )
 from ..module_utils.v4.prism.spec.pc import PrismSpecs as prism_specs  # noqa: E402
 from ..module_utils.v4.prism.tasks import wait_for_completion  # noqa: E402
+from ..module_utils.v4.sdk_loader import lazy_import  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
     raise_api_exception,
@@ -288,7 +289,7 @@ from ..module_utils.v4.utils import (  # noqa: E402
 
 SDK_IMP_ERROR = None
 try:
-    import ntnx_prism_py_client as prism_sdk  # noqa: E402
+    prism_sdk = lazy_import("ntnx_prism_py_client")
 except ImportError:
 
     from ..module_utils.v4.sdk_mock import mock_sdk as prism_sdk  # noqa: E402
@@ -251,6 +251,7 @@ from ..module_utils.v4.prism.pc_api_client import (  # noqa: E402
 )
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -281,7 +282,7 @@ def get_pc_configs(module, domain_manager_api, result):
         result["error"] = err
         module.fail_json(msg="Failed generating PC Configuration info Spec", **result)
     try:
-        resp = domain_manager_api.list_domain_managers(**kwargs)
+        resp = list_all_pages(module, domain_manager_api.list_domain_managers, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
@@ -155,6 +155,7 @@ from ..module_utils.v4.prism.pc_api_client import (  # noqa: E402
 )
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -189,8 +190,11 @@ def get_restorable_domain_managers(module, domain_manager_backups_api, result):
             msg="Failed generating restorable domain managers info Spec", **result
         )
     try:
-        resp = domain_manager_backups_api.list_restorable_domain_managers(
-            restoreSourceExtId=restore_source_ext_id, **kwargs
+        resp = list_all_pages(
+            module,
+            domain_manager_backups_api.list_restorable_domain_managers,
+            restoreSourceExtId=restore_source_ext_id,
+            **kwargs  # fmt: skip
         )
     except Exception as e:
         raise_api_exception(
@@ -182,6 +182,7 @@ from ..module_utils.v4.prism.pc_api_client import (  # noqa: E402
 )
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -219,7 +220,9 @@ def get_restore_points(module, domain_manager_backups_api, result):
         result["error"] = err
         module.fail_json(msg="Failed generating restore points info Spec", **result)
     try:
-        resp = domain_manager_backups_api.list_restore_points(
+        resp = list_all_pages(
+            module,
+            domain_manager_backups_api.list_restore_points,
             restoreSourceExtId=restore_source_ext_id,
             restorableDomainManagerExtId=restorable_domain_manager_ext_id,
             **kwargs  # fmt: skip
@@ -165,6 +165,7 @@ from ..module_utils.v4.prism.helpers import get_pc_task  # noqa: E402
 from ..module_utils.v4.prism.pc_api_client import get_tasks_api_instance  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -195,7 +196,7 @@ def get_tasks_details(module, tasks_api, result):
         result["error"] = err
         module.fail_json(msg="Failed generating list tasks info Spec", **result)
     try:
-        resp = tasks_api.list_tasks(**kwargs)
+        resp = list_all_pages(module, tasks_api.list_tasks, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
@@ -179,6 +179,7 @@ from ..module_utils.v4.data_policies.api_client import (  # noqa: E402
 from ..module_utils.v4.data_policies.helpers import get_protection_policy  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -215,7 +216,9 @@ def get_protection_policies(module, protection_policies, result):
         )
 
     try:
-        resp = protection_policies.list_protection_policies(**kwargs)
+        resp = list_all_pages(
+            module, protection_policies.list_protection_policies, **kwargs
+        )
     except Exception as e:
         raise_api_exception(
             module=module,
@@ -29,6 +29,23 @@ options:
             - The sort order in which results are returned
         type: str
         choices: ["ASCENDING", "DESCENDING"]
+    entities_page_size:
+        description:
+            - Number of affected entities read per API call, using offset and length.
+            - By default all affected entities are read in one call.
+            - Use for protection rules having thousands of affected entities, whose single response takes long.
+        type: int
+    entities_count_only:
+        description:
+            - Return count of affected entities as C(entity_count) instead of their list.
+        type: bool
+        default: false
+    entities_attributes:
+        description:
+            - Attributes of each entity to be returned, instead of all of them.
+            - Nested attributes are given as dot separated path, for example C(vm_reference.uuid).
+        type: list
+        elements: str
 extends_documentation_fragment:
       - nutanix.ncp.ntnx_credentials
       - nutanix.ncp.ntnx_info
@@ -55,12 +72,36 @@ EXAMPLES = r"""
     validate_certs: "{{ validate_certs }}"
     rule_uuid: "{{ test_rule_uuid }}"
   register: result
+
+- name: Get count of entities affected by protection rule having thousands of vms
+  ntnx_protection_rules_info:
+    nutanix_host: "{{ ip }}"
+    nutanix_username: "{{ username }}"
+    nutanix_password: "{{ password }}"
+    validate_certs: "{{ validate_certs }}"
+    rule_uuid: "{{ test_rule_uuid }}"
+    entities_page_size: 500
+    entities_count_only: true
+  register: result
+
+- name: Get uuids of entities affected by protection rule
+  ntnx_protection_rules_info:
+    nutanix_host: "{{ ip }}"
+    nutanix_username: "{{ username }}"
+    nutanix_password: "{{ password }}"
+    validate_certs: "{{ validate_certs }}"
+    rule_uuid: "{{ test_rule_uuid }}"
+    entities_page_size: 500
+    entities_attributes:
+      - vm_reference.uuid
+  register: result
 """
 RETURN = r"""
 rule_affected_entities:
   description:
     - affected entities to protection policy
     - only obtained when uuid is used for getting info of protection policy
+    - C(entity_count) is returned instead of C(entity_list) if C(entities_count_only) is true
   returned: always
   type: dict
   sample: {
@@ -228,7 +269,10 @@ rule_info:
             }
 """
 
-from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
+from ..module_utils.utils import (  # noqa: E402
+    project_attributes,
+    remove_param_with_none_value,
+)
 from ..module_utils.v3.base_info_module import BaseInfoModule  # noqa: E402
 from ..module_utils.v3.prism.protection_rules import ProtectionRule  # noqa: E402
 
@@ -240,18 +284,40 @@ def get_module_spec():
         kind=dict(type="str", default="protection_rule"),
         sort_order=dict(type="str", choices=["ASCENDING", "DESCENDING"]),
         sort_attribute=dict(type="str"),
+        entities_page_size=dict(type="int"),
+        entities_count_only=dict(type="bool", default=False),
+        entities_attributes=dict(type="list", elements="str"),
     )
 
     return module_args
 
 
+def get_affected_entities(module, protection_rule, rule_uuid):
+    affected_entities = {}
+    entities = protection_rule.iter_affected_entities(
+        rule_uuid,
+        page_size=module.params.get("entities_page_size"),
+        result=affected_entities,
+    )
+    attributes = module.params.get("entities_attributes")
+    if module.params.get("entities_count_only"):
+        affected_entities["entity_count"] = sum(1 for _ in entities)
+    elif attributes:
+        affected_entities["entity_list"] = [
+            project_attributes(entity, attributes) for entity in entities
+        ]
+    else:
+        affected_entities["entity_list"] = list(entities)
+    return affected_entities
+
+
 def get_protection_rule(module, result):
     protection_rule = ProtectionRule(module)
     rule_uuid = module.params.get("rule_uuid")
     resp = protection_rule.read(rule_uuid)
 
     # get all affected entities
-    affected_entities = protection_rule.get_affected_entities(rule_uuid)
+    affected_entities = get_affected_entities(module, protection_rule, rule_uuid)
 
     result["response"] = {
         "rule_info": resp,
@@ -28,6 +28,23 @@ options:
             - The sort order in which results are returned
         type: str
         choices: ["ASCENDING", "DESCENDING"]
+    entities_page_size:
+        description:
+            - Number of associated entities read per API call, using offset and length.
+            - By default all associated entities are read in one call.
+            - Use for recovery plans having thousands of associated entities, whose single response takes long.
+        type: int
+    entities_count_only:
+        description:
+            - Return count of associated entities as C(entity_count) instead of their list.
+        type: bool
+        default: false
+    entities_attributes:
+        description:
+            - Attributes of each entity to be returned, instead of all of them.
+            - Nested attributes are given as dot separated path, for example C(any_entity_reference.uuid).
+        type: list
+        elements: str
 extends_documentation_fragment:
       - nutanix.ncp.ntnx_credentials
       - nutanix.ncp.ntnx_info
@@ -54,12 +71,24 @@ EXAMPLES = r"""
     validate_certs: "{{ validate_certs }}"
     plan_uuid: "{{ plan_uuid }}"
   register: result
+
+- name: Get count of entities associated with recovery plan
+  ntnx_recovery_plans_info:
+    nutanix_host: "{{ ip }}"
+    nutanix_username: "{{ username }}"
+    nutanix_password: "{{ password }}"
+    validate_certs: "{{ validate_certs }}"
+    plan_uuid: "{{ plan_uuid }}"
+    entities_count_only: true
+  register: result
 """
 RETURN = r"""
 associated_entities:
   description:
     - associated entities to recovery plan
     - only obtained when uuid is used for getting info of recovery plan
+    - If C(entities_count_only) is true, C(entity_count) of each availability zone and
+      total C(entity_count) are returned instead of C(entity_list)
   returned: always
   type: dict
   sample: {
@@ -340,7 +369,10 @@ recovery_plan_info:
 """
 
 
-from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
+from ..module_utils.utils import (  # noqa: E402
+    project_attributes,
+    remove_param_with_none_value,
+)
 from ..module_utils.v3.base_info_module import BaseInfoModule  # noqa: E402
 from ..module_utils.v3.prism.recovery_plans import RecoveryPlan  # noqa: E402
 
@@ -352,18 +384,52 @@ def get_module_spec():
         kind=dict(type="str", default="recovery_plan"),
         sort_order=dict(type="str", choices=["ASCENDING", "DESCENDING"]),
         sort_attribute=dict(type="str"),
+        entities_page_size=dict(type="int"),
+        entities_count_only=dict(type="bool", default=False),
+        entities_attributes=dict(type="list", elements="str"),
     )
 
     return module_args
 
 
+def get_associated_entities(module, recovery_plan, uuid):
+    associated_entities = {}
+    zones = recovery_plan.iter_associated_entities(
+        uuid,
+        page_size=module.params.get("entities_page_size"),
+        result=associated_entities,
+    )
+    attributes = module.params.get("entities_attributes")
+    count_only = module.params.get("entities_count_only")
+
+    zone_list = []
+    entity_count = 0
+    for zone in zones:
+        entity_list = zone.pop("entity_list", None) or []
+        entity_count += len(entity_list)
+        if count_only:
+            zone["entity_count"] = len(entity_list)
+        elif attributes:
+            zone["entity_list"] = [
+                project_attributes(entity, attributes) for entity in entity_list
+            ]
+        else:
+            zone["entity_list"] = entity_list
+        zone_list.append(zone)
+
+    associated_entities["entities_per_availability_zone_list"] = zone_list
+    if count_only:
+        associated_entities["entity_count"] = entity_count
+    return associated_entities
+
+
 def get_recovery_plan(module, result):
     recovery_plan = RecoveryPlan(module)
     uuid = module.params.get("plan_uuid")
     resp = recovery_plan.read(uuid)
 
     # get all associated entities
-    associated_entities = recovery_plan.get_associated_entities(uuid)
+    associated_entities = get_associated_entities(module, recovery_plan, uuid)
 
     result["response"] = {
         "recovery_plan_info": resp,
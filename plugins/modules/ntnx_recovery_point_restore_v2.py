@@ -208,6 +208,7 @@ from ..module_utils.v4.prism.tasks import (  # noqa: E402
     get_ext_id_from_task_completion_details,
     wait_for_completion,
 )
+from ..module_utils.v4.sdk_loader import lazy_import  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
     raise_api_exception,
@@ -216,7 +217,7 @@ from ..module_utils.v4.utils import (  # noqa: E402
 
 SDK_IMP_ERROR = None
 try:
-    import ntnx_dataprotection_py_client as data_protection_sdk  # noqa: E402
+    data_protection_sdk = lazy_import("ntnx_dataprotection_py_client")
 except ImportError:
 
     from ..module_utils.v4.sdk_mock import mock_sdk as data_protection_sdk  # noqa: E402
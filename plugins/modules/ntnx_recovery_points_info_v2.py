@@ -166,6 +166,7 @@ from ..module_utils.v4.data_protection.api_client import (  # noqa: E402
 from ..module_utils.v4.data_protection.helpers import get_recovery_point  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -200,7 +201,7 @@ def get_recovery_points(module, recovery_points, result):
         module.fail_json(msg="Failed generating recovery points info Spec", **result)
 
     try:
-        resp = recovery_points.list_recovery_points(**kwargs)
+        resp = list_all_pages(module, recovery_points.list_recovery_points, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
@@ -153,6 +153,7 @@ from ..module_utils.v4.iam.api_client import get_role_api_instance  # noqa: E402
 from ..module_utils.v4.iam.helpers import get_role  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -182,7 +183,7 @@ def get_roles(module, roles, result):
         module.fail_json(msg="Failed generating roles info Spec", **result)
 
     try:
-        resp = roles.list_roles(**kwargs)
+        resp = list_all_pages(module, roles.list_roles, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
@@ -132,6 +132,7 @@ from ..module_utils.v4.network.api_client import (  # noqa: E402
 )
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -173,7 +174,9 @@ def get_route_tables(module, route_table_api_instance, result):
         module.fail_json(msg="Failed generating route table info Spec", **result)
 
     try:
-        resp = route_table_api_instance.list_route_tables(**kwargs)
+        resp = list_all_pages(
+            module, route_table_api_instance.list_route_tables, **kwargs
+        )
     except Exception as e:
         raise_api_exception(
             module=module,
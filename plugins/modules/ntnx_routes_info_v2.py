@@ -167,6 +167,7 @@ from ..module_utils.v4.base_info_module import BaseInfoModule  # noqa: E402
 from ..module_utils.v4.network.api_client import get_routes_api_instance  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -214,8 +215,11 @@ def get_routes(module, route_api_instance, result):
         module.fail_json(msg="Failed generating route info Spec", **result)
 
     try:
-        resp = route_api_instance.list_routes_by_route_table_id(
-            routeTableExtId=route_table_ext_id, **kwargs
+        resp = list_all_pages(
+            module,
+            route_api_instance.list_routes_by_route_table_id,
+            routeTableExtId=route_table_ext_id,
+            **kwargs  # fmt: skip
         )
     except Exception as e:
         raise_api_exception(
@@ -374,6 +374,7 @@ from ..module_utils.v4.prism.tasks import (  # noqa: E402
     get_entity_ext_id_from_task,
     wait_for_completion,
 )
+from ..module_utils.v4.sdk_loader import lazy_import  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
     raise_api_exception,
@@ -382,7 +383,7 @@ from ..module_utils.v4.utils import (  # noqa: E402
 
 SDK_IMP_ERROR = None
 try:
-    import ntnx_networking_py_client as net_sdk  # noqa: E402
+    net_sdk = lazy_import("ntnx_networking_py_client")
 except ImportError:
 
     from ..module_utils.v4.sdk_mock import mock_sdk as net_sdk  # noqa: E402
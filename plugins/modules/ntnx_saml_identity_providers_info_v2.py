@@ -144,6 +144,7 @@ from ..module_utils.v4.iam.api_client import (  # noqa: E402
 from ..module_utils.v4.iam.helpers import get_identity_provider  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -176,7 +177,9 @@ def get_identity_providers(module, identity_providers, result):
         module.fail_json(msg="Failed generating identity providers info Spec", **result)
 
     try:
-        resp = identity_providers.list_saml_identity_providers(**kwargs)
+        resp = list_all_pages(
+            module, identity_providers.list_saml_identity_providers, **kwargs
+        )
     except Exception as e:
         raise_api_exception(
             module=module,
@@ -150,6 +150,7 @@ from ..module_utils.v4.flow.api_client import (  # noqa: E402
 )
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -181,8 +182,11 @@ def get_network_security_policy_rules(module, result):
         )
 
     try:
-        resp = network_security_policies.list_network_security_policy_rules(
-            policyExtId=policy_ext_id, **kwargs
+        resp = list_all_pages(
+            module,
+            network_security_policies.list_network_security_policy_rules,
+            policyExtId=policy_ext_id,
+            **kwargs  # fmt: skip
         )
     except Exception as e:
         raise_api_exception(
@@ -725,6 +725,28 @@ ext_id:
   returned: always
   type: str
   sample: "00000000-0000-0000-0000-000000000000"
+rules_diff:
+  description:
+    - Rules which will be added and removed by update, and count of rules which are unchanged.
+    - Rules are compared irrespective of their order and order of references and services in them.
+  returned: in check mode of update operation
+  type: dict
+  sample: {
+            "added": [
+                {
+                    "description": "Rule allowing app to db",
+                    "ext_id": null,
+                    "spec": {
+                        "dest_category_references": ["00000000-0000-0000-0000-000000000000"],
+                        "service_group_references": null,
+                        "src_category_references": ["00000000-0000-0000-0000-000000000000"]
+                    },
+                    "type": "APPLICATION"
+                }
+            ],
+            "removed": [],
+            "unchanged": 1500
+        }
 """
 
 import traceback  # noqa: E402
@@ -740,11 +762,15 @@ from ..module_utils.v4.flow.api_client import (  # noqa: E402
     get_etag,
     get_network_security_policy_api_instance,
 )
-from ..module_utils.v4.flow.helpers import get_network_security_policy  # noqa: E402
+from ..module_utils.v4.flow.helpers import (  # noqa: E402
+    diff_security_rules,
+    get_network_security_policy,
+)
 from ..module_utils.v4.prism.tasks import (  # noqa: E402
     get_entity_ext_id_from_task,
     wait_for_completion,
 )
+from ..module_utils.v4.sdk_loader import lazy_import  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
     raise_api_exception,
@@ -753,7 +779,7 @@ from ..module_utils.v4.utils import (  # noqa: E402
 
 SDK_IMP_ERROR = None
 try:
-    import ntnx_microseg_py_client as mic_sdk  # noqa: E402
+    mic_sdk = lazy_import("ntnx_microseg_py_client")
 except ImportError:
 
     from ..module_utils.v4.sdk_mock import mock_sdk as mic_sdk  # noqa: E402
@@ -1024,48 +1050,14 @@ def create_network_security_policy(module, result):
     result["changed"] = True
 
 
-def check_network_security_policies_idempotency(old_spec, update_spec):
-
-    # check if numbers of rules are same
-    if len(old_spec.get("rules", [])) != len(update_spec.get("rules", [])):
+def check_network_security_policies_idempotency(old_spec, update_spec, rules_diff):
+    if rules_diff["added"] or rules_diff["removed"]:
         return False
 
-    # remove external ID from older spec's each rule.
-    # since update will overlap all existing rules
-
-    for rule in old_spec.get("rules", []):
-        rule["ext_id"] = None
-
-    for rule in update_spec.get("rules", []):
-        rule["ext_id"] = None
-        spec = rule.get("spec", {})
-        if (
-            "src_category_references" in spec
-            and spec["src_category_references"] is None
-        ):
-            spec["src_category_associated_entity_type"] = None
-        if (
-            "dest_category_references" in spec
-            and spec["dest_category_references"] is None
-        ):
-            spec["dest_category_associated_entity_type"] = None
-        if (
-            "secured_group_category_references" in spec
-            and spec["secured_group_category_references"] is None
-        ):
-            spec["secured_group_category_associated_entity_type"] = None
-
-    # compare rules from old and new spec
-    old_rules = old_spec.pop("rules")
-    update_rules = update_spec.pop("rules")
-
-    for rule in update_rules:
-        if rule not in old_rules:
-            return False
-
-    if old_spec != update_spec:
-        return False
-    return True
+    # compare rest of spec apart from rules
+    old_spec = dict(old_spec, rules=None)
+    update_spec = dict(update_spec, rules=None)
+    return old_spec == update_spec
 
 
 def update_network_security_policy(module, result):
@@ -1095,12 +1087,18 @@ def update_network_security_policy(module, result):
     # check for idempotency
     current_spec_dict = strip_internal_attributes(current_spec.to_dict())
     update_spec_dict = strip_internal_attributes(update_spec.to_dict())
-    if check_network_security_policies_idempotency(current_spec_dict, update_spec_dict):
+    rules_diff = diff_security_rules(
+        current_spec_dict.get("rules"), update_spec_dict.get("rules")
+    )
+    if check_network_security_policies_idempotency(
+        current_spec_dict, update_spec_dict, rules_diff
+    ):
         result["skipped"] = True
         module.exit_json(msg="Nothing to change.", **result)
 
     if module.check_mode:
-        result["response"] = strip_internal_attributes(update_spec.to_dict())
+        result["response"] = update_spec_dict
+        result["rules_diff"] = rules_diff
         return
 
     resp = None
@@ -129,6 +129,7 @@ from ..module_utils.v4.flow.api_client import (  # noqa: E402
 from ..module_utils.v4.flow.helpers import get_service_group  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -165,7 +166,7 @@ def get_service_groups(module, result):
         module.fail_json(msg="Failed generating service groups info Spec", **result)
 
     try:
-        resp = service_groups.list_service_groups(**kwargs)
+        resp = list_all_pages(module, service_groups.list_service_groups, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
@@ -143,6 +143,7 @@ from ..module_utils.v4.base_info_module import BaseInfoModule  # noqa: E402
 from ..module_utils.v4.security.api_client import get_stigs_api_instance  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -170,7 +171,7 @@ def run_module():
         )
     resp = None
     try:
-        resp = stig_api_instance.list_stigs(**kwargs)
+        resp = list_all_pages(module, stig_api_instance.list_stigs, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
@@ -155,6 +155,7 @@ from ..module_utils.v4.clusters_mgmt.api_client import (  # noqa: E402
 from ..module_utils.v4.clusters_mgmt.helpers import get_storage_container  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -190,7 +191,9 @@ def get_storage_containers(module, result):
         )
     resp = None
     try:
-        resp = storage_containers.list_storage_containers(**kwargs)
+        resp = list_all_pages(
+            module, storage_containers.list_storage_containers, **kwargs
+        )
     except Exception as e:
         raise_api_exception(
             module=module,
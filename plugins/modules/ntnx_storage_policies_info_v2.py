@@ -148,6 +148,7 @@ from ..module_utils.v4.data_policies.api_client import (  # noqa: E402
 from ..module_utils.v4.data_policies.helpers import get_storage_policy  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -182,7 +183,7 @@ def get_storage_policies(module, storage_policies, result):
         module.fail_json(msg="Failed generating storage policies info Spec", **result)
 
     try:
-        resp = storage_policies.list_storage_policies(**kwargs)
+        resp = list_all_pages(module, storage_policies.list_storage_policies, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
@@ -227,6 +227,7 @@ from ..module_utils.v4.base_info_module import BaseInfoModule  # noqa: E402
 from ..module_utils.v4.network.api_client import get_subnet_api_instance  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -272,7 +273,7 @@ def get_subnets(module, result):
         module.fail_json(msg="Failed generating subnets info Spec", **result)
 
     try:
-        resp = subnets.list_subnets(**kwargs)
+        resp = list_all_pages(module, subnets.list_subnets, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
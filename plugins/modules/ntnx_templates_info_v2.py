@@ -255,6 +255,7 @@ from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
 from ..module_utils.v4.base_info_module import BaseInfoModule  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -300,7 +301,7 @@ def get_templates(module, result):
         module.fail_json(msg="Failed generating templates info Spec", **result)
 
     try:
-        resp = templates.list_templates(**kwargs)
+        resp = list_all_pages(module, templates.list_templates, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
@@ -200,6 +200,7 @@ from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
 from ..module_utils.v4.base_info_module import BaseInfoModule  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -248,7 +249,9 @@ def get_template_versions(module, result):
         module.fail_json(msg="Failed generating template versions info Spec", **result)
 
     try:
-        resp = templates.list_template_versions(template_ext_id, **kwargs)
+        resp = list_all_pages(
+            module, templates.list_template_versions, template_ext_id, **kwargs
+        )
     except Exception as e:
         raise_api_exception(
             module=module,
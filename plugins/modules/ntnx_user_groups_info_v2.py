@@ -144,6 +144,7 @@ from ..module_utils.v4.iam.api_client import get_user_group_api_instance  # noqa
 from ..module_utils.v4.iam.helpers import get_user_group  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -175,7 +176,7 @@ def get_user_groups(module, user_groups, result):
         module.fail_json(msg="Failed generating user groups info Spec", **result)
 
     try:
-        resp = user_groups.list_user_groups(**kwargs)
+        resp = list_all_pages(module, user_groups.list_user_groups, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
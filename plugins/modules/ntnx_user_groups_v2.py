@@ -175,6 +175,7 @@ from ..module_utils.v4.iam.api_client import (  # noqa: E402
     get_user_group_api_instance,
 )
 from ..module_utils.v4.iam.helpers import get_user_group  # noqa: E402
+from ..module_utils.v4.sdk_loader import lazy_import  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
     raise_api_exception,
@@ -183,7 +184,7 @@ from ..module_utils.v4.utils import (  # noqa: E402
 
 SDK_IMP_ERROR = None
 try:
-    import ntnx_iam_py_client as iam_sdk  # noqa: E402
+    iam_sdk = lazy_import("ntnx_iam_py_client")
 except ImportError:
 
     from ..module_utils.v4.sdk_mock import mock_sdk as iam_sdk  # noqa: E402
@@ -162,6 +162,7 @@ from ..module_utils.v4.iam.api_client import get_user_api_instance  # noqa: E402
 from ..module_utils.v4.iam.helpers import get_requested_key  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -197,7 +198,9 @@ def get_user_api_keys(module, users, result):
     user_ext_id = module.params.get("user_ext_id")
     result["user_ext_id"] = user_ext_id
     try:
-        resp = users.list_user_keys(userExtId=user_ext_id, **kwargs)
+        resp = list_all_pages(
+            module, users.list_user_keys, userExtId=user_ext_id, **kwargs
+        )
     except Exception as e:
         raise_api_exception(
             module=module,
@@ -154,6 +154,7 @@ from ..module_utils.v4.iam.api_client import get_user_api_instance  # noqa: E402
 from ..module_utils.v4.iam.helpers import get_user  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -184,7 +185,7 @@ def get_users(module, users, result):
         module.fail_json(msg="Failed generating users info Spec", **result)
 
     try:
-        resp = users.list_users(**kwargs)
+        resp = list_all_pages(module, users.list_users, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
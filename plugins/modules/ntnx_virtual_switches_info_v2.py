@@ -172,6 +172,7 @@ from ..module_utils.v4.network.api_client import (  # noqa: E402
 from ..module_utils.v4.network.helpers import get_virtual_switch  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -210,7 +211,7 @@ def get_virtual_switches(module, virtual_switches, result):
         kwargs["X_Cluster_Id"] = module.params.get("cluster_ext_id")
 
     try:
-        resp = virtual_switches.list_virtual_switches(**kwargs)
+        resp = list_all_pages(module, virtual_switches.list_virtual_switches, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
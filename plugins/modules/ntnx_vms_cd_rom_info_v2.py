@@ -137,6 +137,7 @@ from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
 from ..module_utils.v4.base_info_module import BaseInfoModule  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -176,7 +177,9 @@ def get_cd_roms(module, vms, result):
         module.fail_json(msg="Failed generating vm cd roms info Spec", **result)
 
     try:
-        resp = vms.list_cd_roms_by_vm_id(vmExtId=vm_ext_id, **kwargs)
+        resp = list_all_pages(
+            module, vms.list_cd_roms_by_vm_id, vmExtId=vm_ext_id, **kwargs
+        )
     except Exception as e:
         raise_api_exception(
             module=module,
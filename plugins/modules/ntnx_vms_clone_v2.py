@@ -43,6 +43,7 @@ options:
     name:
         description:
             - VM name.
+            - If C(count) is given, C({index}) in name is substituted with index of every clone.
         required: false
         type: str
     num_sockets:
@@ -634,6 +635,28 @@ options:
         required: false
         type: bool
         default: true
+    count:
+        description:
+            - Number of clones to create, at least 1.
+            - C({index}) in any string value of C(name), C(nics), C(boot_config) and C(guest_customization)
+              is substituted with index of every clone, for example to give every clone its own name or NIC IP address.
+            - C({index}) is also substituted in decoded cloud-init user data.
+            - C(name) should have C({index}) if C(count) is more than 1.
+            - Clones are submitted with at most C(max_in_flight) clone tasks running at once and waited on together.
+        required: false
+        type: int
+    start_index:
+        description:
+            - Index of first clone, used with C(count).
+        required: false
+        type: int
+        default: 1
+    max_in_flight:
+        description:
+            - Max number of clone tasks running at once, used with C(count).
+        required: false
+        type: int
+        default: 10
 extends_documentation_fragment:
       - nutanix.ncp.ntnx_credentials
       - nutanix.ncp.ntnx_operations_v2
@@ -665,6 +688,28 @@ EXAMPLES = r"""
     num_sockets: 2
     num_cores_per_socket: 2
     num_threads_per_core: 2
+
+- name: Clone VM 50 times with per clone name and IP address
+  nutanix.ncp.ntnx_vms_clone_v2:
+    nutanix_host: "{{ ip }}"
+    nutanix_username: "{{ username }}"
+    nutanix_password: "{{ password }}"
+    validate_certs: false
+    ext_id: "de84a538-32bf-4a42-913b-340540af18fd"
+    name: "web-{index}"
+    count: 50
+    start_index: 101
+    max_in_flight: 10
+    nics:
+      - nic_network_info:
+          virtual_ethernet_nic_network_info:
+            subnet:
+              ext_id: "7f0e0d2b-3c2c-4a3f-9f7e-6c2f4b0b3a11"
+            ipv4_config:
+              should_assign_ip: true
+              ip_address:
+                value: "10.10.1.{index}"
+  register: result
 """
 
 RETURN = r"""
@@ -778,10 +823,39 @@ ext_id:
     type: str
     returned: always
     sample: "14e05447-fd70-4348-4a69-ec90f427f638"
+ext_ids:
+    description:
+        - The external IDs of cloned VMs in index order.
+        - It is null for clones which failed or are not yet created.
+    type: list
+    elements: str
+    returned: when C(count) is given and not in check mode
+    sample: ["14e05447-fd70-4348-4a69-ec90f427f638", "24e05447-fd70-4348-4a69-ec90f427f638"]
+clones:
+    description:
+        - Outcome of every clone in index order.
+        - C(status) is one of C(pending), C(submitted), C(succeeded) or C(failed).
+        - C(spec) is returned in check mode.
+    type: list
+    elements: dict
+    returned: when C(count) is given
+    sample: [
+            {
+                "index": 1,
+                "name": "web-1",
+                "ext_id": "14e05447-fd70-4348-4a69-ec90f427f638",
+                "status": "succeeded",
+                "task_ext_id": "ZXJnb24=:14e05447-fd70-4348-4a69-ec90f427f630",
+                "error": null
+            }
+        ]
 """
 
+import base64  # noqa: E402
 import traceback  # noqa: E402
 import warnings  # noqa: E402
+from copy import deepcopy  # noqa: E402
+from functools import partial  # noqa: E402
 
 from ansible.module_utils.basic import missing_required_lib  # noqa: E402
 
@@ -789,24 +863,40 @@ from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
 from ..module_utils.v4.base_module_v4 import BaseModuleV4  # noqa: E402
 from ..module_utils.v4.constants import Tasks as TASK_CONSTANTS  # noqa: E402
 from ..module_utils.v4.prism.tasks import wait_for_completion  # noqa: E402
+from ..module_utils.v4.sdk_loader import lazy_import  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
     raise_api_exception,
     strip_internal_attributes,
 )
 from ..module_utils.v4.vmm.api_client import get_etag, get_vm_api_instance  # noqa: E402
-from ..module_utils.v4.vmm.helpers import get_vm  # noqa: E402
+from ..module_utils.v4.vmm.helpers import get_vm, run_vm_operations  # noqa: E402
 from ..module_utils.v4.vmm.spec.vms import VmSpecs as vm_specs  # noqa: E402
 
 SDK_IMP_ERROR = None
 try:
-    import ntnx_vmm_py_client as vmm_sdk  # noqa: E402
+    vmm_sdk = lazy_import("ntnx_vmm_py_client")
 except ImportError:
 
     from ..module_utils.v4.sdk_mock import mock_sdk as vmm_sdk  # noqa: E402
 
     SDK_IMP_ERROR = traceback.format_exc()
 
+# placeholder substituted with index of clone in string params
+INDEX_PLACEHOLDER = "{index}"
+
+# params overriding source VM config in clones
+CLONE_OVERRIDE_PARAMS = [
+    "name",
+    "num_sockets",
+    "num_cores_per_socket",
+    "num_threads_per_core",
+    "memory_size_bytes",
+    "nics",
+    "boot_config",
+    "guest_customization",
+]
+
 # Suppress the InsecureRequestWarning
 warnings.filterwarnings("ignore", message="Unverified HTTPS request is being made")
 
@@ -837,6 +927,9 @@ def get_module_spec():
             options=vm_specs.get_gc_spec(),
             obj=vmm_sdk.GuestCustomizationParams,
         ),
+        count=dict(type="int"),
+        start_index=dict(type="int", default=1),
+        max_in_flight=dict(type="int", default=10),
     )
 
     return module_args
@@ -899,6 +992,136 @@ def clone_vm(module, result):
     result["changed"] = True
 
 
+def render_index(value, index):
+    """
+    Substitute index placeholder in all string values of given params.
+    """
+    if isinstance(value, dict):
+        return dict((k, render_index(v, index)) for k, v in value.items())
+    if isinstance(value, list):
+        return [render_index(v, index) for v in value]
+    if isinstance(value, str) and INDEX_PLACEHOLDER in value:
+        return value.replace(INDEX_PLACEHOLDER, str(index))
+    return value
+
+
+def render_user_data(params, index):
+    """
+    Substitute index placeholder in base64 encoded cloud-init user data.
+    """
+    keys = ["guest_customization", "config", "cloudinit", "cloud_init_script"]
+    script = params
+    for key in keys:
+        script = script.get(key) or {}
+    user_data = script.get("user_data") or {}
+    if not user_data.get("value"):
+        return
+    try:
+        text = base64.b64decode(user_data["value"]).decode("utf-8")
+    except (TypeError, ValueError):
+        return
+    if INDEX_PLACEHOLDER in text:
+        text = text.replace(INDEX_PLACEHOLDER, str(index))
+        user_data["value"] = base64.b64encode(text.encode("utf-8")).decode("utf-8")
+
+
+def get_clone_specs(module, result):
+    """
+    Generate clone override spec for every index of clones to be created.
+    Returns list of (outcome, spec) in index order.
+    """
+    count = module.params["count"]
+    if count < 1:
+        module.fail_json(msg="count should be at least 1", **result)
+    name = module.params.get("name")
+    if count > 1 and name and INDEX_PLACEHOLDER not in name:
+        module.fail_json(
+            msg="name should have {0} placeholder to clone multiple VMs".format(
+                INDEX_PLACEHOLDER
+            ),
+            **result,
+        )
+
+    sg = SpecGenerator(module)
+    params = dict(
+        (key, module.params[key])
+        for key in CLONE_OVERRIDE_PARAMS
+        if key in module.params
+    )
+    specs = []
+    start_index = module.params.get("start_index")
+    for index in range(start_index, start_index + count):
+        attr = render_index(deepcopy(params), index)
+        render_user_data(attr, index)
+        spec, err = sg.generate_spec(obj=vmm_sdk.CloneOverrideParams(), attr=attr)
+        if err:
+            result["error"] = err
+            module.fail_json(
+                msg="Failed generating clone spec for index {0}".format(index), **result
+            )
+        outcome = {
+            "index": index,
+            "name": attr.get("name"),
+            "ext_id": None,
+            "status": "pending",
+            "task_ext_id": None,
+            "error": None,
+        }
+        specs.append((outcome, spec))
+    return specs
+
+
+def clone_vm_copy(vmm, vm_ext_id, spec, etag):
+    return vmm.clone_vm(extId=vm_ext_id, body=spec, if_match=etag)
+
+
+def clone_vms(module, result):
+    """
+    Create count clones of VM. Clones are submitted with at most max_in_flight
+    clone tasks running at once and waited on together. Created ext_ids are
+    returned in index order, including when some of the clones failed.
+    """
+    vmm = get_vm_api_instance(module)
+    vm_ext_id = module.params["ext_id"]
+    result["vm_ext_id"] = vm_ext_id
+
+    specs = get_clone_specs(module, result)
+    outcomes = [outcome for outcome, _ in specs]
+    result["clones"] = outcomes
+    if module.check_mode:
+        for outcome, spec in specs:
+            outcome["spec"] = strip_internal_attributes(spec.to_dict())
+        return
+
+    vm = get_vm(module, vmm, vm_ext_id)
+    operations = [
+        (outcome, partial(clone_vm_copy, vmm, vm_ext_id, spec))
+        for outcome, spec in specs
+    ]
+    run_vm_operations(
+        module,
+        vmm,
+        vm_ext_id,
+        operations,
+        etag=get_etag(data=vm),
+        rel=TASK_CONSTANTS.RelEntityType.VM,
+        changes_etag=False,
+    )
+    result["ext_ids"] = [outcome["ext_id"] for outcome in outcomes]
+    result["changed"] = any(outcome["task_ext_id"] for outcome in outcomes)
+
+    failed = [outcome for outcome in outcomes if outcome["status"] == "failed"]
+    if failed:
+        result["error"] = [
+            "index {0}: {1}".format(outcome["index"], outcome["error"])
+            for outcome in failed
+        ]
+        module.fail_json(
+            msg="Failed to create {0} of {1} clones".format(len(failed), len(outcomes)),
+            **result,
+        )
+
+
 def run_module():
     module = BaseModuleV4(
         argument_spec=get_module_spec(),
@@ -916,7 +1139,10 @@ def run_module():
         "response": None,
         "ext_id": None,
     }
-    clone_vm(module, result)
+    if module.params.get("count") is not None:
+        clone_vms(module, result)
+    else:
+        clone_vm(module, result)
     module.exit_json(**result)
 
 
@@ -188,6 +188,151 @@ options:
                 description:
                     - The index of the disk.
                 type: int
+    disks:
+        description:
+            - List of disks to create, update or delete together in one module run.
+            - Disks with C(ext_id) are updated, others are created, if C(state) is C(present).
+            - Disks are deleted using their C(ext_id) if C(state) is C(absent).
+            - All disks are validated before any change is submitted.
+            - Changes are submitted pipelined, with at most C(max_in_flight) tasks running at once.
+            - Mutually exclusive with C(ext_id), C(backing_info) and C(disk_address).
+        type: list
+        elements: dict
+        suboptions:
+            ext_id:
+                description:
+                    - The external ID of the disk.
+                    - Required for updating or deleting a disk.
+                type: str
+            backing_info:
+                description:
+                    - Supporting storage to create virtual disk on.
+                type: dict
+                suboptions:
+                    vm_disk:
+                        description:
+                            - The VM disk information.
+                        type: dict
+                        suboptions:
+                            disk_size_bytes:
+                                description:
+                                    - The size of the disk in bytes.
+                                    - Mutually exclusive with C(data_source) during update.
+                                type: int
+                            storage_container:
+                                description:
+                                    - The storage container reference.
+                                type: dict
+                                suboptions:
+                                    ext_id:
+                                        description:
+                                            - The external ID of the storage container.
+                                        type: str
+                                        required: true
+                            storage_config:
+                                description:
+                                    - The storage configuration for the disk.
+                                type: dict
+                                suboptions:
+                                    is_flash_mode_enabled:
+                                        description:
+                                            - Indicates whether the virtual disk is pinned to the hot tier or not.
+                                        type: bool
+                            data_source:
+                                description:
+                                    - The data source for the disk.
+                                    - Mutually exclusive with C(disk_size_bytes) during update.
+                                type: dict
+                                suboptions:
+                                    reference:
+                                        description:
+                                            - The reference to the data source.
+                                        type: dict
+                                        suboptions:
+                                            image_reference:
+                                                description:
+                                                    - The reference to an image.
+                                                    - Mutually exclusive with C(vm_disk_reference).
+                                                type: dict
+                                                suboptions:
+                                                    image_ext_id:
+                                                        description:
+                                                            - The external ID of the image.
+                                                        type: str
+                                            vm_disk_reference:
+                                                description:
+                                                    - The reference to a VM disk.
+                                                    - Mutually exclusive with C(image_reference).
+                                                type: dict
+                                                suboptions:
+                                                    disk_ext_id:
+                                                        description:
+                                                            - The external ID of the VM disk.
+                                                        type: str
+                                                    disk_address:
+                                                        description:
+                                                            - The address of the disk.
+                                                        type: dict
+                                                        suboptions:
+                                                            bus_type:
+                                                                description:
+                                                                    - The bus type of the disk.
+                                                                type: str
+                                                                choices:
+                                                                    - 'SCSI'
+                                                                    - 'IDE'
+                                                                    - 'PCI'
+                                                                    - 'SATA'
+                                                                    - 'SPAPR'
+                                                                required: true
+                                                            index:
+                                                                description:
+                                                                    - The index of the disk.
+                                                                type: int
+                                                    vm_reference:
+                                                        description:
+                                                            - The reference to the VM.
+                                                        type: dict
+                                                        suboptions:
+                                                            ext_id:
+                                                                description:
+                                                                    - The external ID of the VM.
+                                                                type: str
+                                                                required: true
+                    adsf_volume_group:
+                        description:
+                            - The ADSF volume group reference.
+                        type: dict
+                        suboptions:
+                            volume_group_ext_id:
+                                description:
+                                    - The external ID of the volume group.
+                                type: str
+            disk_address:
+                description:
+                    - The address of the disk.
+                type: dict
+                suboptions:
+                    bus_type:
+                        description:
+                            - The bus type of the disk.
+                        type: str
+                        choices:
+                            - 'SCSI'
+                            - 'IDE'
+                            - 'PCI'
+                            - 'SATA'
+                            - 'SPAPR'
+                        required: true
+                    index:
+                        description:
+                            - The index of the disk.
+                        type: int
+    max_in_flight:
+        description:
+            - Max number of disk tasks running at once when C(disks) is given.
+        type: int
+        default: 4
     wait:
         description:
             - Whether to wait for the task to complete.
@@ -248,6 +393,33 @@ EXAMPLES = r"""
     ext_id: "98b9dc89-be08-3c56-b554-692b8b676fd7"
     state: absent
     wait: true
+
+- name: Create and resize multiple disks of a VM together
+  nutanix.ncp.ntnx_vms_disks_v2:
+    vm_ext_id: "98b9dc89-be08-3c56-b554-692b8b676fd6"
+    max_in_flight: 4
+    disks:
+      - backing_info:
+          vm_disk:
+            disk_size_bytes: 1073741824
+            storage_container:
+              ext_id: "98b9dc89-be08-3c56-b554-692b8b676fd2"
+        disk_address:
+          bus_type: "SCSI"
+          index: 2
+      - ext_id: "98b9dc89-be08-3c56-b554-692b8b676fd7"
+        backing_info:
+          vm_disk:
+            disk_size_bytes: 29843545600
+    state: present
+
+- name: Delete multiple disks of a VM
+  nutanix.ncp.ntnx_vms_disks_v2:
+    vm_ext_id: "98b9dc89-be08-3c56-b554-692b8b676fd6"
+    disks:
+      - ext_id: "98b9dc89-be08-3c56-b554-692b8b676fd7"
+      - ext_id: "98b9dc89-be08-3c56-b554-692b8b676fd8"
+    state: absent
 """
 
 RETURN = r"""
@@ -256,6 +428,7 @@ response:
         - The response from the Nutanix v4 API.
         - For create/delete it will have task response depending on c(wait).
         - For update it will have disk latest info if c(wait) is true.
+        - If C(disks) is given, it will have VM latest info if C(wait) is true.
     type: dict
     returned: always
     sample: {
@@ -314,11 +487,30 @@ ext_id:
     type: str
     returned: always
     sample: "530567f3-abda-4913-b5d0-0ab6758ec168"
+disks:
+    description:
+        - Outcome of every item of C(disks), in given order.
+        - C(status) is one of C(skipped), C(submitted), C(succeeded) or C(failed).
+        - C(ext_id) of created disks is set once their tasks succeed.
+        - C(spec) is returned in check mode.
+    type: list
+    elements: dict
+    returned: when C(disks) is given
+    sample: [
+            {
+                "ext_id": "530567f3-abda-4913-b5d0-0ab6758ec16e",
+                "operation": "create",
+                "status": "succeeded",
+                "task_ext_id": "ZXJnb24=:530567f3-abda-4913-b5d0-0ab6758ec168",
+                "error": null
+            }
+        ]
 """
 
 import traceback  # noqa: E402
 import warnings  # noqa: E402
 from copy import deepcopy  # noqa: E402
+from functools import partial  # noqa: E402
 
 from ansible.module_utils.basic import missing_required_lib  # noqa: E402
 
@@ -329,18 +521,23 @@ from ..module_utils.v4.prism.tasks import (  # noqa: E402
     wait_for_completion,
     wait_for_entity_ext_id_in_task,
 )
+from ..module_utils.v4.sdk_loader import lazy_import  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
     raise_api_exception,
     strip_internal_attributes,
 )
 from ..module_utils.v4.vmm.api_client import get_etag, get_vm_api_instance  # noqa: E402
-from ..module_utils.v4.vmm.helpers import get_disk, get_vm  # noqa: E402
+from ..module_utils.v4.vmm.helpers import (  # noqa: E402
+    get_disk,
+    get_vm,
+    run_vm_operations,
+)
 from ..module_utils.v4.vmm.spec.vms import VmSpecs as vm_specs  # noqa: E402
 
 SDK_IMP_ERROR = None
 try:
-    import ntnx_vmm_py_client as vmm_sdk  # noqa: E402
+    vmm_sdk = lazy_import("ntnx_vmm_py_client")
 except ImportError:
 
     from ..module_utils.v4.sdk_mock import mock_sdk as vmm_sdk  # noqa: E402
@@ -357,6 +554,12 @@ def get_module_spec():
         vm_ext_id=dict(type="str", required=True),
     )
     module_args.update(vm_specs.get_disk_spec())
+    disk_spec = dict(ext_id=dict(type="str"))
+    disk_spec.update(vm_specs.get_disk_spec())
+    module_args.update(
+        disks=dict(type="list", elements="dict", options=disk_spec),
+        max_in_flight=dict(type="int", default=4),
+    )
     return module_args
 
 
@@ -420,6 +623,23 @@ def check_idempotency(current_spec, update_spec):
     return True
 
 
+def strip_update_conflicts(update_spec, params):
+    """
+    Data source and disk_size_bytes cannot be sent together in update spec,
+    so the one not given in params is dropped. Returns error if both are given.
+    """
+    vm_disk = params.get("backing_info", {}).get("vm_disk", {})
+    disk_size_bytes = vm_disk.get("disk_size_bytes")
+    data_source = vm_disk.get("data_source")
+    if disk_size_bytes and data_source:
+        return "data source and disk_size_bytes cannot be sent together"
+    elif disk_size_bytes:
+        update_spec.backing_info.data_source = None
+    elif data_source:
+        update_spec.backing_info.disk_size_bytes = None
+    return None
+
+
 def update_disk(module, result):
     vmm = get_vm_api_instance(module)
     ext_id = module.params.get("ext_id")
@@ -442,20 +662,10 @@ def update_disk(module, result):
         result["skipped"] = True
         module.exit_json(msg="Nothing to change.", **result)
 
-    # data source and disk_size_bytes cannot be sent together
-    disk_size_bytes = (
-        module.params.get("backing_info", {}).get("vm_disk", {}).get("disk_size_bytes")
-    )
-    data_source = (
-        module.params.get("backing_info", {}).get("vm_disk", {}).get("data_source")
-    )
-    if disk_size_bytes and data_source:
-        result["error"] = "data source and disk_size_bytes cannot be sent together"
+    err = strip_update_conflicts(update_spec, module.params)
+    if err:
+        result["error"] = err
         module.exit_json(**result)
-    elif disk_size_bytes:
-        update_spec.backing_info.data_source = None
-    elif data_source:
-        update_spec.backing_info.disk_size_bytes = None
     if module.check_mode:
         result["response"] = strip_internal_attributes(update_spec.to_dict())
         return
@@ -515,13 +725,155 @@ def delete_disk(module, result):
     result["changed"] = True
 
 
+def get_disk_operations(module, vmm, vm_ext_id, current_disks):
+    """
+    Validate all disks given in module params and generate their specs.
+    Returns outcomes of all disks, operations to be submitted and errors.
+    """
+    sg = SpecGenerator(module)
+    disk_spec = module.argument_spec_with_extra_keys["disks"]["options"]
+    state = module.params.get("state")
+    outcomes, operations, errors = [], [], []
+    for index, disk in enumerate(module.params["disks"]):
+        ext_id = disk.get("ext_id")
+        outcome = {
+            "ext_id": ext_id,
+            "operation": None,
+            "status": "skipped",
+            "task_ext_id": None,
+            "error": None,
+        }
+        outcomes.append(outcome)
+        if state == "absent":
+            if not ext_id:
+                errors.append("disks[{0}]: ext_id is required".format(index))
+            elif ext_id in current_disks:
+                outcome["operation"] = "delete"
+                operations.append(
+                    (outcome, partial(delete_vm_disk, vmm, vm_ext_id, ext_id))
+                )
+            continue
+
+        if not ext_id:
+            if not disk.get("backing_info") and not disk.get("disk_address"):
+                errors.append(
+                    "disks[{0}]: backing_info or disk_address is required".format(index)
+                )
+                continue
+            spec, err = sg.generate_spec(
+                obj=vmm_sdk.AhvConfigDisk(), attr=disk, module_args=disk_spec
+            )
+            operation = "create"
+        else:
+            if ext_id not in current_disks:
+                errors.append("disks[{0}]: disk {1} not found".format(index, ext_id))
+                continue
+            current_spec = get_disk(module, vmm, ext_id, vm_ext_id)
+            spec, err = sg.generate_spec(
+                obj=deepcopy(current_spec), attr=disk, module_args=disk_spec
+            )
+            if not err and check_idempotency(current_spec, spec):
+                continue
+            err = err or strip_update_conflicts(spec, disk)
+            operation = "update"
+
+        if err:
+            errors.append("disks[{0}]: {1}".format(index, err))
+            continue
+        outcome["operation"] = operation
+        if module.check_mode:
+            outcome["spec"] = strip_internal_attributes(spec.to_dict())
+        elif operation == "create":
+            operations.append((outcome, partial(create_vm_disk, vmm, vm_ext_id, spec)))
+        else:
+            operations.append((outcome, partial(update_vm_disk, vmm, vm_ext_id, spec)))
+
+    return outcomes, operations, errors
+
+
+def create_vm_disk(vmm, vm_ext_id, spec, etag):
+    return vmm.create_disk(vmExtId=vm_ext_id, body=spec, if_match=etag)
+
+
+def update_vm_disk(vmm, vm_ext_id, spec, etag):
+    # sdk sends If-Match from etag in body, which is stale once an earlier
+    # operation has changed the VM
+    spec.get_reserved()["ETag"] = etag
+    return vmm.update_disk_by_id(
+        vmExtId=vm_ext_id, extId=spec.ext_id, body=spec, if_match=etag
+    )
+
+
+def delete_vm_disk(vmm, vm_ext_id, ext_id, etag):
+    # disks share etag of their VM
+    return vmm.delete_disk_by_id(vmExtId=vm_ext_id, extId=ext_id, if_match=etag)
+
+
+def manage_disks(module, result):
+    """
+    Create, update or delete all disks given in module params together. Changes
+    are submitted only if all disks are valid, and latest VM info is returned.
+    """
+    vmm = get_vm_api_instance(module)
+    vm_ext_id = module.params["vm_ext_id"]
+    result["vm_ext_id"] = vm_ext_id
+
+    vm = get_vm(module, vmm, vm_ext_id)
+    current_disks = set(disk.ext_id for disk in vm.disks or [])
+    outcomes, operations, errors = get_disk_operations(
+        module, vmm, vm_ext_id, current_disks
+    )
+    result["disks"] = outcomes
+    if errors:
+        result["error"] = errors
+        module.fail_json(msg="Failed generating vm disks specs", **result)
+
+    if module.check_mode:
+        result["changed"] = any(outcome["operation"] for outcome in outcomes)
+        return
+    if not operations:
+        result["skipped"] = True
+        result["msg"] = "Nothing to change."
+        return
+
+    run_vm_operations(
+        module,
+        vmm,
+        vm_ext_id,
+        operations,
+        etag=get_etag(vm),
+        rel=TASK_CONSTANTS.RelEntityType.VM_DISK,
+    )
+    result["changed"] = any(outcome["task_ext_id"] for outcome in outcomes)
+    if module.params.get("wait"):
+        vm = get_vm(module, vmm, vm_ext_id)
+        result["response"] = strip_internal_attributes(vm.to_dict())
+
+    failed = [outcome for outcome in outcomes if outcome["status"] == "failed"]
+    if failed:
+        result["error"] = [outcome["error"] for outcome in failed]
+        module.fail_json(
+            msg="Failed to update {0} vm disks".format(len(failed)), **result
+        )
+
+
 def run_module():
     module = BaseModuleV4(
         argument_spec=get_module_spec(),
         supports_check_mode=True,
         required_if=[
-            ("state", "absent", ("ext_id",)),
-            ("state", "present", ("ext_id", "backing_info", "disk_address"), True),
+            ("state", "absent", ("ext_id", "disks"), True),
+            (
+                "state",
+                "present",
+                ("ext_id", "backing_info", "disk_address", "disks"),
+                True,
+            ),
+        ],
+        mutually_exclusive=[
+            ("disks", "ext_id"),
+            ("disks", "backing_info"),
+            ("disks", "disk_address"),
         ],
     )
     if SDK_IMP_ERROR:
@@ -538,7 +890,9 @@ def run_module():
         "vm_ext_id": None,
     }
     state = module.params.get("state")
-    if state == "present":
+    if module.params.get("disks"):
+        manage_disks(module, result)
+    elif state == "present":
         if module.params.get("ext_id"):
             update_disk(module, result)
         else:
@@ -165,6 +165,7 @@ from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
 from ..module_utils.v4.base_info_module import BaseInfoModule  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -206,7 +207,7 @@ def get_vms(module, result):
         module.fail_json(msg="Failed generating vms info Spec", **result)
 
     try:
-        resp = vmm.list_vms(**kwargs)
+        resp = list_all_pages(module, vmm.list_vms, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
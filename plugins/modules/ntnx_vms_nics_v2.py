@@ -351,6 +351,314 @@ options:
                                         required: false
                         required: false
         required: false
+    nics:
+        description:
+            - List of NICs to create, update or delete together in one module run.
+            - NICs with C(ext_id) are updated, others are created, if C(state) is C(present).
+            - NICs are deleted using their C(ext_id) if C(state) is C(absent).
+            - All NICs are validated before any change is submitted.
+            - Changes are submitted pipelined, with at most C(max_in_flight) tasks running at once.
+            - Mutually exclusive with C(ext_id), C(backing_info), C(nic_backing_info), C(network_info) and C(nic_network_info).
+        type: list
+        elements: dict
+        suboptions:
+            ext_id:
+                description:
+                    - The external ID of the NIC.
+                    - Required for updating or deleting a NIC.
+                type: str
+            backing_info:
+                description:
+                    - The backing information for the NIC.
+                    - Deprecated, use C(nic_backing_info) instead.
+                type: dict
+                suboptions:
+                    model:
+                        description:
+                            - The model of the NIC.
+                        type: str
+                        choices:
+                            - VIRTIO
+                            - E1000
+                        required: false
+                    mac_address:
+                        description:
+                            - The MAC address of the NIC.
+                        type: str
+                        required: false
+                    is_connected:
+                        description:
+                            - Whether the NIC needs to be connected or not.
+                        type: bool
+                        required: false
+                    num_queues:
+                        description:
+                            - The number of queues for the NIC.
+                        type: int
+                        required: false
+            nic_backing_info:
+                description:
+                    - Backing Information about how NIC is associated with a VM.
+                type: dict
+                suboptions:
+                    virtual_ethernet_nic:
+                        description:
+                            - The virtual ethernet NIC information.
+                        type: dict
+                        suboptions:
+                            model:
+                                description:
+                                    - The model of the NIC.
+                                type: str
+                                choices:
+                                    - VIRTIO
+                                    - E1000
+                                required: false
+                            mac_address:
+                                description:
+                                    - The MAC address of the NIC.
+                                type: str
+                                required: false
+                            is_connected:
+                                description:
+                                    - Whether the NIC needs to be connected or not.
+                                type: bool
+                                required: false
+                            num_queues:
+                                description:
+                                    - The number of queues for the NIC.
+                                type: int
+                                required: false
+            network_info:
+                description:
+                    - The network configuration for the NIC.
+                    - Deprecated, use C(nic_network_info) instead.
+                type: dict
+                suboptions:
+                    nic_type:
+                        description:
+                            - The type of the NIC.
+                        type: str
+                        choices:
+                            - NORMAL_NIC
+                            - DIRECT_NIC
+                            - NETWORK_FUNCTION_NIC
+                            - SPAN_DESTINATION_NIC
+                        required: false
+                    network_function_chain:
+                        description:
+                            - The network function chain for the NIC.
+                        type: dict
+                        suboptions:
+                            ext_id:
+                                description:
+                                    - The external ID of the network function chain.
+                                type: str
+                                required: true
+                        required: false
+                    network_function_nic_type:
+                        description:
+                            - The type of the network function NIC.
+                        type: str
+                        choices:
+                            - INGRESS
+                            - EGRESS
+                            - TAP
+                        required: false
+                    subnet:
+                        description:
+                            - The subnet for the NIC.
+                        type: dict
+                        suboptions:
+                            ext_id:
+                                description:
+                                    - The external ID of the subnet.
+                                type: str
+                                required: true
+                        required: false
+                    vlan_mode:
+                        description:
+                            - The VLAN mode for the NIC.
+                        type: str
+                        choices:
+                            - ACCESS
+                            - TRUNK
+                        required: false
+                    trunked_vlans:
+                        description:
+                            - The trunked VLANs for the NIC.
+                        type: list
+                        elements: int
+                        required: false
+                    should_allow_unknown_macs:
+                        description:
+                            - Whether to allow unknown MAC addresses or not.
+                        type: bool
+                        required: false
+                    ipv4_config:
+                        description:
+                            - The IPv4 configuration for the NIC.
+                        type: dict
+                        suboptions:
+                            should_assign_ip:
+                                description:
+                                    - Whether to assign an IP address or not.
+                                type: bool
+                                required: false
+                            ip_address:
+                                description:
+                                    - The IP address for the NIC.
+                                type: dict
+                                suboptions:
+                                    value:
+                                        description:
+                                            - The IP address value.
+                                        type: str
+                                        required: True
+                                    prefix_length:
+                                        description:
+                                            - The prefix length for the IP address.
+                                            - Can be skipped, default it will be 32.
+                                        type: int
+                                        required: false
+                            secondary_ip_address_list:
+                                description:
+                                    - The list of secondary IP addresses for the NIC.
+                                type: list
+                                elements: dict
+                                suboptions:
+                                    value:
+                                        description:
+                                            - The IP address value.
+                                        type: str
+                                        required: true
+                                    prefix_length:
+                                        description:
+                                            - The prefix length for the IP address.
+                                            - Can be skipped, default it will be 32.
+                                        type: int
+                                        required: false
+                        required: false
+            nic_network_info:
+                description:
+                    - Network configuration for the NIC.
+                type: dict
+                suboptions:
+                    virtual_ethernet_nic_network_info:
+                        description:
+                            - The network configuration for the virtual ethernet NIC.
+                        type: dict
+                        suboptions:
+                            nic_type:
+                                description:
+                                    - The type of the NIC.
+                                type: str
+                                choices:
+                                    - NORMAL_NIC
+                                    - DIRECT_NIC
+                                    - NETWORK_FUNCTION_NIC
+                                    - SPAN_DESTINATION_NIC
+                                required: false
+                            network_function_chain:
+                                description:
+                                    - The network function chain for the NIC.
+                                type: dict
+                                suboptions:
+                                    ext_id:
+                                        description:
+                                            - The external ID of the network function chain.
+                                        type: str
+                                        required: true
+                                required: false
+                            network_function_nic_type:
+                                description:
+                                    - The type of the network function NIC.
+                                type: str
+                                choices:
+                                    - INGRESS
+                                    - EGRESS
+                                    - TAP
+                                required: false
+                            subnet:
+                                description:
+                                    - The subnet for the NIC.
+                                type: dict
+                                suboptions:
+                                    ext_id:
+                                        description:
+                                            - The external ID of the subnet.
+                                        type: str
+                                        required: true
+                                required: false
+                            vlan_mode:
+                                description:
+                                    - The VLAN mode for the NIC.
+                                type: str
+                                choices:
+                                    - ACCESS
+                                    - TRUNK
+                                required: false
+                            trunked_vlans:
+                                description:
+                                    - The trunked VLANs for the NIC.
+                                type: list
+                                elements: int
+                                required: false
+                            should_allow_unknown_macs:
+                                description:
+                                    - Whether to allow unknown MAC addresses or not.
+                                type: bool
+                                required: false
+                            ipv4_config:
+                                description:
+                                    - The IPv4 configuration for the NIC.
+                                type: dict
+                                suboptions:
+                                    should_assign_ip:
+                                        description:
+                                            - Whether to assign an IP address or not.
+                                        type: bool
+                                        required: false
+                                    ip_address:
+                                        description:
+                                            - The IP address for the NIC.
+                                        type: dict
+                                        suboptions:
+                                            value:
+                                                description:
+                                                    - The IP address value.
+                                                type: str
+                                                required: True
+                                            prefix_length:
+                                                description:
+                                                    - The prefix length for the IP address.
+                                                    - Can be skipped, default it will be 32.
+                                                type: int
+                                                required: false
+                                    secondary_ip_address_list:
+                                        description:
+                                            - The list of secondary IP addresses for the NIC.
+                                        type: list
+                                        elements: dict
+                                        suboptions:
+                                            value:
+                                                description:
+                                                    - The IP address value.
+                                                type: str
+                                                required: true
+                                            prefix_length:
+                                                description:
+                                                    - The prefix length for the IP address.
+                                                    - Can be skipped, default it will be 32.
+                                                type: int
+                                                required: false
+                                required: false
+                required: false
+    max_in_flight:
+        description:
+            - Max number of NIC tasks running at once when C(nics) is given.
+        type: int
+        default: 4
 extends_documentation_fragment:
     - nutanix.ncp.ntnx_credentials
     - nutanix.ncp.ntnx_operations_v2
@@ -419,6 +727,29 @@ EXAMPLES = r"""
       vm_ext_id: "97634446-ac09-41c8-8298-71608c6d5ac9"
       ext_id: "40a5ac91-83f6-5d35-8ae0-d8f013779377"
   register: result
+
+- name: Create multiple NICs of a VM together
+  nutanix.ncp.ntnx_vms_nics_v2:
+    vm_ext_id: "98b9dc89-be08-3c56-b554-692b8b676fd6"
+    max_in_flight: 4
+    nics:
+      - nic_network_info:
+          virtual_ethernet_nic_network_info:
+            subnet:
+              ext_id: "98b9dc89-be08-3c56-b554-692b8b676fd2"
+      - nic_network_info:
+          virtual_ethernet_nic_network_info:
+            subnet:
+              ext_id: "98b9dc89-be08-3c56-b554-692b8b676fd3"
+    state: present
+
+- name: Delete multiple NICs of a VM
+  nutanix.ncp.ntnx_vms_nics_v2:
+    vm_ext_id: "98b9dc89-be08-3c56-b554-692b8b676fd6"
+    nics:
+      - ext_id: "98b9dc89-be08-3c56-b554-692b8b676fd7"
+      - ext_id: "98b9dc89-be08-3c56-b554-692b8b676fd8"
+    state: absent
 """
 
 RETURNS = r"""
@@ -427,6 +758,7 @@ response:
         - Currently for create operation it will return the task details.
         - For update it will return the final state of VM NIC if wait is set to true. Else it will return task details.
         - For delete it will return the task details.
+        - If C(nics) is given, it will have VM latest info if C(wait) is true.
     type: dict
     returned: always
     sample: {
@@ -493,11 +825,30 @@ vm_ext_id:
 skipped:
     description: Indicates whether the operation was skipped due to no state changes (Idempotency).
     type: bool
+nics:
+    description:
+        - Outcome of every item of C(nics), in given order.
+        - C(status) is one of C(skipped), C(submitted), C(succeeded) or C(failed).
+        - C(ext_id) of created NICs is set once their tasks succeed.
+        - C(spec) is returned in check mode.
+    type: list
+    elements: dict
+    returned: when C(nics) is given
+    sample: [
+            {
+                "ext_id": "530567f3-abda-4913-b5d0-0ab6758ec16e",
+                "operation": "create",
+                "status": "succeeded",
+                "task_ext_id": "ZXJnb24=:530567f3-abda-4913-b5d0-0ab6758ec168",
+                "error": null
+            }
+        ]
 """
 
 import traceback  # noqa: E402
 import warnings  # noqa: E402
 from copy import deepcopy  # noqa: E402
+from functools import partial  # noqa: E402
 
 from ansible.module_utils.basic import missing_required_lib  # noqa: E402
 
@@ -508,18 +859,23 @@ from ..module_utils.v4.prism.tasks import (  # noqa: E402
     wait_for_completion,
     wait_for_entity_ext_id_in_task,
 )
+from ..module_utils.v4.sdk_loader import lazy_import  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
     raise_api_exception,
     strip_internal_attributes,
 )
 from ..module_utils.v4.vmm.api_client import get_etag, get_vm_api_instance  # noqa: E402
-from ..module_utils.v4.vmm.helpers import get_nic, get_vm  # noqa: E402
+from ..module_utils.v4.vmm.helpers import (  # noqa: E402
+    get_nic,
+    get_vm,
+    run_vm_operations,
+)
 from ..module_utils.v4.vmm.spec.vms import VmSpecs as vm_specs  # noqa: E402
 
 SDK_IMP_ERROR = None
 try:
-    import ntnx_vmm_py_client as vmm_sdk  # noqa: E402
+    vmm_sdk = lazy_import("ntnx_vmm_py_client")
 except ImportError:
 
     from ..module_utils.v4.sdk_mock import mock_sdk as vmm_sdk  # noqa: E402
@@ -536,6 +892,12 @@ def get_module_spec():
         vm_ext_id=dict(type="str", required=True),
     )
     module_args.update(vm_specs.get_nic_spec())
+    nic_spec = dict(ext_id=dict(type="str"))
+    nic_spec.update(vm_specs.get_nic_spec())
+    module_args.update(
+        nics=dict(type="list", elements="dict", options=nic_spec),
+        max_in_flight=dict(type="int", default=4),
+    )
     return module_args
 
 
@@ -755,12 +1117,145 @@ def delete_nic(module, result):
     result["changed"] = True
 
 
+def get_nic_operations(module, vms, vm_ext_id, current_nics):
+    """
+    Validate all NICs given in module params and generate their specs.
+    Returns outcomes of all NICs, operations to be submitted and errors.
+    """
+    sg = SpecGenerator(module)
+    nic_spec = module.argument_spec_with_extra_keys["nics"]["options"]
+    state = module.params.get("state")
+    outcomes, operations, errors = [], [], []
+    for index, nic in enumerate(module.params["nics"]):
+        ext_id = nic.get("ext_id")
+        outcome = {
+            "ext_id": ext_id,
+            "operation": None,
+            "status": "skipped",
+            "task_ext_id": None,
+            "error": None,
+        }
+        outcomes.append(outcome)
+        if state == "absent":
+            if not ext_id:
+                errors.append("nics[{0}]: ext_id is required".format(index))
+            elif ext_id in current_nics:
+                outcome["operation"] = "delete"
+                operations.append(
+                    (outcome, partial(delete_vm_nic, vms, vm_ext_id, ext_id))
+                )
+            continue
+
+        if not ext_id:
+            if not nic:
+                errors.append("nics[{0}]: NIC spec is required".format(index))
+                continue
+            spec, err = sg.generate_spec(
+                obj=vmm_sdk.AhvConfigNic(), attr=nic, module_args=nic_spec
+            )
+            operation = "create"
+        else:
+            if ext_id not in current_nics:
+                errors.append("nics[{0}]: NIC {1} not found".format(index, ext_id))
+                continue
+            current_spec = get_nic(
+                module, api_instance=vms, ext_id=ext_id, vm_ext_id=vm_ext_id
+            )
+            spec, err = sg.generate_spec(
+                obj=deepcopy(current_spec), attr=nic, module_args=nic_spec
+            )
+            if not err:
+                update_new_fields_in_spec(spec, nic)
+                if check_idempotency(current_spec, spec):
+                    continue
+            operation = "update"
+
+        if err:
+            errors.append("nics[{0}]: {1}".format(index, err))
+            continue
+        outcome["operation"] = operation
+        if module.check_mode:
+            outcome["spec"] = strip_internal_attributes(spec.to_dict())
+        elif operation == "create":
+            operations.append((outcome, partial(create_vm_nic, vms, vm_ext_id, spec)))
+        else:
+            operations.append((outcome, partial(update_vm_nic, vms, vm_ext_id, spec)))
+
+    return outcomes, operations, errors
+
+
+def create_vm_nic(vms, vm_ext_id, spec, etag):
+    return vms.create_nic(vmExtId=vm_ext_id, body=spec, if_match=etag)
+
+
+def update_vm_nic(vms, vm_ext_id, spec, etag):
+    # sdk sends If-Match from etag in body, which is stale once an earlier
+    # operation has changed the VM
+    spec.get_reserved()["ETag"] = etag
+    return vms.update_nic_by_id(
+        vmExtId=vm_ext_id, extId=spec.ext_id, body=spec, if_match=etag
+    )
+
+
+def delete_vm_nic(vms, vm_ext_id, ext_id, etag):
+    # NICs share etag of their VM
+    return vms.delete_nic_by_id(vmExtId=vm_ext_id, extId=ext_id, if_match=etag)
+
+
+def manage_nics(module, result):
+    """
+    Create, update or delete all NICs given in module params together. Changes
+    are submitted only if all NICs are valid, and latest VM info is returned.
+    """
+    vms = get_vm_api_instance(module)
+    vm_ext_id = module.params["vm_ext_id"]
+    result["vm_ext_id"] = vm_ext_id
+
+    vm = get_vm(module, vms, vm_ext_id)
+    current_nics = set(nic.ext_id for nic in vm.nics or [])
+    outcomes, operations, errors = get_nic_operations(
+        module, vms, vm_ext_id, current_nics
+    )
+    result["nics"] = outcomes
+    if errors:
+        result["error"] = errors
+        module.fail_json(msg="Failed generating vm nics specs", **result)
+
+    if module.check_mode:
+        result["changed"] = any(outcome["operation"] for outcome in outcomes)
+        return
+    if not operations:
+        result["skipped"] = True
+        result["msg"] = "Nothing to change."
+        return
+
+    run_vm_operations(
+        module,
+        vms,
+        vm_ext_id,
+        operations,
+        etag=get_etag(vm),
+        rel=TASK_CONSTANTS.RelEntityType.VM_NIC,
+    )
+    result["changed"] = any(outcome["task_ext_id"] for outcome in outcomes)
+    if module.params.get("wait"):
+        vm = get_vm(module, vms, vm_ext_id)
+        result["response"] = strip_internal_attributes(vm.to_dict())
+
+    failed = [outcome for outcome in outcomes if outcome["status"] == "failed"]
+    if failed:
+        result["error"] = [outcome["error"] for outcome in failed]
+        module.fail_json(
+            msg="Failed to update {0} vm nics".format(len(failed)), **result
+        )
+
+
 def run_module():
     module = BaseModuleV4(
         argument_spec=get_module_spec(),
         supports_check_mode=True,
         required_if=[
-            ("state", "absent", ("ext_id",)),
+            ("state", "absent", ("ext_id", "nics"), True),
             (
                 "state",
                 "present",
@@ -770,10 +1265,18 @@ def run_module():
                     "nic_backing_info",
                     "network_info",
                     "nic_network_info",
+                    "nics",
                 ),
                 True,
             ),
         ],
+        mutually_exclusive=[
+            ("nics", "ext_id"),
+            ("nics", "backing_info"),
+            ("nics", "nic_backing_info"),
+            ("nics", "network_info"),
+            ("nics", "nic_network_info"),
+        ],
     )
     if SDK_IMP_ERROR:
         module.fail_json(
@@ -789,7 +1292,9 @@ def run_module():
         "vm_ext_id": None,
     }
     state = module.params.get("state")
-    if state == "present":
+    if module.params.get("nics"):
+        manage_nics(module, result)
+    elif state == "present":
         if module.params.get("ext_id"):
             update_nic(module, result)
         else:
@@ -64,8 +64,29 @@ options:
     ext_id:
         description:
             - The external ID of the VM.
+            - Mutually exclusive with C(ext_ids) and C(filter).
         type: str
-        required: true
+    ext_ids:
+        description:
+            - The external IDs of VMs on which power action is performed in bulk.
+            - VMs are fetched in batches, actions are submitted concurrently and
+              all resulting tasks are polled together.
+            - List VMs API returns no ETag per VM, so every VM is read once for its
+              ETag right before its action is submitted. These reads can't be batched,
+              they run concurrently along with submissions.
+            - Mutually exclusive with C(ext_id) and C(filter).
+        type: list
+        elements: str
+    filter:
+        description:
+            - OData filter, power action is performed in bulk on all VMs matching it.
+            - Mutually exclusive with C(ext_id) and C(ext_ids).
+        type: str
+    max_in_flight:
+        description:
+            - Max power actions submitted concurrently in bulk mode.
+        type: int
+        default: 20
     state:
         description:
             - The desired power state of the VM.
@@ -209,6 +230,29 @@ EXAMPLES = r"""
           should_enable_script_exec: true
           should_fail_on_script_failure: true
   register: result
+
+- name: Reboot all web VMs using NGT
+  nutanix.ncp.ntnx_vms_power_actions_v2:
+      nutanix_host: "{{ ip }}"
+      validate_certs: false
+      nutanix_username: "{{ username }}"
+      nutanix_password: "{{ password }}"
+      filter: "startswith(name, 'web-')"
+      state: guest_reboot
+      max_in_flight: 50
+  register: result
+
+- name: Power off given VMs
+  nutanix.ncp.ntnx_vms_power_actions_v2:
+      nutanix_host: "{{ ip }}"
+      validate_certs: false
+      nutanix_username: "{{ username }}"
+      nutanix_password: "{{ password }}"
+      ext_ids:
+        - "0005a7b8-0b0b-4b3b-0000-000000000000"
+        - "0005a7b8-0b0b-4b3b-0000-000000000001"
+      state: power_off
+  register: result
 """
 
 RETURN = r"""
@@ -235,6 +279,22 @@ skipped:
     description: Indicates whether the power action was skipped because the VM is already in the desired state.
     type: bool
     returned: when the power action is skipped
+vms:
+    description:
+        - Outcome of power action per VM in bulk mode.
+        - status is one of pending (check mode), skipped, submitted (wait is false),
+          succeeded or failed.
+        - submit_time and completion_time are seconds since start of module.
+    type: list
+    returned: when C(ext_ids) or C(filter) is given
+    sample: [{"ext_id": "0005a7b8-0b0b-4b3b-0000-000000000000", "status": "succeeded",
+              "changed": true, "task_ext_id": "ZXJnb24=:5af2b9ff-d5b3-4b10-a0a4-5c5dde0d8a0d",
+              "error": null, "submit_time": 0.84, "completion_time": 6.12}]
+elapsed_time:
+    description: Seconds taken by all power actions in bulk mode.
+    type: float
+    returned: when C(ext_ids) or C(filter) is given
+    sample: 6.5
 msg:
     description: A human-readable message about the result of the power action.
     type: str
@@ -242,15 +302,22 @@ msg:
     sample: "Power on action completed successfully."
 """
 
+import time  # noqa: E402
 import traceback  # noqa: E402
+from concurrent.futures import ThreadPoolExecutor, as_completed  # noqa: E402
 
 from ansible.module_utils.basic import missing_required_lib  # noqa: E402
 
 from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
 from ..module_utils.v4.base_module_v4 import BaseModuleV4  # noqa: E402
-from ..module_utils.v4.prism.tasks import wait_for_completion  # noqa: E402
+from ..module_utils.v4.prism.tasks import (  # noqa: E402
+    wait_for_completion,
+    wait_for_tasks,
+)
+from ..module_utils.v4.sdk_loader import lazy_import  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -259,13 +326,28 @@ from ..module_utils.v4.vmm.helpers import get_vm  # noqa: E402
 
 SDK_IMP_ERROR = None
 try:
-    import ntnx_vmm_py_client as vmm_sdk  # noqa: E402
+    vmm_sdk = lazy_import("ntnx_vmm_py_client")
 except ImportError:
 
     from ..module_utils.v4.sdk_mock import mock_sdk as vmm_sdk  # noqa: E402
 
     SDK_IMP_ERROR = traceback.format_exc()
 
+# VMs fetched per list call while fetching VMs of given ext_ids
+VM_BATCH_SIZE = 50
+
+POWER_ACTIONS = {
+    "power_on": "power_on_vm",
+    "power_off": "power_off_vm",
+    "force_power_cycle": "power_cycle_vm",
+    "reset": "reset_vm",
+    "shutdown": "shutdown_vm",
+    "guest_shutdown": "shutdown_guest_vm",
+    "reboot": "reboot_vm",
+    "guest_reboot": "reboot_guest_vm",
+}
+GUEST_POWER_ACTIONS = ["guest_shutdown", "guest_reboot"]
+
 
 def get_module_spec():
     guest_power_state_transition_config = dict(
@@ -273,19 +355,13 @@ def get_module_spec():
         should_fail_on_script_failure=dict(type="bool"),
     )
     module_args = dict(
-        ext_id=dict(type="str", required=True),
+        ext_id=dict(type="str"),
+        ext_ids=dict(type="list", elements="str"),
+        filter=dict(type="str"),
+        max_in_flight=dict(type="int", default=20),
         state=dict(
             type="str",
-            choices=[
-                "power_on",
-                "power_off",
-                "force_power_cycle",
-                "reset",
-                "shutdown",
-                "guest_shutdown",
-                "reboot",
-                "guest_reboot",
-            ],
+            choices=list(POWER_ACTIONS.keys()),
             default="power_on",
         ),
         guest_power_state_transition_config=dict(
@@ -297,59 +373,49 @@ def get_module_spec():
     return module_args
 
 
+def get_guest_power_options_spec(module, result):
+    sg = SpecGenerator(module)
+    default_spec = vmm_sdk.GuestPowerOptions()
+    spec, err = sg.generate_spec(obj=default_spec)
+    if err:
+        result["error"] = err
+        module.fail_json(msg="Failed generating spec for guest reboot vm", **result)
+    return spec
+
+
+def is_in_desired_state(vm, state):
+    return (vm.power_state == "ON" and state == "power_on") or (
+        vm.power_state == "OFF" and state != "power_on"
+    )
+
+
+def submit_power_action(vmm, state, vm_ext_id, etag, spec=None):
+    kwargs = {"if_match": etag}
+    if state in GUEST_POWER_ACTIONS:
+        kwargs["body"] = spec
+    return getattr(vmm, POWER_ACTIONS[state])(extId=vm_ext_id, **kwargs)
+
+
 def power_actions(module, state, result):
     vmm = get_vm_api_instance(module)
     vm_ext_id = module.params["ext_id"]
     result["ext_id"] = vm_ext_id
-    if module.check_mode or state == "guest_shutdown" or state == "guest_reboot":
-        sg = SpecGenerator(module)
-        default_spec = vmm_sdk.GuestPowerOptions()
-        spec, err = sg.generate_spec(obj=default_spec)
-        if err:
-            result["error"] = err
-            module.fail_json(msg="Failed generating spec for guest reboot vm", **result)
+    spec = None
+    if module.check_mode or state in GUEST_POWER_ACTIONS:
+        spec = get_guest_power_options_spec(module, result)
         if module.check_mode:
             result["response"] = strip_internal_attributes(spec.to_dict())
             return
 
     vm = get_vm(module, vmm, vm_ext_id)
-    if (vm.power_state == "ON" and state == "power_on") or (
-        vm.power_state == "OFF" and state != "power_on"
-    ):
+    if is_in_desired_state(vm, state):
         result["skipped"] = True
         module.exit_json(msg="Nothing to change.", **result)
         return
     etag = get_etag(vm)
-    kwargs = {"if_match": etag}
     resp = None
     try:
-        if state == "power_on":
-            resp = vmm.power_on_vm(extId=vm_ext_id, **kwargs)
-
-        elif state == "power_off":
-            resp = vmm.power_off_vm(extId=vm_ext_id, **kwargs)
-
-        elif state == "force_power_cycle":
-            resp = vmm.power_cycle_vm(extId=vm_ext_id, **kwargs)
-
-        elif state == "reset":
-            resp = vmm.reset_vm(extId=vm_ext_id, **kwargs)
-
-        elif state == "shutdown":
-            resp = vmm.shutdown_vm(extId=vm_ext_id, **kwargs)
-
-        elif state == "guest_shutdown":
-            resp = vmm.shutdown_guest_vm(extId=vm_ext_id, body=spec, **kwargs)
-
-        elif state == "reboot":
-            resp = vmm.reboot_vm(extId=vm_ext_id, **kwargs)
-
-        elif state == "guest_reboot":
-            resp = vmm.reboot_guest_vm(extId=vm_ext_id, body=spec, **kwargs)
-
-        else:
-            result["error"] = "Action is not supported"
-            module.fail_json(msg="Action is not supported", **result)
+        resp = submit_power_action(vmm, state, vm_ext_id, etag, spec)
     except Exception as e:
         raise_api_exception(
             module=module,
@@ -369,10 +435,156 @@ def power_actions(module, state, result):
     result["changed"] = True
 
 
+def get_vms(module, vmm, ext_ids=None, filter=None):
+    """
+    Fetch VMs of given ext_ids in batches using extId filter, or all VMs
+    matching given OData filter. Returns list of VMs in order of given ext_ids.
+    """
+    try:
+        if filter:
+            resp = list_all_pages(module, vmm.list_vms, _filter=filter, fetch_all=True)
+            return resp.data or []
+        vms = {}
+        for i in range(0, len(ext_ids), VM_BATCH_SIZE):
+            batch = ext_ids[i : i + VM_BATCH_SIZE]
+            batch_filter = " or ".join(
+                "extId eq '{0}'".format(ext_id) for ext_id in batch
+            )
+            resp = vmm.list_vms(_filter=batch_filter, _limit=len(batch))
+            for vm in resp.data or []:
+                vms[vm.ext_id] = vm
+    except Exception as e:
+        raise_api_exception(
+            module=module,
+            exception=e,
+            msg="Api Exception raised while fetching VMs",
+        )
+    return [vms[ext_id] for ext_id in ext_ids if ext_id in vms]
+
+
+def get_task_error(task, err):
+    messages = [
+        error.message
+        for error in getattr(task, "error_messages", None) or []
+        if getattr(error, "message", None)
+    ]
+    return "; ".join(messages) or err
+
+
+def submit_power_actions(module, vmm, state, vms, outcomes, spec, start_time):
+    """
+    Submit power action on given VMs with at most max_in_flight actions in flight.
+    Listed VMs carry no etag, so each VM is read for its etag by the same worker
+    which submits its action.
+    """
+
+    def submit(vm):
+        etag = get_etag(vmm.get_vm_by_id(extId=vm.ext_id).data)
+        return submit_power_action(vmm, state, vm.ext_id, etag, spec)
+
+    max_workers = min(max(module.params.get("max_in_flight") or 1, 1), len(vms))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = dict((executor.submit(submit, vm), vm.ext_id) for vm in vms)
+        for future in as_completed(futures):
+            outcome = outcomes[futures[future]]
+            outcome["submit_time"] = round(time.time() - start_time, 3)
+            try:
+                outcome["task_ext_id"] = future.result().data.ext_id
+            except Exception as e:
+                outcome["status"] = "failed"
+                outcome["error"] = str(e)
+                continue
+            outcome["status"] = "submitted"
+            outcome["changed"] = True
+
+
+def wait_for_power_action_tasks(module, outcomes, start_time):
+    """
+    Wait for all submitted tasks together and record their outcomes.
+    """
+    pending = dict(
+        (outcome["task_ext_id"], outcome)
+        for outcome in outcomes.values()
+        if outcome["status"] == "submitted" and outcome["task_ext_id"]
+    )
+    if not pending:
+        return
+    for task_ext_id, task, err in wait_for_tasks(module, list(pending.keys())):
+        outcome = pending[task_ext_id]
+        outcome["completion_time"] = round(time.time() - start_time, 3)
+        if err:
+            outcome["status"] = "failed"
+            outcome["error"] = get_task_error(task, err)
+        else:
+            outcome["status"] = "succeeded"
+
+
+def bulk_power_actions(module, state, result):
+    start_time = time.time()
+    vmm = get_vm_api_instance(module)
+    spec = None
+    if module.check_mode or state in GUEST_POWER_ACTIONS:
+        spec = get_guest_power_options_spec(module, result)
+        if module.check_mode:
+            result["response"] = strip_internal_attributes(spec.to_dict())
+
+    # de-duplicate ext_ids keeping order
+    ext_ids = list(dict.fromkeys(module.params.get("ext_ids") or []))
+    vms = get_vms(module, vmm, ext_ids=ext_ids, filter=module.params.get("filter"))
+
+    outcomes = {}
+    for vm in vms:
+        outcomes[vm.ext_id] = {
+            "ext_id": vm.ext_id,
+            "status": "pending",
+            "changed": False,
+            "task_ext_id": None,
+            "error": None,
+        }
+    for ext_id in ext_ids:
+        if ext_id not in outcomes:
+            outcomes[ext_id] = {
+                "ext_id": ext_id,
+                "status": "failed",
+                "changed": False,
+                "task_ext_id": None,
+                "error": "VM not found",
+            }
+
+    vms_to_change = []
+    for vm in vms:
+        if is_in_desired_state(vm, state):
+            outcomes[vm.ext_id]["status"] = "skipped"
+        elif module.check_mode:
+            outcomes[vm.ext_id]["changed"] = True
+        else:
+            vms_to_change.append(vm)
+
+    if vms_to_change:
+        submit_power_actions(
+            module, vmm, state, vms_to_change, outcomes, spec, start_time
+        )
+        if module.params.get("wait"):
+            wait_for_power_action_tasks(module, outcomes, start_time)
+
+    result["vms"] = list(outcomes.values())
+    result["changed"] = any(outcome["changed"] for outcome in outcomes.values())
+    result["elapsed_time"] = round(time.time() - start_time, 3)
+
+    failed = [outcome for outcome in outcomes.values() if outcome["status"] == "failed"]
+    if failed:
+        result["error"] = "Power action failed for {0} of {1} VMs".format(
+            len(failed), len(outcomes)
+        )
+        module.fail_json(msg=result["error"], **result)
+
+
 def run_module():
     module = BaseModuleV4(
         argument_spec=get_module_spec(),
         supports_check_mode=True,
+        mutually_exclusive=[("ext_id", "ext_ids", "filter")],
+        required_one_of=[("ext_id", "ext_ids", "filter")],
     )
     if SDK_IMP_ERROR:
         module.fail_json(
@@ -386,7 +598,10 @@ def run_module():
         "ext_id": None,
     }
     state = module.params.get("state")
-    power_actions(module, state, result)
+    if module.params.get("ext_id"):
+        power_actions(module, state, result)
+    else:
+        bulk_power_actions(module, state, result)
     module.exit_json(**result)
 
 
@@ -221,6 +221,7 @@ from ansible.module_utils.basic import missing_required_lib  # noqa: E402
 from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
 from ..module_utils.v4.base_module_v4 import BaseModuleV4  # noqa: E402
 from ..module_utils.v4.prism.tasks import wait_for_completion  # noqa: E402
+from ..module_utils.v4.sdk_loader import lazy_import  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
     raise_api_exception,
@@ -230,7 +231,7 @@ from ..module_utils.v4.volumes.api_client import get_vg_api_instance  # noqa: E4
 
 SDK_IMP_ERROR = None
 try:
-    import ntnx_volumes_py_client as volumes_sdk  # noqa: E402
+    volumes_sdk = lazy_import("ntnx_volumes_py_client")
 except ImportError:
 
     from ..module_utils.v4.sdk_mock import mock_sdk as volumes_sdk  # noqa: E402
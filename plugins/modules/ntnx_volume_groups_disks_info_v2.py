@@ -136,6 +136,7 @@ from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
 from ..module_utils.v4.base_info_module import BaseInfoModule  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -183,8 +184,11 @@ def get_vg_disks(module, result):
         module.fail_json(msg="Failed generating volume group disks info Spec", **result)
 
     try:
-        resp = vgs.list_volume_disks_by_volume_group_id(
-            volumeGroupExtId=volume_group_ext_id, **kwargs
+        resp = list_all_pages(
+            module,
+            vgs.list_volume_disks_by_volume_group_id,
+            volumeGroupExtId=volume_group_ext_id,
+            **kwargs  # fmt: skip
         )
     except Exception as e:
         raise_api_exception(
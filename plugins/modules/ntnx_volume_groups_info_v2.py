@@ -140,6 +140,7 @@ from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
 from ..module_utils.v4.base_info_module import BaseInfoModule  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -181,7 +182,7 @@ def get_vgs(module, result):
         module.fail_json(msg="Failed generating volume groups info Spec", **result)
 
     try:
-        resp = vgs.list_volume_groups(**kwargs)
+        resp = list_all_pages(module, vgs.list_volume_groups, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
@@ -120,6 +120,7 @@ from ..module_utils.utils import remove_param_with_none_value  # noqa: E402
 from ..module_utils.v4.base_info_module import BaseInfoModule  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -163,7 +164,7 @@ def get_iscsi_clients(module, result):
         module.fail_json(msg="Failed generating info Spec", **result)
 
     try:
-        resp = clients.list_iscsi_clients(**kwargs)
+        resp = list_all_pages(module, clients.list_iscsi_clients, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
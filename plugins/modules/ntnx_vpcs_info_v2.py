@@ -182,6 +182,7 @@ from ..module_utils.v4.network.api_client import get_vpc_api_instance  # noqa: E
 from ..module_utils.v4.network.helpers import get_vpc  # noqa: E402
 from ..module_utils.v4.spec_generator import SpecGenerator  # noqa: E402
 from ..module_utils.v4.utils import (  # noqa: E402
+    list_all_pages,
     raise_api_exception,
     strip_internal_attributes,
 )
@@ -210,7 +211,7 @@ def get_vpcs(module, result):
         module.fail_json(msg="Failed generating vpcs info Spec", **result)
 
     try:
-        resp = vpcs.list_vpcs(**kwargs)
+        resp = list_all_pages(module, vpcs.list_vpcs, **kwargs)
     except Exception as e:
         raise_api_exception(
             module=module,
@@ -7,8 +7,19 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import hashlib
+import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from ansible.errors import AnsibleError
 from ansible.module_utils._text import to_text
+from ansible.module_utils.common.json import AnsibleJSONEncoder
+from jinja2 import Environment, TemplateSyntaxError, meta, nodes
+
+# max prism centrals fetched from in parallel by one inventory source
+MAX_CONCURRENT_PRISM_CENTRALS = 16
 
 
 def get_hostname(compose_func, host_vars, hostnames, default_name, strict=False):
@@ -28,3 +39,297 @@ def get_hostname(compose_func, host_vars, hostnames, default_name, strict=False)
         if hostname:
             return to_text(hostname)
     return default_name
+
+
+def get_inventory_cache_key(base_key, options):
+    """
+    Build inventory cache key from default cache key of inventory source and
+    options deciding the fetched hosts (host, port, user, filter, page etc.),
+    so that changing any of them never serves hosts cached for other values.
+    """
+    digest = hashlib.sha256(
+        json.dumps(options, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    return "{0}_{1}".format(base_key, digest[:16])
+
+
+def load_inventory_cache(cache, cache_key):
+    """
+    Return inventory data cached against given key, None if it is absent or expired.
+    """
+    try:
+        return cache[cache_key]
+    except KeyError:
+        return None
+
+
+def get_cacheable_data(data):
+    """
+    Return copy of inventory data with values not supported by JSON based
+    cache plugins, like datetime of SDK objects, converted to strings.
+    """
+    return json.loads(json.dumps(data, cls=AnsibleJSONEncoder))
+
+
+def get_prism_central_endpoints(plugin):
+    """
+    Return list of Prism Central endpoints to fetch hosts from.
+    Endpoints are taken from prism_centrals option, else single endpoint given
+    using nutanix_* options or environment variables is used. Values not given
+    for an endpoint fall back to values of nutanix_* options.
+    """
+    default = {
+        "nutanix_host": plugin.nutanix_host,
+        "nutanix_port": plugin.nutanix_port,
+        "nutanix_username": plugin.nutanix_username,
+        "nutanix_password": plugin.nutanix_password,
+        "nutanix_api_key": plugin.nutanix_api_key,
+        "validate_certs": plugin.validate_certs,
+    }
+    prism_centrals = plugin.get_option("prism_centrals") or [{}]
+
+    endpoints = []
+    for prism_central in prism_centrals:
+        endpoint = dict(default)
+        endpoint.update(
+            (key, value) for key, value in prism_central.items() if value is not None
+        )
+        if not endpoint.get("nutanix_host"):
+            raise AnsibleError(
+                "nutanix_host must be provided either in inventory file or as NUTANIX_HOSTNAME environment variable or NUTANIX_HOST environment variable"
+            )
+        if (
+            not endpoint.get("nutanix_username") or not endpoint.get("nutanix_password")
+        ) and not endpoint.get("nutanix_api_key"):
+            raise AnsibleError(
+                "Either nutanix_username and nutanix_password or nutanix_api_key is required for {0}".format(
+                    endpoint["nutanix_host"]
+                )
+            )
+        endpoint["name"] = to_text(endpoint.get("name") or endpoint["nutanix_host"])
+        endpoints.append(endpoint)
+
+    names = [endpoint["name"] for endpoint in endpoints]
+    if len(set(names)) != len(names):
+        raise AnsibleError("Names of prism_centrals must be unique: {0}".format(names))
+    return endpoints
+
+
+def fetch_from_prism_centrals(endpoints, fetch_func, display):
+    """
+    Run fetch_func(endpoint) for all endpoints concurrently.
+    Failure of one Prism Central is reported without aborting others.
+    Returns list of (endpoint, data, error, elapsed seconds) in endpoint order.
+    """
+
+    def fetch(endpoint):
+        start = time.time()
+        try:
+            data, error = fetch_func(endpoint), None
+        except Exception as e:
+            data, error = None, to_text(e)
+        return endpoint, data, error, time.time() - start
+
+    if len(endpoints) == 1:
+        results = [fetch(endpoints[0])]
+    else:
+        max_workers = min(len(endpoints), MAX_CONCURRENT_PRISM_CENTRALS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(fetch, endpoints))
+
+    for endpoint, data, error, elapsed in results:
+        if error:
+            display.warning(
+                "Failed to fetch inventory from Prism Central {0} in {1:.2f}s: {2}".format(
+                    endpoint["name"], elapsed, error
+                )
+            )
+        else:
+            display.v(
+                "Fetched inventory from Prism Central {0} in {1:.2f}s".format(
+                    endpoint["name"], elapsed
+                )
+            )
+
+    failed = [result for result in results if result[2]]
+    if len(failed) == len(results):
+        if len(results) == 1:
+            raise AnsibleError(failed[0][2])
+        raise AnsibleError("Failed to fetch inventory from all Prism Centrals")
+    return results
+
+
+def add_prism_central_group(inventory, endpoint, elapsed, error=None):
+    """
+    Add group for given Prism Central with fetch time and error, if any, as group vars.
+    Returns name of the group.
+    """
+    group_name = "prism_central_{0}".format(
+        re.sub(r"[^A-Za-z0-9_]", "_", endpoint["name"])
+    )
+    group_name = inventory.add_group(group_name)
+    inventory.add_child("all", group_name)
+    inventory.set_variable(group_name, "prism_central_fetch_time", round(elapsed, 3))
+    if error:
+        inventory.set_variable(group_name, "prism_central_error", error)
+    return group_name
+
+
+def resolve_duplicate_hostname(hostname, seen, policy, prism_central, unique_id):
+    """
+    Resolve hostname already added to inventory as per duplicate_hostnames policy.
+    - merge: keep hostname, host vars of later host override earlier ones
+    - first: skip later hosts, returns None
+    - suffix: append prism central name, and unique id if still duplicate
+    seen is updated with resolved hostname.
+    """
+    if hostname in seen and policy != "merge":
+        if policy == "first":
+            return None
+        candidate = "{0}_{1}".format(hostname, prism_central)
+        if candidate in seen:
+            candidate = "{0}_{1}".format(candidate, unique_id)
+        hostname = candidate
+    seen.add(hostname)
+    return hostname
+
+
+def get_expression_variables(expressions):
+    """
+    Return names of variables referred by given Jinja2 expressions, like the
+    ones used in compose, groups, keyed_groups, filters and hostnames.
+    Returns None if any expression can not be parsed.
+    """
+    env = Environment()
+    variables = set()
+    for expression in expressions:
+        if not expression or not isinstance(expression, str):
+            continue
+        try:
+            ast = env.parse("{{ %s }}" % expression)
+        except TemplateSyntaxError:
+            return None
+        variables.update(meta.find_undeclared_variables(ast))
+    return variables
+
+
+def _quote_odata_string(value):
+    return "'{0}'".format(value.replace("'", "''"))
+
+
+def _get_string_constant(node):
+    """Return value of non empty string constant node, None otherwise."""
+    if isinstance(node, nodes.Const) and isinstance(node.value, str) and node.value:
+        return node.value
+    return None
+
+
+def _translate_compare(node, fields):
+    """Translate C(var == 'x') and C(var in ['x', 'y']) to OData clause."""
+    if len(node.ops) != 1:
+        return None
+    left, op, right = node.expr, node.ops[0].op, node.ops[0].expr
+    if op == "eq" and isinstance(left, nodes.Const):
+        left, right = right, left
+    if not isinstance(left, nodes.Name) or left.name not in fields:
+        return None
+
+    if op == "eq":
+        values = [_get_string_constant(right)]
+    elif op == "in" and isinstance(right, (nodes.List, nodes.Tuple)) and right.items:
+        values = [_get_string_constant(item) for item in right.items]
+    else:
+        return None
+    if not all(values):
+        return None
+
+    prop, enum_type = fields[left.name]
+    clauses = [
+        "{0} eq {1}{2}".format(prop, enum_type or "", _quote_odata_string(value))
+        for value in values
+    ]
+    if len(clauses) == 1:
+        return clauses[0]
+    return "({0})".format(" or ".join(clauses))
+
+
+def _translate_startswith(node, fields):
+    """Translate C(var.startswith('x')) to OData clause."""
+    func = node.node
+    if (
+        not isinstance(func, nodes.Getattr)
+        or func.attr != "startswith"
+        or not isinstance(func.node, nodes.Name)
+        or func.node.name not in fields
+        or fields[func.node.name][1]
+        or len(node.args) != 1
+        or node.kwargs
+        or node.dyn_args
+        or node.dyn_kwargs
+    ):
+        return None
+    value = _get_string_constant(node.args[0])
+    if not value:
+        return None
+    return "startswith({0}, {1})".format(
+        fields[func.node.name][0], _quote_odata_string(value)
+    )
+
+
+def _translate_filter_node(node, fields):
+    """Return OData clause for Jinja2 expression node, None if it is not supported."""
+    if isinstance(node, nodes.And):
+        left = _translate_filter_node(node.left, fields)
+        right = _translate_filter_node(node.right, fields)
+        if left and right:
+            return "{0} and {1}".format(left, right)
+    elif isinstance(node, nodes.Compare):
+        return _translate_compare(node, fields)
+    elif isinstance(node, nodes.Call):
+        return _translate_startswith(node, fields)
+    return None
+
+
+def push_down_filters(filters, fields):
+    """
+    Split Jinja2 filter expressions into OData $filter for expressions which can
+    be evaluated by API, and residual expressions to be evaluated locally.
+    Supported expressions are equality with string, membership in list of strings,
+    startswith() with string and their and combinations, on variables in fields.
+    Args:
+        filters (list): Jinja2 filter expressions
+        fields (dict): variable name to (OData property, OData enum type or None)
+    Returns:
+        odata_filter (str): OData filter of pushed down expressions, None if none
+        residual (list): expressions to be evaluated locally
+    """
+    env = Environment()
+    clauses = []
+    residual = []
+    for expression in filters or []:
+        clause = None
+        if isinstance(expression, str):
+            try:
+                template = env.parse("{{ %s }}" % expression)
+            except TemplateSyntaxError:
+                template = None
+            if (
+                template
+                and len(template.body) == 1
+                and isinstance(template.body[0], nodes.Output)
+                and len(template.body[0].nodes) == 1
+            ):
+                clause = _translate_filter_node(template.body[0].nodes[0], fields)
+        if clause:
+            clauses.append(clause)
+        else:
+            residual.append(expression)
+    return combine_odata_filters(*clauses), residual
+
+
+def combine_odata_filters(*filters):
+    """Combine given OData filters using and, None if there are none."""
+    filters = [odata_filter for odata_filter in filters if odata_filter]
+    if len(filters) <= 1:
+        return filters[0] if filters else None
+    return " and ".join("({0})".format(odata_filter) for odata_filter in filters)
@@ -0,0 +1,315 @@
+from __future__ import absolute_import, division, print_function
+
+import json
+import os
+import time
+import tracemalloc
+
+from ansible_collections.nutanix.ncp.plugins.module_utils.v3.ndb.operations import (
+    Operation,
+)
+from ansible_collections.nutanix.ncp.plugins.module_utils.v3.prism.protection_rules import (
+    ProtectionRule,
+)
+from ansible_collections.nutanix.ncp.plugins.module_utils.v3.prism.recovery_plans import (
+    RecoveryPlan,
+)
+from ansible_collections.nutanix.ncp.plugins.module_utils.v3.prism.vms import VM
+from ansible_collections.nutanix.ncp.plugins.module_utils.v3.uuid_cache import (
+    clear_uuid_cache,
+)
+from ansible_collections.nutanix.ncp.tests.unit.compat import unittest
+from ansible_collections.nutanix.ncp.tests.unit.mock_server import (
+    HAS_CRYPTOGRAPHY,
+    MockNutanixServer,
+    get_name,
+    get_uuid,
+)
+
+__metaclass__ = type
+
+try:
+    import resource
+except ImportError:
+    # windows
+    resource = None
+
+try:
+    import ntnx_prism_py_client  # noqa: F401
+
+    HAS_PRISM_SDK = True
+except ImportError:
+    HAS_PRISM_SDK = False
+
+
+# Benchmarks are run against local mock server, so that api call counts,
+# wall time and memory of pagination, inventory parse, task polling and spec
+# generation are checked in CI. Results are appended as json lines to file
+# given by NUTANIX_BENCHMARK_RESULTS, if set.
+
+VM_COUNT = 3000
+LATENCY = 0.005
+TASK_DURATION = 2.0
+
+# budgets, beyond which benchmark fails as regression
+LIST_PAGE_SIZE = 500
+INVENTORY_MAX_TRACED_MB = 40
+TASK_POLLING_MAX_CALLS = 10
+TASK_POLLING_MAX_OVERSHOOT = 1.5
+SPEC_GENERATION_MAX_CALLS = 3
+AFFECTED_ENTITIES_MAX_TRACED_MB = 5
+RECOVERY_PLAN_VMS = 600
+RECOVERY_PLAN_STAGES = 6
+
+
+class Module:
+    def __init__(self, params):
+        self.params = dict(
+            params,
+            load_params_without_defaults=False,
+            timeout=60,
+            read_timeout=30000,
+        )
+        self.tmpdir = "/tmp"
+
+    def jsonify(self, data):
+        return json.dumps(data)
+
+    def fail_json(self, msg=None, **kwargs):
+        raise AssertionError("fail_json called: {0} {1}".format(msg, kwargs))
+
+
+def get_peak_rss_kb():
+    """Peak resident set size of this process so far."""
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+class Benchmark(object):
+    """
+    Measures api calls, wall time and memory of code run in its context.
+    """
+
+    def __init__(self, name, server):
+        self.name = name
+        self.server = server
+        self.stats = {}
+
+    def __enter__(self):
+        self.server.reset_stats()
+        tracemalloc.start()
+        self.start_time = time.time()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        wall_time = time.time() - self.start_time
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.stats = {
+            "name": self.name,
+            "calls": self.server.total_calls,
+            "calls_by_route": dict(
+                ("{0} {1}".format(*key), count)
+                for key, count in self.server.calls.items()
+            ),
+            "wall_time": round(wall_time, 3),
+            "peak_traced_mb": round(peak / 1024.0 / 1024.0, 2),
+            "peak_rss_kb": get_peak_rss_kb(),
+        }
+        if exc_type is None:
+            self._report()
+
+    def _report(self):
+        path = os.environ.get("NUTANIX_BENCHMARK_RESULTS")
+        if path:
+            with open(path, "a") as f:
+                f.write(json.dumps(self.stats) + "\n")
+
+
+@unittest.skipUnless(HAS_CRYPTOGRAPHY, "cryptography is required for mock server")
+class TestBenchmarks(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = MockNutanixServer(
+            counts={"vms": VM_COUNT, "clusters": 3, "subnets": 50, "images": 20},
+            latency=LATENCY,
+            max_page_size=LIST_PAGE_SIZE,
+            task_duration=TASK_DURATION,
+        ).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        clear_uuid_cache()
+        self.module = Module(self.server.get_module_params())
+
+    def test_pagination(self):
+        vm = VM(self.module)
+        with Benchmark("pagination", self.server) as benchmark:
+            resp = vm.list({"length": LIST_PAGE_SIZE}, fetch_all_vms=True)
+
+        self.assertEqual(len(resp["entities"]), VM_COUNT)
+        self.assertEqual(
+            len(set(entity["metadata"]["uuid"] for entity in resp["entities"])),
+            VM_COUNT,
+        )
+        # one call per page
+        self.assertEqual(benchmark.stats["calls"], VM_COUNT // LIST_PAGE_SIZE)
+
+    def test_inventory_parse(self):
+        from ansible.inventory.data import InventoryData
+        from ansible_collections.nutanix.ncp.plugins.inventory.ntnx_prism_vm_inventory import (
+            InventoryModule,
+        )
+
+        plugin = InventoryModule()
+        inventory = InventoryData()
+        vm = VM(self.module)
+        with Benchmark("inventory_parse", self.server) as benchmark:
+            for entity in vm.iter_list({"length": LIST_PAGE_SIZE}, fetch_all_vms=True):
+                host_vars = plugin._build_host_vars(entity)
+                inventory.add_host(host_vars["name"])
+                for key, value in host_vars.items():
+                    inventory.set_variable(host_vars["name"], key, value)
+
+        self.assertEqual(len(inventory.hosts), VM_COUNT)
+        self.assertEqual(inventory.get_host("vms-7").vars["ansible_host"], "10.0.0.7")
+        self.assertEqual(benchmark.stats["calls"], VM_COUNT // LIST_PAGE_SIZE)
+        self.assertLess(benchmark.stats["peak_traced_mb"], INVENTORY_MAX_TRACED_MB)
+
+    def test_ndb_operation_polling(self):
+        operation = Operation(self.module)
+        operation_id = self.server.create_job()
+        with Benchmark("ndb_operation_polling", self.server) as benchmark:
+            resp = operation.wait_for_completion(operation_id)
+
+        self.assertEqual(resp["status"], "5")
+        self.assertLessEqual(benchmark.stats["calls"], TASK_POLLING_MAX_CALLS)
+        self.assertLess(
+            benchmark.stats["wall_time"], TASK_DURATION + TASK_POLLING_MAX_OVERSHOOT
+        )
+
+    @unittest.skipUnless(HAS_PRISM_SDK, "ntnx_prism_py_client is required")
+    def test_v4_task_polling(self):
+        from ansible_collections.nutanix.ncp.plugins.module_utils.v4.prism.tasks import (
+            wait_for_tasks,
+        )
+
+        ext_ids = [
+            self.server.create_job(duration=TASK_DURATION * (1 + i % 2))
+            for i in range(20)
+        ]
+        with Benchmark("v4_task_polling", self.server) as benchmark:
+            results = list(wait_for_tasks(self.module, ext_ids))
+
+        self.assertEqual(sorted(ext_id for ext_id, _, _ in results), sorted(ext_ids))
+        self.assertEqual([err for _, _, err in results], [None] * len(ext_ids))
+        # all tasks are polled together
+        self.assertLessEqual(benchmark.stats["calls"], TASK_POLLING_MAX_CALLS)
+
+    def test_spec_generation(self):
+        self.module.params.update(
+            name="vm",
+            cluster={"name": "clusters-1"},
+            vcpus=2,
+            cores_per_vcpu=1,
+            memory_gb=4,
+            networks=[
+                {"subnet": {"name": "subnets-{0}".format(i % 5)}, "is_connected": True}
+                for i in range(20)
+            ],
+            disks=[
+                {
+                    "type": "DISK",
+                    "size_gb": 10,
+                    "bus": "SCSI",
+                    "clone_image": {"name": "images-{0}".format(i % 3)},
+                }
+                for i in range(20)
+            ],
+        )
+        with Benchmark("spec_generation", self.server) as benchmark:
+            spec, err = VM(self.module).get_spec()
+
+        self.assertIsNone(err)
+        self.assertEqual(len(spec["spec"]["resources"]["nic_list"]), 20)
+        self.assertEqual(len(spec["spec"]["resources"]["disk_list"]), 20)
+        # one list call per entity kind, names are resolved in batches
+        self.assertLessEqual(benchmark.stats["calls"], SPEC_GENERATION_MAX_CALLS)
+
+        with Benchmark("spec_generation_cached", self.server) as benchmark:
+            VM(self.module).get_spec()
+        self.assertEqual(benchmark.stats["calls"], 0)
+
+    def test_recovery_plan_stages(self):
+        vms_per_stage = RECOVERY_PLAN_VMS // RECOVERY_PLAN_STAGES
+        stages = []
+        for stage in range(RECOVERY_PLAN_STAGES):
+            vms = []
+            for i in range(stage * vms_per_stage, (stage + 1) * vms_per_stage):
+                # half of vms are given by name, rest by uuid
+                if i % 2:
+                    vms.append({"uuid": get_uuid("vms", i)})
+                else:
+                    vms.append({"name": get_name("vms", i)})
+            stages.append({"vms": vms})
+        self.module.params.update(name="plan", stages=stages)
+
+        with Benchmark("recovery_plan_stages", self.server) as benchmark:
+            spec, err = RecoveryPlan(self.module).get_spec()
+
+        self.assertIsNone(err)
+        stage_list = spec["spec"]["resources"]["stage_list"]
+        self.assertEqual(len(stage_list), RECOVERY_PLAN_STAGES)
+        vm_ref = stage_list[1]["stage_work"]["recover_entities"]["entity_info_list"][1][
+            "any_entity_reference"
+        ]
+        index = vms_per_stage + 1
+        self.assertEqual(
+            vm_ref,
+            {
+                "kind": "vm",
+                "name": get_name("vms", index),
+                "uuid": get_uuid("vms", index),
+            },
+        )
+        # names are resolved in batches of 20, uuids in batches of 100
+        self.assertEqual(
+            benchmark.stats["calls_by_route"],
+            {
+                "POST /api/nutanix/v3/vms/list": RECOVERY_PLAN_VMS // 2 // 20,
+                "POST /api/nutanix/v3/groups": RECOVERY_PLAN_VMS // 2 // 100,
+            },
+        )
+
+        stages[0]["vms"].extend([{"name": "missing-vm"}, {"uuid": "missing-uuid"}])
+        spec, err = RecoveryPlan(self.module).get_spec()
+        self.assertEqual(err, "VMs missing-uuid, missing-vm not found.")
+
+    def test_affected_entities_streaming(self):
+        protection_rule = ProtectionRule(self.module)
+        rule_uuid = get_uuid("protection_rules", 0)
+        with Benchmark("affected_entities_streaming", self.server) as benchmark:
+            count = 0
+            for entity in protection_rule.iter_affected_entities(
+                rule_uuid, page_size=LIST_PAGE_SIZE
+            ):
+                self.assertEqual(entity["vm_reference"]["kind"], "vm")
+                count += 1
+
+        self.assertEqual(count, VM_COUNT)
+        # one call per page, and pages are never held in memory as whole
+        self.assertEqual(benchmark.stats["calls"], VM_COUNT // LIST_PAGE_SIZE)
+        self.assertLess(
+            benchmark.stats["peak_traced_mb"], AFFECTED_ENTITIES_MAX_TRACED_MB
+        )
+
+        result = {}
+        entities = list(
+            protection_rule.iter_affected_entities(rule_uuid, result=result)
+        )
+        self.assertEqual(len(entities), VM_COUNT)
+        self.assertEqual(result["metadata"]["total_matches"], VM_COUNT)
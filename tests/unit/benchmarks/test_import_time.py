@@ -0,0 +1,86 @@
+from __future__ import absolute_import, division, print_function
+
+import json
+import os
+import subprocess
+import sys
+
+from ansible_collections.nutanix.ncp.tests.unit.compat import unittest
+
+__metaclass__ = type
+
+
+# Cold start of v4 modules is measured in fresh interpreters, as every task
+# runs its module in a new process. SDKs are imported lazily on first use, so
+# importing a module must not load any of them. Results are appended as json
+# lines to file given by NUTANIX_BENCHMARK_RESULTS, if set.
+
+MODULES_PACKAGE = "ansible_collections.nutanix.ncp.plugins.modules"
+MODULES_DIR = os.path.join(
+    os.path.dirname(__file__), os.pardir, os.pardir, os.pardir, "plugins", "modules"
+)
+
+# modules pulling in the largest SDKs and most module_utils
+IMPORT_TIME_MODULES = [
+    "ntnx_vms_v2",
+    "ntnx_vms_info_v2",
+    "ntnx_subnets_v2",
+    "ntnx_security_rules_v2",
+    "ntnx_clusters_v2",
+]
+
+# budget, beyond which cold import of a module fails as regression
+IMPORT_MAX_TIME = 1.0
+
+IMPORT_SCRIPT = """
+import importlib, json, sys, time
+start = time.time()
+for name in sys.argv[1:]:
+    importlib.import_module(name)
+print(json.dumps({
+    "import_time": time.time() - start,
+    "sdks": sorted(m for m in sys.modules if m.startswith("ntnx_") and "." not in m),
+}))
+"""
+
+
+def measure_import(*modules):
+    """Import time and SDKs loaded by importing given modules in new interpreter."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    output = subprocess.check_output(
+        [sys.executable, "-c", IMPORT_SCRIPT]
+        + ["{0}.{1}".format(MODULES_PACKAGE, m) for m in modules],
+        env=env,
+    )
+    return json.loads(output.decode("utf-8"))
+
+
+def report(stats):
+    path = os.environ.get("NUTANIX_BENCHMARK_RESULTS")
+    if path:
+        with open(path, "a") as f:
+            f.write(json.dumps(stats) + "\n")
+
+
+class TestImportTime(unittest.TestCase):
+    def test_cold_import_time(self):
+        for module in IMPORT_TIME_MODULES:
+            result = measure_import(module)
+            report(
+                {
+                    "name": "import_time",
+                    "module": module,
+                    "wall_time": round(result["import_time"], 3),
+                }
+            )
+            self.assertEqual(result["sdks"], [], module)
+            self.assertLess(result["import_time"], IMPORT_MAX_TIME, module)
+
+    def test_v4_modules_import_no_sdk(self):
+        modules = sorted(
+            name[: -len(".py")]
+            for name in os.listdir(MODULES_DIR)
+            if name.endswith("_v2.py")
+        )
+        result = measure_import(*modules)
+        self.assertEqual(result["sdks"], [])
@@ -0,0 +1,645 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import datetime
+import json
+import os
+import re
+import shutil
+import ssl
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlparse
+
+try:
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from cryptography.x509.oid import NameOID
+
+    HAS_CRYPTOGRAPHY = True
+except ImportError:
+    HAS_CRYPTOGRAPHY = False
+
+
+# Max page sizes enforced by Prism Central for v3 list and v4 list apis
+V3_MAX_PAGE_SIZE = 500
+V4_MAX_PAGE_SIZE = 100
+
+# v4 api version negotiated with SDK clients
+V4_API_VERSION = "v4.2"
+
+# NDB operation status codes
+NDB_OPERATION_RUNNING = "1"
+NDB_OPERATION_SUCCESS = "5"
+
+_NAMESPACE = uuid.UUID("6a1f4c3e-43b5-4e55-9b3f-1d4c7a9b2e10")
+
+_V3_PATH = re.compile(r"^/api/nutanix/v3/(?P<kind>[a-z_]+)(?:/(?P<rest>.+))?$")
+_V4_PATH = re.compile(
+    r"^/api/(?P<namespace>[a-z]+)/v4\.\d+(?:\.[a-z0-9]+)?/(?P<path>.+)$"
+)
+_NDB_PATH = re.compile(r"^/era/v0\.9/(?P<kind>[a-z_]+)(?:/(?P<rest>.+))?$")
+
+# v4 collections served, as (namespace, path) to entity kind
+_V4_COLLECTIONS = {
+    ("vmm", "ahv/config/vms"): "vms",
+    ("clustermgmt", "config/clusters"): "clusters",
+    ("prism", "config/tasks"): "tasks",
+}
+
+# v3 groups api entity types served, to entity kind
+_GROUPS_ENTITY_TYPES = {"mh_vm": "vms"}
+
+
+def _generate_certificate(cert_dir):
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = os.path.join(cert_dir, "cert.pem")
+    key_path = os.path.join(cert_dir, "key.pem")
+    with open(cert_path, "wb") as f:
+        f.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as f:
+        f.write(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.TraditionalOpenSSL,
+                serialization.NoEncryption(),
+            )
+        )
+    return cert_path, key_path
+
+
+def get_uuid(kind, index):
+    """Deterministic uuid of generated entity of given kind and index."""
+    return str(uuid.uuid5(_NAMESPACE, "{0}-{1}".format(kind, index)))
+
+
+def get_name(kind, index):
+    """Name of generated entity of given kind and index."""
+    return "{0}-{1}".format(kind, index)
+
+
+class _Job(object):
+    """
+    v4 task or NDB operation which completes after given duration, with
+    progress growing linearly till then.
+    """
+
+    def __init__(self, ext_id, duration, queued=0):
+        self.ext_id = ext_id
+        self.start_time = time.time() + queued
+        self.duration = duration
+
+    def get_progress(self):
+        elapsed = time.time() - self.start_time
+        if elapsed < 0:
+            return None
+        if elapsed >= self.duration:
+            return 100
+        return int(100 * elapsed / self.duration)
+
+
+class MockNutanixServer(object):
+    """
+    Local stand-in for Prism Central and NDB apis, to run modules and module
+    utils against in tests and benchmarks. It serves generated entities of
+    configured kinds and counts with:
+
+    - v3 POST /api/nutanix/v3/<kind>/list and GET /api/nutanix/v3/<kind>/<uuid>
+    - v4 vms, clusters and tasks lists and GET by extId. Any other v4 POST,
+      PUT or DELETE creates a task running for task_duration seconds. SDK
+      version negotiation is answered with V4_API_VERSION.
+    - NDB GET /era/v0.9/<kind> and GET /era/v0.9/<kind>/<id>. Any NDB POST,
+      PUT or DELETE creates an operation running for task_duration seconds.
+
+    Every request is counted in calls by (method, route), where route is the
+    request path with uuids and ids replaced by {id}.
+
+    Example:
+        with MockNutanixServer(counts={"vms": 1000}, latency=0.01) as server:
+            module.params.update(server.get_module_params())
+            VM(module).list(data={"length": 500})
+            assert server.calls["POST", "/api/nutanix/v3/vms/list"] == 1
+    """
+
+    def __init__(
+        self,
+        counts=None,
+        latency=0,
+        max_page_size=V3_MAX_PAGE_SIZE,
+        v4_max_page_size=V4_MAX_PAGE_SIZE,
+        task_duration=1.0,
+        tls=True,
+    ):
+        """
+        Args:
+            counts (dict): number of generated entities per kind, for example
+                {"vms": 1000, "clusters": 2}
+            latency (float): seconds each response is delayed by
+            max_page_size (int): max entities returned per v3 list call
+            v4_max_page_size (int): max entities returned per v4 list call
+            task_duration (float): seconds each created task or operation runs
+            tls (bool): serve https using self signed certificate
+        """
+        self.counts = dict(counts or {})
+        self.latency = latency
+        self.max_page_size = max_page_size
+        self.v4_max_page_size = v4_max_page_size
+        self.task_duration = task_duration
+        self.tls = tls
+        self.calls = Counter()
+        self.jobs = {}
+        self._indexes = {}
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+        self._cert_dir = None
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    @property
+    def url(self):
+        return "{0}://127.0.0.1:{1}".format("https" if self.tls else "http", self.port)
+
+    def get_module_params(self):
+        """Connection params of modules to reach this server."""
+        return {
+            "nutanix_host": "127.0.0.1",
+            "nutanix_port": str(self.port),
+            "nutanix_username": "admin",
+            "nutanix_password": "password",
+            "validate_certs": False,
+        }
+
+    @property
+    def total_calls(self):
+        return sum(self.calls.values())
+
+    def reset_stats(self):
+        with self._lock:
+            self.calls.clear()
+
+    def start(self):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.mock = self
+        if self.tls:
+            if not HAS_CRYPTOGRAPHY:
+                raise RuntimeError("cryptography is required to serve https")
+            self._cert_dir = tempfile.mkdtemp()
+            cert_path, key_path = _generate_certificate(self._cert_dir)
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(cert_path, key_path)
+            self._server.socket = context.wrap_socket(
+                self._server.socket, server_side=True
+            )
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._cert_dir:
+            shutil.rmtree(self._cert_dir, ignore_errors=True)
+            self._cert_dir = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def create_job(self, duration=None, queued=0):
+        """
+        Create task or operation completing after duration seconds, which is
+        queued for given seconds before it starts running. Returns its id.
+        """
+        with self._lock:
+            ext_id = get_uuid("jobs", len(self.jobs))
+            self.jobs[ext_id] = _Job(
+                ext_id,
+                self.task_duration if duration is None else duration,
+                queued=queued,
+            )
+        return ext_id
+
+    def _count(self, method, route):
+        with self._lock:
+            self.calls[(method, route)] += 1
+
+    # v3 apis
+
+    def get_v3_entity(self, kind, index):
+        name = get_name(kind, index)
+        entity = {
+            "metadata": {"uuid": get_uuid(kind, index), "kind": kind.rstrip("s")},
+            "spec": {"name": name, "resources": {}},
+            "status": {"name": name, "state": "COMPLETE", "resources": {}},
+        }
+        if kind == "vms":
+            resources = {
+                "num_sockets": 2,
+                "num_vcpus_per_socket": 1,
+                "memory_size_mib": 4096,
+                "power_state": "ON",
+                "nic_list": [
+                    {
+                        "uuid": get_uuid("nics", index),
+                        "nic_type": "NORMAL_NIC",
+                        "subnet_reference": {
+                            "kind": "subnet",
+                            "uuid": get_uuid("subnets", 0),
+                        },
+                        "ip_endpoint_list": [
+                            {
+                                "ip": "10.{0}.{1}.{2}".format(*self._get_ip(index)),
+                                "type": "ASSIGNED",
+                            }
+                        ],
+                    }
+                ],
+                "disk_list": [
+                    {
+                        "uuid": get_uuid("disks", index),
+                        "disk_size_mib": 10240,
+                        "device_properties": {
+                            "device_type": "DISK",
+                            "disk_address": {"adapter_type": "SCSI", "device_index": 0},
+                        },
+                    }
+                ],
+            }
+            entity["spec"]["resources"] = resources
+            entity["status"]["resources"] = dict(resources)
+            entity["status"]["cluster_reference"] = {
+                "kind": "cluster",
+                "name": get_name("clusters", 0),
+                "uuid": get_uuid("clusters", 0),
+            }
+            entity["metadata"]["categories"] = {"Environment": "Testing"}
+        return entity
+
+    @staticmethod
+    def _get_ip(index):
+        return (index >> 16) & 255, (index >> 8) & 255, index & 255
+
+    def _find_index(self, kind, entity_uuid):
+        with self._lock:
+            indexes = self._indexes.get(kind)
+            if indexes is None:
+                indexes = dict(
+                    (get_uuid(kind, index), index)
+                    for index in range(self.counts.get(kind, 0))
+                )
+                self._indexes[kind] = indexes
+        return indexes.get(entity_uuid)
+
+    @staticmethod
+    def _parse_name_filter(fiql):
+        """Names or-ed in name==value (or vm_name==value) filter, None if not given."""
+        if not fiql:
+            return None
+        names = set()
+        for term in fiql.split(","):
+            key, sep, value = term.partition("==")
+            if sep and key.strip() in ("name", "vm_name"):
+                names.add(value)
+        return names
+
+    def list_v3(self, kind, spec):
+        total = self.counts.get(kind, 0)
+        names = self._parse_name_filter(spec.get("filter"))
+        if names is not None:
+            indexes = [
+                index for index in range(total) if get_name(kind, index) in names
+            ]
+        else:
+            indexes = range(total)
+        offset = int(spec.get("offset") or 0)
+        length = min(int(spec.get("length") or 20), self.max_page_size)
+        page = indexes[offset : offset + length]
+        return {
+            "api_version": "3.1",
+            "metadata": {
+                "kind": kind.rstrip("s"),
+                "total_matches": len(indexes),
+                "offset": offset,
+                "length": len(page),
+            },
+            "entities": [self.get_v3_entity(kind, index) for index in page],
+        }
+
+    def query_groups(self, spec):
+        """Names of vms given by entity_ids, as returned by v3 groups api."""
+        kind = _GROUPS_ENTITY_TYPES.get(spec.get("entity_type"))
+        results = []
+        for entity_id in spec.get("entity_ids") or []:
+            index = self._find_index(kind, entity_id) if kind else None
+            if index is None:
+                continue
+            results.append(
+                {
+                    "entity_id": entity_id,
+                    "data": [
+                        {
+                            "name": attribute["attribute"],
+                            "values": [{"values": [get_name(kind, index)]}],
+                        }
+                        for attribute in spec.get("group_member_attributes") or []
+                    ],
+                }
+            )
+        return {
+            "entity_type": spec.get("entity_type"),
+            "filtered_entity_count": len(results),
+            "group_results": [{"entity_results": results}] if results else [],
+        }
+
+    def query_protected_entities(self, query):
+        """
+        VMs protected by a protection rule, paginated if offset or length are
+        given. All VMs are protected by every rule.
+        """
+        total = self.counts.get("vms", 0)
+        if "offset" in query or "length" in query:
+            offset = int(query.get("offset") or 0)
+            length = min(int(query.get("length") or 20), self.max_page_size)
+        else:
+            offset, length = 0, total
+        indexes = range(offset, min(offset + length, total))
+        return {
+            "entity_list": [
+                {
+                    "vm_reference": {
+                        "kind": "vm",
+                        "name": get_name("vms", index),
+                        "uuid": get_uuid("vms", index),
+                    }
+                }
+                for index in indexes
+            ],
+            "metadata": {"total_matches": total, "offset": offset},
+        }
+
+    # v4 apis
+
+    def get_v4_entity(self, kind, index):
+        return {
+            "$objectType": {
+                "vms": "vmm.v4.ahv.config.Vm",
+                "clusters": "clustermgmt.v4.config.Cluster",
+            }[kind],
+            "extId": get_uuid(kind, index),
+            "name": get_name(kind, index),
+            "powerState": "ON",
+        }
+
+    def get_task(self, ext_id):
+        job = self.jobs.get(ext_id)
+        if not job:
+            return None
+        progress = job.get_progress()
+        if progress is None:
+            status = "QUEUED"
+        elif progress >= 100:
+            status = "SUCCEEDED"
+        else:
+            status = "RUNNING"
+        return {
+            "$objectType": "prism.v4.config.Task",
+            "extId": ext_id,
+            "status": status,
+            "progressPercentage": progress or 0,
+            "entitiesAffected": [],
+        }
+
+    @staticmethod
+    def _parse_ext_id_filter(odata):
+        """ExtIds given in extId eq or extId in filter, None if not given."""
+        if not odata:
+            return None
+        ext_ids = re.findall(r"'([^']*)'", odata)
+        return set(ext_ids) if "extId" in odata else None
+
+    def list_v4(self, kind, query):
+        if kind == "tasks":
+            items = list(self.jobs)
+        else:
+            items = [get_uuid(kind, index) for index in range(self.counts.get(kind, 0))]
+        ext_ids = self._parse_ext_id_filter(query.get("$filter"))
+        if ext_ids is not None:
+            items = [ext_id for ext_id in items if ext_id in ext_ids]
+        limit = min(int(query.get("$limit") or 50), self.v4_max_page_size)
+        page = int(query.get("$page") or 0)
+        page_items = items[page * limit : (page + 1) * limit]
+        if kind == "tasks":
+            data = [self.get_task(ext_id) for ext_id in page_items]
+        else:
+            data = [
+                self.get_v4_entity(kind, self._find_index(kind, ext_id))
+                for ext_id in page_items
+            ]
+        return {
+            "data": data,
+            "metadata": {"totalAvailableResults": len(items), "flags": []},
+        }
+
+    def get_v4(self, kind, ext_id):
+        if kind == "tasks":
+            return self.get_task(ext_id)
+        index = self._find_index(kind, ext_id)
+        if index is None:
+            return None
+        return self.get_v4_entity(kind, index)
+
+    # NDB apis
+
+    def get_ndb_entity(self, kind, index):
+        return {
+            "id": get_uuid(kind, index),
+            "name": get_name(kind, index),
+            "status": "READY",
+            "timeMachineId": get_uuid("tms", 0),
+            "snapshotTimeStampDate": "2026-01-01 00:{0:02d}:00".format(index % 60),
+        }
+
+    def get_operation(self, operation_id):
+        job = self.jobs.get(operation_id)
+        if not job:
+            return None
+        progress = job.get_progress() or 0
+        return {
+            "id": operation_id,
+            "status": (
+                NDB_OPERATION_SUCCESS if progress >= 100 else NDB_OPERATION_RUNNING
+            ),
+            "percentageComplete": str(progress),
+            "message": None,
+        }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately, so without this every response
+    # on a keep-alive connection waits for delayed ack of client
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    @property
+    def mock(self):
+        return self.server.mock
+
+    def _send(self, status, body):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length))
+        except ValueError:
+            return {}
+
+    def _handle(self, method):
+        if self.mock.latency:
+            time.sleep(self.mock.latency)
+        url = urlparse(self.path)
+        query = dict(parse_qsl(url.query))
+        body = self._read_body()
+        if method == "OPTIONS" and url.path == "/api/prism/unversioned/info":
+            self.mock._count(method, url.path)
+            return self._send(200, {"data": V4_API_VERSION})
+        for pattern, handler in [
+            (_V3_PATH, self._handle_v3),
+            (_V4_PATH, self._handle_v4),
+            (_NDB_PATH, self._handle_ndb),
+        ]:
+            match = pattern.match(url.path)
+            if match:
+                route, status, resp = handler(method, match, query, body)
+                self.mock._count(method, route)
+                return self._send(status, resp)
+        self.mock._count(method, url.path)
+        self._send(404, {"message": "Unknown api {0}".format(url.path)})
+
+    def _handle_v3(self, method, match, query, body):
+        kind, rest = match.group("kind"), match.group("rest")
+        base = "/api/nutanix/v3/{0}".format(kind)
+        if method == "POST" and rest == "list":
+            return base + "/list", 200, self.mock.list_v3(kind, body)
+        if method == "POST" and kind == "groups" and not rest:
+            return base, 200, self.mock.query_groups(body)
+        if method == "GET" and kind == "protection_rules" and rest:
+            entity_uuid, _, sub = rest.partition("/")
+            if sub == "query_entities":
+                route = base + "/{id}/query_entities"
+                return route, 200, self.mock.query_protected_entities(query)
+        if method in ("GET", "DELETE") and rest:
+            index = self.mock._find_index(kind, rest)
+            if index is None:
+                return base + "/{id}", 404, {"message": "Not found"}
+            if method == "DELETE":
+                return base + "/{id}", 202, {"status": {"state": "DELETE_PENDING"}}
+            return base + "/{id}", 200, self.mock.get_v3_entity(kind, index)
+        return base, 400, {"message": "Unsupported v3 api"}
+
+    def _handle_v4(self, method, match, query, body):
+        namespace, path = match.group("namespace"), match.group("path")
+        for (collection_namespace, collection), kind in _V4_COLLECTIONS.items():
+            if namespace != collection_namespace:
+                continue
+            base = "/api/{0}/v4/{1}".format(namespace, collection)
+            if method == "GET" and path == collection:
+                return base, 200, self.mock.list_v4(kind, query)
+            if method == "GET" and path.startswith(collection + "/"):
+                ext_id = path[len(collection) + 1 :]
+                if "/" not in ext_id:
+                    data = self.mock.get_v4(kind, ext_id)
+                    if data is None:
+                        return base + "/{id}", 404, {"message": "Not found"}
+                    return base + "/{id}", 200, {"data": data}
+        route = "/api/{0}/v4/{1}".format(
+            namespace, re.sub(r"[0-9a-f-]{36}", "{id}", path)
+        )
+        if method in ("POST", "PUT", "DELETE"):
+            task_ext_id = self.mock.create_job()
+            return (
+                route,
+                202,
+                {
+                    "data": {
+                        "$objectType": "prism.v4.config.TaskReference",
+                        "extId": task_ext_id,
+                    }
+                },
+            )
+        return route, 404, {"message": "Unsupported v4 api"}
+
+    def _handle_ndb(self, method, match, query, body):
+        kind, rest = match.group("kind"), match.group("rest")
+        base = "/era/v0.9/{0}".format(kind)
+        if method == "GET" and kind == "operations" and rest:
+            resp = self.mock.get_operation(rest)
+            if resp is None:
+                return base + "/{id}", 404, {"message": "Not found"}
+            return base + "/{id}", 200, resp
+        if method == "GET" and not rest:
+            count = self.mock.counts.get(kind, 0)
+            return (
+                base,
+                200,
+                [self.mock.get_ndb_entity(kind, index) for index in range(count)],
+            )
+        if method == "GET":
+            index = self.mock._find_index(kind, rest)
+            if index is None:
+                return base + "/{id}", 404, {"message": "Not found"}
+            return base + "/{id}", 200, self.mock.get_ndb_entity(kind, index)
+        route = base + ("/{id}" if rest else "")
+        operation_id = self.mock.create_job()
+        return route, 200, {"operationId": operation_id, "entityId": rest}
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PUT(self):
+        self._handle("PUT")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+    def do_OPTIONS(self):
+        self._handle("OPTIONS")
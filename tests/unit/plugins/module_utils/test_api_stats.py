@@ -0,0 +1,159 @@
+from __future__ import absolute_import, division, print_function
+
+import json
+import os
+import tempfile
+
+from ansible_collections.nutanix.ncp.plugins.module_utils.api_stats import (
+    API_STATS,
+    ApiStats,
+    add_api_stats,
+    enable_api_stats,
+    get_endpoint,
+)
+from ansible_collections.nutanix.ncp.plugins.module_utils.poller import Poller
+from ansible_collections.nutanix.ncp.plugins.module_utils.v4.api_logger import (
+    LoggedRequestHandler,
+)
+from ansible_collections.nutanix.ncp.tests.unit.compat import unittest
+
+__metaclass__ = type
+
+
+class FakeModule:
+    _name = "ntnx_vms"
+
+    def __init__(self, **params):
+        self.params = params
+
+
+class StreamingResponse:
+    """Raw urllib3 response, whose data can be read only once."""
+
+    status = 200
+
+    def __init__(self):
+        self.consumed = False
+
+    def getheader(self, name):
+        return None
+
+    @property
+    def data(self):
+        self.consumed = True
+        return b"chunk"
+
+
+class DisabledLogger:
+    enabled = False
+
+
+class TestApiStats(unittest.TestCase):
+    def setUp(self):
+        self.stats = ApiStats()
+        self.stats.enabled = True
+
+    def tearDown(self):
+        API_STATS.enabled = False
+        API_STATS.reset()
+
+    def test_endpoint_ids_are_replaced(self):
+        self.assertEqual(
+            get_endpoint(
+                "https://pc:9440/api/nutanix/v3/vms/"
+                "0a1b2c3d-0000-4000-8000-0123456789ab?x=1"
+            ),
+            "/api/nutanix/v3/vms/{id}",
+        )
+        self.assertEqual(
+            get_endpoint("https://pc:9440/api/prism/v4.0/config/tasks/ZXJnb24=:abc"),
+            "/api/prism/v4.0/config/tasks/{id}",
+        )
+        self.assertEqual(
+            get_endpoint("https://ndb/era/v0.9/clones/12"), "/era/v0.9/clones/{id}"
+        )
+
+    def test_summary(self):
+        for i in range(1, 101):
+            self.stats.record_api_call(
+                "get",
+                "https://pc/api/nutanix/v3/vms/{0}".format(i),
+                200,
+                i / 100.0,
+                bytes_received=10,
+            )
+        self.stats.record_api_call(
+            "POST", "https://pc/api/nutanix/v3/vms/list", 500, 0.5, {"kind": "vm"}
+        )
+        self.stats.record_retry()
+        self.stats.record_poll_sleep(2)
+
+        summary = self.stats.get_summary()
+        self.assertEqual(summary["total_calls"], 101)
+        self.assertEqual(summary["total_errors"], 1)
+        self.assertEqual(summary["bytes_received"], 1000)
+        self.assertEqual(summary["bytes_sent"], len(json.dumps({"kind": "vm"})))
+        self.assertEqual(summary["retries"], 1)
+        self.assertEqual(summary["polls"], 1)
+        self.assertEqual(summary["poll_sleep_time"], 2)
+
+        get_vm = summary["endpoints"][0]
+        self.assertEqual(get_vm["method"], "GET")
+        self.assertEqual(get_vm["endpoint"], "/api/nutanix/v3/vms/{id}")
+        self.assertEqual(
+            get_vm["latency"], {"p50": 0.5, "p90": 0.9, "p99": 0.99, "max": 1.0}
+        )
+
+    def test_disabled_stats_are_not_recorded(self):
+        self.stats.enabled = False
+        self.stats.record_api_call("GET", "https://pc/api", 200, 1)
+        self.stats.record_retry()
+        self.assertEqual(self.stats.get_summary()["total_calls"], 0)
+        self.assertEqual(self.stats.get_summary()["retries"], 0)
+
+    def test_poller_sleeps_are_recorded(self):
+        enable_api_stats(FakeModule(nutanix_api_stats=True))
+        poller = Poller(initial_delay=1, max_delay=2, jitter=0, sleep=lambda d: None)
+        for count in poller:
+            if count == 4:
+                break
+        summary = API_STATS.get_summary()
+        self.assertEqual(summary["polls"], 3)
+        self.assertEqual(summary["poll_sleep_time"], 5)
+
+    def test_stats_in_result_and_file(self):
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+
+        module = FakeModule(nutanix_api_stats=False, nutanix_api_stats_file=path)
+        enable_api_stats(module)
+        API_STATS.record_api_call("GET", "https://pc/api/nutanix/v3/vms/1", 200, 0.1)
+        result = {"changed": True}
+        add_api_stats(module, result)
+        self.assertNotIn("api_stats", result)
+
+        module.params["nutanix_api_stats"] = True
+        add_api_stats(module, result)
+        self.assertEqual(result["api_stats"]["total_calls"], 1)
+
+        with open(path) as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(lines[0]["module"], "ntnx_vms")
+        self.assertTrue(lines[0]["changed"])
+        self.assertEqual(lines[0]["api_stats"]["total_calls"], 1)
+
+    def test_streamed_response_is_not_read(self):
+        enable_api_stats(FakeModule(nutanix_api_stats=True))
+        response = StreamingResponse()
+        handler = LoggedRequestHandler(DisabledLogger(), lambda **kwargs: response)
+        self.assertIs(
+            handler("GET", "https://pc/api/files/1", _preload_content=False), response
+        )
+        self.assertFalse(response.consumed)
+
+        handler("GET", "https://pc/api/files/1")
+        summary = API_STATS.get_summary()
+        self.assertEqual(summary["total_calls"], 2)
+        self.assertEqual(summary["bytes_received"], len(b"chunk"))
@@ -1,10 +1,16 @@
 from __future__ import absolute_import, division, print_function
 
+import hashlib
 import json
+import os
+import tempfile
 from base64 import b64encode
 
 from ansible.module_utils.six.moves.urllib.parse import urlparse
-from ansible_collections.nutanix.ncp.plugins.module_utils.v3.entity import Entity
+from ansible_collections.nutanix.ncp.plugins.module_utils.v3.entity import (
+    Entity,
+    FileChunksIterator,
+)
 from ansible_collections.nutanix.ncp.tests.unit.plugins.modules.utils import (
     AnsibleExitJson,
     AnsibleFailJson,
@@ -234,6 +240,34 @@ class TestEntity(ModuleTestCase):
         result = self.entity.get_uuid(value=name)
         self.assertEqual(result, None)
 
+    def test_get_name_uuid_map(self):
+        # list filter matches substrings of names, like v3 vm_name filter
+        names = ["web{0}".format(i) for i in range(200)] + ["web"]
+        calls = []
+
+        def list_entities(data, **kwargs):
+            calls.append(data)
+            terms = [term.split("==")[1] for term in data["filter"].split(",")]
+            matches = [n for n in names if any(term in n for term in terms)]
+            page = matches[data["offset"] : data["offset"] + data["length"]]
+            return {
+                "entities": [
+                    {"spec": {"name": n}, "metadata": {"uuid": "uuid-" + n}}
+                    for n in page
+                ],
+                "metadata": {"total_matches": len(matches)},
+            }
+
+        self.entity.list = list_entities
+        result = self.entity.get_name_uuid_map(["web", "web1", "missing"])
+        self.assertEqual(result, {"web": "uuid-web", "web1": "uuid-web1"})
+        # web is matched exactly only on last page, after 200 substring matches
+        self.assertEqual([call["offset"] for call in calls], list(range(0, 201, 15)))
+
+        calls[:] = []
+        self.assertEqual(self.entity.get_name_uuid_map(["web0"]), {"web0": "uuid-web0"})
+        self.assertEqual(len(calls), 1)
+
     def test_get_spec(self):
         result = self.entity.get_spec()
         self.assertEqual(result, ({}, None))
@@ -255,3 +289,34 @@ class TestEntity(ModuleTestCase):
         spec2 = {"k2": "v2", "k3": "v3", "k4": "v4"}
         expected = {"k2": "v2", "k3": "v3"}
         self.assertEqual(self.entity.unify_spec(spec1, spec2), expected)
+
+
+class TestFileChunksIterator(ModuleTestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        self.data = os.urandom(10000)
+        with os.fdopen(fd, "wb") as f:
+            f.write(self.data)
+        self.addCleanup(os.remove, self.path)
+
+    def test_checksums_and_progress(self):
+        progress = []
+        chunks = FileChunksIterator(
+            self.path,
+            chunk_size=4096,
+            hash_algorithms=["sha1", "sha256"],
+            progress=lambda read, total: progress.append((read, total)),
+        )
+        self.assertEqual(len(chunks), 10000)
+        self.assertEqual(chunks.get_checksums(), {})
+
+        data = b"".join(iter(lambda: chunks.read(8192), b""))
+        self.assertEqual(data, self.data)
+        self.assertEqual(progress, [(4096, 10000), (8192, 10000), (10000, 10000)])
+        self.assertEqual(
+            chunks.get_checksums(),
+            {
+                "sha1": hashlib.sha1(self.data).hexdigest(),
+                "sha256": hashlib.sha256(self.data).hexdigest(),
+            },
+        )
@@ -0,0 +1,68 @@
+from __future__ import absolute_import, division, print_function
+
+from copy import deepcopy
+
+from ansible_collections.nutanix.ncp.plugins.module_utils.v4.flow.helpers import (
+    diff_security_rules,
+    get_security_rule_fingerprint,
+)
+from ansible_collections.nutanix.ncp.tests.unit.compat import unittest
+
+__metaclass__ = type
+
+
+def get_rule(index, ext_id=None):
+    return {
+        "ext_id": ext_id,
+        "description": "rule-{0}".format(index),
+        "type": "APPLICATION",
+        "spec": {
+            "src_category_references": ["src-{0}".format(index), "src-common"],
+            "dest_category_references": None,
+            "dest_category_associated_entity_type": "VM",
+            "tcp_services": [
+                {"start_port": 80, "end_port": 80},
+                {"start_port": 443, "end_port": 443},
+            ],
+        },
+    }
+
+
+class TestSecurityRulesDiff(unittest.TestCase):
+    def test_fingerprint_is_order_independent(self):
+        rule = get_rule(1, ext_id="old")
+        reordered = deepcopy(rule)
+        reordered["ext_id"] = None
+        reordered["spec"]["src_category_references"].reverse()
+        reordered["spec"]["tcp_services"].reverse()
+        reordered["spec"]["dest_category_associated_entity_type"] = None
+        self.assertEqual(
+            get_security_rule_fingerprint(rule),
+            get_security_rule_fingerprint(reordered),
+        )
+
+        changed = deepcopy(rule)
+        changed["spec"]["tcp_services"][0]["end_port"] = 81
+        self.assertNotEqual(
+            get_security_rule_fingerprint(rule),
+            get_security_rule_fingerprint(changed),
+        )
+
+    def test_diff(self):
+        old_rules = [get_rule(i, ext_id=str(i)) for i in range(1500)]
+        new_rules = [get_rule(i) for i in reversed(range(1, 1500))]
+        new_rules.append(get_rule(2000))
+
+        diff = diff_security_rules(old_rules, new_rules)
+        self.assertEqual(diff["added"], [get_rule(2000)])
+        self.assertEqual(diff["removed"], [old_rules[0]])
+        self.assertEqual(diff["unchanged"], 1499)
+
+    def test_diff_of_duplicate_rules(self):
+        diff = diff_security_rules([get_rule(1)], [get_rule(1), get_rule(1)])
+        self.assertEqual(diff["added"], [get_rule(1)])
+        self.assertEqual(diff["removed"], [])
+        self.assertEqual(diff["unchanged"], 1)
+
+        diff = diff_security_rules(None, [])
+        self.assertEqual(diff, {"added": [], "removed": [], "unchanged": 0})
@@ -0,0 +1,64 @@
+from __future__ import absolute_import, division, print_function
+
+import io
+import json
+
+from ansible_collections.nutanix.ncp.plugins.module_utils.v3.json_stream import (
+    iter_json_items,
+    iter_text_chunks,
+)
+from ansible_collections.nutanix.ncp.tests.unit.compat import unittest
+
+__metaclass__ = type
+
+
+class FakeResponse:
+    def __init__(self, text, read_size):
+        self.body = io.BytesIO(text.encode("utf-8"))
+        self.read_size = read_size
+
+    def read(self, size):
+        return self.body.read(min(size, self.read_size))
+
+
+class TestJsonStream(unittest.TestCase):
+    def decode(self, text, read_size=1, **kwargs):
+        chunks = iter_text_chunks(FakeResponse(text, read_size))
+        return list(iter_json_items(chunks, **kwargs))
+
+    def test_multibyte_characters_split_across_chunks(self):
+        text = "".join(iter_text_chunks(FakeResponse('["snap-é€😀"]', 1)))
+        self.assertEqual(text, '["snap-é€😀"]')
+
+    def test_top_level_list(self):
+        items = [{"name": "snap-{0}".format(i), "size": i * 1.5} for i in range(50)]
+        for read_size in [1, 3, 64]:
+            self.assertEqual(self.decode(json.dumps(items), read_size), items)
+        self.assertEqual(self.decode(" [ 1 , 22 , 333 ] "), [1, 22, 333])
+        self.assertEqual(self.decode("[]"), [])
+
+    def test_items_of_top_level_object(self):
+        text = json.dumps(
+            {"metadata": {"total_matches": 2}, "entities": [{"a": 1}, {"b": 2}]}
+        )
+        result = {}
+        items = self.decode(text, items_key="entities", result=result)
+        self.assertEqual(items, [{"a": 1}, {"b": 2}])
+        self.assertEqual(result, {"metadata": {"total_matches": 2}})
+
+    def test_object_without_items(self):
+        result = {}
+        items = self.decode('{"state": "ERROR"}', result=result)
+        self.assertEqual(items, [])
+        self.assertEqual(result, {"state": "ERROR"})
+
+    def test_invalid_json(self):
+        for text in ["[1,", "[1 2]", "[1] x", ""]:
+            self.assertRaises(ValueError, self.decode, text)
+
+    def test_numbers_split_at_every_offset(self):
+        items = [1.5e10, -2.25, 3e-05, 10, 0.5, -7]
+        text = json.dumps(items).replace("e-05", "E-5")
+        for offset in range(1, len(text)):
+            chunks = [text[:offset], text[offset:]]
+            self.assertEqual(list(iter_json_items(chunks)), items, offset)
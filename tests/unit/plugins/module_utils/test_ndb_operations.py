@@ -0,0 +1,60 @@
+from __future__ import absolute_import, division, print_function
+
+from functools import partial
+
+from ansible_collections.nutanix.ncp.plugins.module_utils.poller import Poller
+from ansible_collections.nutanix.ncp.plugins.module_utils.v3.ndb import operations
+from ansible_collections.nutanix.ncp.tests.unit.compat import unittest
+from ansible_collections.nutanix.ncp.tests.unit.compat.mock import patch
+
+__metaclass__ = type
+
+
+class ModuleFailed(Exception):
+    pass
+
+
+class FakeOperation(operations.Operation):
+    """Operation which returns given (status code, response), one per read."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.reads = 0
+
+    def read(self, uuid=None, raise_error=True, include_status_code=False, **kwargs):
+        self.reads += 1
+        status_code, resp = self.responses.pop(0)
+        if raise_error and status_code >= 300:
+            raise ModuleFailed(status_code)
+        resp = dict(resp)
+        if include_status_code:
+            resp["status_code"] = status_code
+        return resp
+
+
+class TestWaitTillVisible(unittest.TestCase):
+    def setUp(self):
+        self.clock = [0.0]
+
+        def sleep(delay):
+            self.clock[0] += delay
+
+        poller = partial(Poller, sleep=sleep, clock=lambda: self.clock[0])
+        patcher = patch.object(operations, "Poller", poller)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_not_visible_operation_is_retried(self):
+        operation = FakeOperation(
+            [(404, {"message": "not found"}), (200, {}), (200, {"status": "1"})]
+        )
+        self.assertEqual(operation.wait_till_visible("op-1"), {"status": "1"})
+        self.assertEqual(operation.reads, 3)
+
+    def test_other_errors_are_raised_at_once(self):
+        for status_code in [401, 403, 500]:
+            operation = FakeOperation([(status_code, {})] * 2)
+            with self.assertRaises(ModuleFailed):
+                operation.wait_till_visible("op-1")
+            self.assertEqual(operation.reads, 2)
+            self.assertEqual(self.clock[0], 0)
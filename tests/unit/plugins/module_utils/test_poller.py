@@ -0,0 +1,74 @@
+from __future__ import absolute_import, division, print_function
+
+from ansible_collections.nutanix.ncp.plugins.module_utils.poller import (
+    Poller,
+    PollingStrategy,
+)
+from ansible_collections.nutanix.ncp.tests.unit.compat import unittest
+
+__metaclass__ = type
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+class TestPoller(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def get_poller(self, **kwargs):
+        kwargs.setdefault("jitter", 0)
+        return Poller(sleep=self.clock.sleep, clock=self.clock.time, **kwargs)
+
+    def test_first_poll_is_immediate(self):
+        poller = self.get_poller()
+        for _ in poller:
+            break
+        self.assertEqual(self.clock.sleeps, [])
+        self.assertEqual(poller.polls, 1)
+
+    def test_exponential_backoff_is_capped(self):
+        poller = self.get_poller(initial_delay=1, max_delay=5)
+        for count in poller:
+            if count == 6:
+                break
+        self.assertEqual(self.clock.sleeps, [1, 2, 4, 5, 5])
+        self.assertEqual(poller.total_sleep, 17)
+
+    def test_fixed_strategy(self):
+        poller = self.get_poller(max_delay=3, strategy=PollingStrategy.FIXED)
+        for count in poller:
+            if count == 3:
+                break
+        self.assertEqual(self.clock.sleeps, [3, 3])
+
+    def test_deadline(self):
+        poller = self.get_poller(timeout=10, initial_delay=4, max_delay=4)
+        for _ in poller:
+            pass
+        self.assertTrue(poller.timed_out)
+        self.assertEqual(self.clock.now, 10)
+        self.assertEqual(poller.polls, 4)
+
+    def test_progress_based_schedule(self):
+        poller = self.get_poller(initial_delay=1, max_delay=100)
+        progress = iter([10, 20])
+        for count in poller:
+            if count == 3:
+                break
+            poller.report_progress(next(progress))
+        # 10% per second with 80% remaining, so next poll is at half of 8s eta
+        self.assertEqual(self.clock.sleeps, [1, 4])
+
+    def test_invalid_strategy(self):
+        self.assertRaises(ValueError, Poller, strategy="linear")
@@ -0,0 +1,30 @@
+from __future__ import absolute_import, division, print_function
+
+import sys
+from copy import deepcopy
+
+from ansible_collections.nutanix.ncp.plugins.module_utils.v4.sdk_loader import (
+    lazy_import,
+)
+from ansible_collections.nutanix.ncp.tests.unit.compat import unittest
+
+__metaclass__ = type
+
+
+class TestLazyImport(unittest.TestCase):
+    def setUp(self):
+        sys.modules.pop("colorsys", None)
+
+    def test_missing_sdk(self):
+        with self.assertRaises(ImportError):
+            lazy_import("ntnx_missing_py_client")
+
+    def test_attributes_are_resolved_on_use(self):
+        sdk = lazy_import("colorsys")
+        spec = {"obj": sdk.rgb_to_hsv}
+        self.assertIs(deepcopy(spec)["obj"], spec["obj"])
+        self.assertNotIn("colorsys", sys.modules)
+
+        self.assertEqual(spec["obj"](1.0, 0.0, 0.0), (0.0, 1.0, 1.0))
+        self.assertIn("colorsys", sys.modules)
+        self.assertIs(sdk.ONE_THIRD, sys.modules["colorsys"].ONE_THIRD)
@@ -0,0 +1,121 @@
+from __future__ import absolute_import, division, print_function
+
+from ansible_collections.nutanix.ncp.plugins.module_utils.poller import Poller
+from ansible_collections.nutanix.ncp.plugins.module_utils.v4.prism import tasks
+from ansible_collections.nutanix.ncp.tests.unit.compat import unittest
+from ansible_collections.nutanix.ncp.tests.unit.compat.mock import MagicMock, patch
+
+__metaclass__ = type
+
+
+class ApiException(Exception):
+    def __init__(self, status):
+        super(ApiException, self).__init__(status)
+        self.status = status
+        self.reason = "error"
+        self.body = None
+
+
+class ModuleFailed(Exception):
+    pass
+
+
+class Module:
+    params = {"timeout": 60}
+
+    def fail_json(self, **kwargs):
+        raise ModuleFailed(kwargs)
+
+
+class Task:
+    def __init__(self, ext_id, status):
+        self.ext_id = ext_id
+        self.status = status
+        self.progress_percentage = 50
+
+
+class FakeTasksApi(object):
+    """Tasks api which returns given responses, one per list call."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+
+    def list_tasks(self, _filter, _limit):
+        resp = self.responses.pop(0)
+        if isinstance(resp, Exception):
+            raise resp
+        return MagicMock(data=resp)
+
+
+class TestWaitForTasks(unittest.TestCase):
+    def wait(self, responses, ext_ids=("t1", "t2"), timeout=60, **kwargs):
+        clock = [0.0]
+
+        def sleep(delay):
+            clock[0] += delay
+
+        poller = Poller(
+            timeout=timeout,
+            initial_delay=1,
+            max_delay=10,
+            jitter=0,
+            sleep=sleep,
+            clock=lambda: clock[0],
+        )
+        sdk = MagicMock()
+        sdk.TasksApi.return_value = FakeTasksApi(responses)
+        with patch.object(tasks, "ntnx_prism_py_client", sdk), patch.object(
+            tasks, "get_pc_api_client"
+        ), patch.object(tasks.Poller, "from_module", return_value=poller):
+            return list(tasks.wait_for_tasks(Module(), list(ext_ids), **kwargs))
+
+    def test_transient_errors_are_retried(self):
+        results = self.wait(
+            [
+                [Task("t1", "RUNNING"), Task("t2", "RUNNING")],
+                ApiException(503),
+                ApiException(None),
+                [Task("t1", "SUCCEEDED"), Task("t2", "FAILED")],
+            ]
+        )
+        self.assertEqual(
+            [(ext_id, err) for ext_id, _, err in results],
+            [("t1", None), ("t2", "Task Failed")],
+        )
+
+    def test_errors_fail_module(self):
+        with self.assertRaises(ModuleFailed) as e:
+            self.wait([ApiException(403)])
+        self.assertEqual(e.exception.args[0]["status"], 403)
+
+        # transient errors till deadline
+        with self.assertRaises(ModuleFailed) as e:
+            self.wait([ApiException(503)] * 10, timeout=5)
+        self.assertEqual(e.exception.args[0]["msg"], tasks.TASKS_LIST_ERROR)
+
+    def test_task_timeout(self):
+        # t2 is queued for long, its timeout counts from when it starts running
+        results = self.wait(
+            [[Task("t1", "RUNNING"), Task("t2", "QUEUED")]] * 5
+            + [[Task("t2", "RUNNING")], [Task("t2", "SUCCEEDED")]],
+            task_timeout=10,
+        )
+        self.assertEqual(
+            [(ext_id, err) for ext_id, _, err in results],
+            [("t1", tasks.TASK_TIMEOUT_ERROR), ("t2", None)],
+        )
+
+    def test_first_completed(self):
+        # all tasks finished in cycle are yielded, without polling others again
+        results = self.wait(
+            [
+                [Task("t1", "RUNNING"), Task("t2", "RUNNING"), Task("t3", "RUNNING")],
+                [Task("t1", "SUCCEEDED"), Task("t2", "RUNNING"), Task("t3", "FAILED")],
+            ],
+            ext_ids=["t1", "t2", "t3"],
+            first_completed=True,
+        )
+        self.assertEqual(
+            [(ext_id, err) for ext_id, _, err in results],
+            [("t1", None), ("t3", "Task Failed")],
+        )
@@ -0,0 +1,140 @@
+from __future__ import absolute_import, division, print_function
+
+import json
+import os
+import shutil
+import tempfile
+
+from ansible_collections.nutanix.ncp.plugins.module_utils.v3.entity import Entity
+from ansible_collections.nutanix.ncp.plugins.module_utils.v3.prism.vms import VM
+from ansible_collections.nutanix.ncp.plugins.module_utils.v3.uuid_cache import (
+    cache_uuids,
+    clear_uuid_cache,
+    get_cached_uuid,
+    invalidate_uuids,
+)
+from ansible_collections.nutanix.ncp.tests.unit.compat import unittest
+from ansible_collections.nutanix.ncp.tests.unit.compat.mock import patch
+from ansible_collections.nutanix.ncp.tests.unit.mock_server import (
+    HAS_CRYPTOGRAPHY,
+    MockNutanixServer,
+    get_name,
+    get_uuid,
+)
+
+__metaclass__ = type
+
+# other tests replace Entity._fetch_url with mocks, requests are sent using
+# the one defined by Entity
+FETCH_URL = Entity.__dict__["_fetch_url"]
+
+
+class Module:
+    def __init__(self, params):
+        self.params = dict(params, load_params_without_defaults=False, timeout=60)
+        self.tmpdir = "/tmp"
+
+    def jsonify(self, data):
+        return json.dumps(data)
+
+    def fail_json(self, msg=None, **kwargs):
+        raise AssertionError("fail_json called: {0} {1}".format(msg, kwargs))
+
+
+@unittest.skipUnless(HAS_CRYPTOGRAPHY, "cryptography is required for mock server")
+class TestUuidCacheInvalidation(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = MockNutanixServer(counts={"vms": 2}).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        fetch_url = patch.object(Entity, "_fetch_url", FETCH_URL)
+        fetch_url.start()
+        self.addCleanup(fetch_url.stop)
+        clear_uuid_cache()
+        self.addCleanup(clear_uuid_cache)
+        self.module = Module(self.server.get_module_params())
+        self.vm = VM(self.module)
+        self.name, self.uuid = get_name("vms", 1), get_uuid("vms", 1)
+        cache_uuids(self.module, self.vm.resource_path, {self.name: self.uuid})
+
+    def get_cached_uuid(self):
+        return get_cached_uuid(self.module, self.vm.resource_path, self.name)
+
+    def test_read_only_and_failed_calls_keep_cache(self):
+        # list made through create
+        resp = self.vm.create({"kind": "vm"}, endpoint="list")
+        self.assertEqual(len(resp["entities"]), 2)
+        # failed create
+        self.vm.create({"spec": {}}, raise_error=False)
+        self.vm.delete(uuid="missing-uuid", raise_error=False)
+        self.assertEqual(self.get_cached_uuid(), self.uuid)
+
+    def test_successful_change_drops_cache(self):
+        self.vm.delete(uuid=get_uuid("vms", 0), no_response=True)
+        self.assertIsNone(self.get_cached_uuid())
+
+
+class TestDiskUuidCache(unittest.TestCase):
+    VMS = "/api/nutanix/v3/vms"
+    GROUPS_VMS = "/api/nutanix/v3/groups/mh_vm"
+    CONTAINERS = "/api/nutanix/v3/groups/storage_container"
+
+    def setUp(self):
+        self.cache_dir = os.path.join(tempfile.mkdtemp(), "cache")
+        self.addCleanup(shutil.rmtree, os.path.dirname(self.cache_dir))
+        env = patch.dict(
+            os.environ,
+            {"NUTANIX_UUID_CACHE_TTL": "60", "NUTANIX_UUID_CACHE_DIR": self.cache_dir},
+        )
+        env.start()
+        self.addCleanup(env.stop)
+        clear_uuid_cache()
+        self.addCleanup(clear_uuid_cache)
+        self.module = Module({"nutanix_host": "pc", "nutanix_username": "admin"})
+
+    def get_from_disk(self, kind, name, module=None):
+        # drop memory cache, so that uuid is read from disk
+        clear_uuid_cache()
+        return get_cached_uuid(module or self.module, kind, name)
+
+    def test_entries_are_shared_through_disk(self):
+        cache_uuids(self.module, self.VMS, {"vm-1": "uuid-1"})
+        self.assertEqual(os.stat(self.cache_dir).st_mode & 0o777, 0o700)
+        self.assertEqual(self.get_from_disk(self.VMS, "vm-1"), "uuid-1")
+
+        # api key users of same host don't share entries
+        module = Module(dict(self.module.params, nutanix_api_key="key"))
+        self.assertIsNone(self.get_from_disk(self.VMS, "vm-1", module))
+
+    def test_cache_not_private_to_user_is_ignored(self):
+        cache_uuids(self.module, self.VMS, {"vm-1": "uuid-1"})
+        os.chmod(self.cache_dir, 0o777)
+        self.assertIsNone(self.get_from_disk(self.VMS, "vm-1"))
+        cache_uuids(self.module, self.VMS, {"vm-2": "uuid-2"})
+        os.chmod(self.cache_dir, 0o700)
+        self.assertIsNone(self.get_from_disk(self.VMS, "vm-2"))
+
+        cache_file = os.path.join(self.cache_dir, os.listdir(self.cache_dir)[0])
+        os.chmod(cache_file, 0o666)
+        self.assertIsNone(self.get_from_disk(self.VMS, "vm-1"))
+
+    def test_groups_lookups(self):
+        cache_uuids(self.module, self.GROUPS_VMS, {"vm-1": "uuid-1"})
+        cache_uuids(self.module, self.CONTAINERS, {"default": "uuid-2"})
+        self.assertEqual(
+            get_cached_uuid(self.module, self.CONTAINERS, "default"), "uuid-2"
+        )
+
+        # nothing drops storage containers from disk, so they are never written
+        self.assertIsNone(self.get_from_disk(self.CONTAINERS, "default"))
+        self.assertEqual(self.get_from_disk(self.GROUPS_VMS, "vm-1"), "uuid-1")
+
+        # changes of vms make their groups lookups stale
+        invalidate_uuids(self.module, self.VMS)
+        self.assertIsNone(get_cached_uuid(self.module, self.GROUPS_VMS, "vm-1"))
+        self.assertIsNone(self.get_from_disk(self.GROUPS_VMS, "vm-1"))
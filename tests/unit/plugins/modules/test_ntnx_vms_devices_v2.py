@@ -0,0 +1,175 @@
+from __future__ import absolute_import, division, print_function
+
+from functools import partial
+
+from ansible_collections.nutanix.ncp.plugins.module_utils.v4.prism.tasks import (
+    TASK_TIMEOUT_ERROR,
+)
+from ansible_collections.nutanix.ncp.plugins.module_utils.v4.vmm import helpers
+from ansible_collections.nutanix.ncp.plugins.module_utils.v4.vmm.helpers import (
+    run_vm_operations,
+)
+from ansible_collections.nutanix.ncp.plugins.modules import (
+    ntnx_vms_clone_v2,
+    ntnx_vms_disks_v2,
+    ntnx_vms_nics_v2,
+)
+from ansible_collections.nutanix.ncp.tests.unit.compat import unittest
+from ansible_collections.nutanix.ncp.tests.unit.compat.mock import patch
+
+__metaclass__ = type
+
+try:
+    import ntnx_vmm_py_client as vmm_sdk
+
+    HAS_VMM_SDK = True
+except ImportError:
+    HAS_VMM_SDK = False
+
+
+class Module:
+    params = {"max_in_flight": 1, "wait": True}
+
+
+class ApiException(Exception):
+    def __init__(self, status):
+        super(ApiException, self).__init__(status)
+        self.status = status
+        self.body = "precondition failed"
+
+
+class Response:
+    def __init__(self, data):
+        self.data = data
+
+
+class FakeVmApi(object):
+    """
+    VmApi which checks If-Match the way the sdk sends it, from ETag of body
+    if it has one, and changes VM etag on every accepted request.
+    """
+
+    def __init__(self):
+        self.etag = 1
+        self.submitted = []
+        self.reads = 0
+
+    def get_vm_by_id(self, extId):
+        self.reads += 1
+        vm = vmm_sdk.AhvConfigVm(ext_id=extId)
+        vm.get_reserved()["ETag"] = self.etag
+        return Response(vm)
+
+    def _submit(self, operation, body=None, if_match=None):
+        if body is not None and "ETag" in body.get_reserved():
+            if_match = body.get_reserved()["ETag"]
+        if if_match != self.etag:
+            raise ApiException(412)
+        self.etag += 1
+        self.submitted.append(operation)
+        task = vmm_sdk.TaskReference(ext_id="task-{0}".format(len(self.submitted)))
+        return Response(task)
+
+    def create_disk(self, vmExtId, body, if_match):
+        return self._submit("create", body, if_match)
+
+    def update_disk_by_id(self, vmExtId, extId, body, if_match=None):
+        return self._submit("update", body, if_match)
+
+    create_nic = create_disk
+    update_nic_by_id = update_disk_by_id
+
+    def clone_vm(self, extId, body, if_match):
+        resp = self._submit("clone", body, if_match)
+        # clones leave etag of source VM unchanged
+        self.etag -= 1
+        return resp
+
+
+def wait_for_tasks(module, ext_ids, **kwargs):
+    for ext_id in ext_ids:
+        yield ext_id, None, None
+
+
+def get_device(cls, etag):
+    # device read before any change, with etag of VM at that time
+    device = cls(ext_id="device-1")
+    device.get_reserved()["ETag"] = etag
+    return device
+
+
+@unittest.skipUnless(HAS_VMM_SDK, "ntnx_vmm_py_client is required")
+@patch(
+    "ansible_collections.nutanix.ncp.plugins.module_utils.v4.vmm.helpers.wait_for_tasks",
+    wait_for_tasks,
+)
+class TestVmDeviceOperations(unittest.TestCase):
+    def run_operations(self, cls, create, update):
+        vmm = FakeVmApi()
+        operations = [
+            ({}, partial(create, vmm, "vm-1", cls())),
+            ({}, partial(update, vmm, "vm-1", get_device(cls, vmm.etag))),
+        ]
+        run_vm_operations(Module(), vmm, "vm-1", operations, etag=vmm.etag)
+        return vmm, [outcome for outcome, _ in operations]
+
+    def test_disk_update_after_create(self):
+        vmm, outcomes = self.run_operations(
+            vmm_sdk.AhvConfigDisk,
+            ntnx_vms_disks_v2.create_vm_disk,
+            ntnx_vms_disks_v2.update_vm_disk,
+        )
+        self.assertEqual(vmm.submitted, ["create", "update"])
+        self.assertEqual([o["status"] for o in outcomes], ["succeeded"] * 2)
+
+    def test_nic_update_after_create(self):
+        vmm, outcomes = self.run_operations(
+            vmm_sdk.AhvConfigNic,
+            ntnx_vms_nics_v2.create_vm_nic,
+            ntnx_vms_nics_v2.update_vm_nic,
+        )
+        self.assertEqual(vmm.submitted, ["create", "update"])
+        self.assertEqual([o["status"] for o in outcomes], ["succeeded"] * 2)
+
+    def test_clones_reuse_source_vm_etag(self):
+        vmm = FakeVmApi()
+        operations = [
+            ({}, partial(ntnx_vms_clone_v2.clone_vm_copy, vmm, "vm-1", None))
+            for _ in range(5)
+        ]
+        run_vm_operations(
+            Module(), vmm, "vm-1", operations, etag=vmm.etag, changes_etag=False
+        )
+        self.assertEqual(vmm.submitted, ["clone"] * 5)
+        self.assertEqual(vmm.reads, 0)
+
+    def test_batch_shares_one_deadline(self):
+        clock = [0]
+        timeouts = []
+
+        def wait(module, ext_ids, timeout=None, **kwargs):
+            # every wait takes 40 seconds
+            timeouts.append(timeout)
+            clock[0] += 40
+            return wait_for_tasks(module, ext_ids)
+
+        vmm = FakeVmApi()
+        operations = [
+            ({}, partial(ntnx_vms_clone_v2.clone_vm_copy, vmm, "vm-1", None))
+            for _ in range(4)
+        ]
+        module = Module()
+        module.params = dict(module.params, timeout=100)
+        with patch.object(helpers, "wait_for_tasks", wait), patch.object(
+            helpers.time, "time", lambda: clock[0]
+        ):
+            run_vm_operations(
+                module, vmm, "vm-1", operations, etag=vmm.etag, changes_etag=False
+            )
+        self.assertEqual(timeouts, [100, 60, 20])
+        self.assertEqual(vmm.submitted, ["clone"] * 3)
+        outcomes = [outcome for outcome, _ in operations]
+        self.assertEqual(
+            [o["status"] for o in outcomes], ["succeeded"] * 3 + ["failed"]
+        )
+        self.assertEqual(outcomes[3]["error"], TASK_TIMEOUT_ERROR)